@@ -10,6 +10,7 @@ import warnings
 import logging
 import importlib.util
 import subprocess
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -97,9 +98,11 @@ class BaseAgent(ABC):
         # Execution mode: "manual" (CLI) or "automated" (watch mode)
         self.execution_mode = "manual"
         
-        # Lazy load status manager and validator
+        # Lazy load status manager and validator (executors share agent
+        # instances across worker threads, so creation is locked)
         self._status_manager = None
         self._workflow_validator = None
+        self._lazy_lock = threading.Lock()
     
     def _register_with_registry(self) -> None:
         """Register this agent instance with the global registry (A2A-aligned)"""
@@ -164,16 +167,20 @@ class BaseAgent(ABC):
     def status_manager(self):
         """Get status manager instance"""
         if self._status_manager is None:
-            from ai_squad.core.status import StatusManager
-            self._status_manager = StatusManager(self.github)
+            with self._lazy_lock:
+                if self._status_manager is None:
+                    from ai_squad.core.status import StatusManager
+                    self._status_manager = StatusManager(self.github)
         return self._status_manager
     
     @property
     def workflow_validator(self):
         """Get workflow validator instance"""
         if self._workflow_validator is None:
-            from ai_squad.core.status import WorkflowValidator
-            self._workflow_validator = WorkflowValidator(self.config, self.github)
+            with self._lazy_lock:
+                if self._workflow_validator is None:
+                    from ai_squad.core.status import WorkflowValidator
+                    self._workflow_validator = WorkflowValidator(self.config, self.github)
         return self._workflow_validator
     
     @staticmethod
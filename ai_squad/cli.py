@@ -3,28 +3,221 @@ AI-Squad CLI
 
 Main command-line interface for AI-Squad.
 """
+import atexit
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.table import Table
-from rich import box
 from pathlib import Path
+import functools
+import importlib
 import sys
 
-from ai_squad.__version__ import __version__
-from ai_squad.core.init_project import initialize_project
-from ai_squad.core.agent_executor import AgentExecutor
-from ai_squad.core.doctor import run_doctor_checks
-from ai_squad.core.collaboration import run_collaboration, CollaborationMode
-import yaml
-import os
 
-console = Console()
+class _LazyConsole:
+    """
+    Stand-in for the shared Rich console that builds it on first use
+    
+    Importing Rich costs about as much as the rest of the CLI module, and
+    ``squad --help`` and shell completion never print through Rich.
+    """
+    
+    def __init__(self):
+        self._console = None
+    
+    def __getattr__(self, name):
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console()
+        return getattr(self._console, name)
 
 
-def print_banner():
-    """Print enhanced AI-Squad banner with agents"""
+console = _LazyConsole()
+
+# Conversations with more panels than this are shown through the pager
+CLARIFY_PAGER_THRESHOLD = 20
+
+# Mission brief files larger than this (bytes) are memory-mapped, not read
+MMAP_BRIEF_THRESHOLD = 64 * 1024
+
+# Listings with more rows than this print as plain tab-separated text
+PLAIN_TABLE_THRESHOLD = 500
+
+# Shared Click choices for agent, status and handoff-reason arguments
+AGENT_TYPES = ("pm", "architect", "engineer", "ux", "reviewer")
+AGENT_CHOICE = click.Choice(AGENT_TYPES)
+AGENT_OR_SYSTEM_CHOICE = click.Choice(AGENT_TYPES + ("system",))
+WORK_STATUS_CHOICE = click.Choice(("ready", "in-progress", "blocked", "done"))
+HANDOFF_REASON_CHOICE = click.Choice(("workflow", "escalation", "specialization", "blocker"))
+
+# Display labels for work item statuses in `squad ops`
+WORK_STATUS_LABELS = {
+    "backlog": "BACKLOG",
+    "ready": "READY",
+    "in_progress": "IN_PROGRESS",
+    "hooked": "HOOKED",
+    "blocked": "BLOCKED",
+    "in_review": "IN_REVIEW",
+    "done": "DONE",
+    "failed": "FAILED",
+}
+
+# Display labels and colors for `squad signal` messages
+SIGNAL_STATUS_LABELS = {
+    "pending": "PENDING",
+    "delivered": "DELIVERED",
+    "read": "READ",
+    "acknowledged": "ACK",
+    "expired": "EXPIRED",
+}
+SIGNAL_PRIORITY_COLORS = {
+    "urgent": "red",
+    "high": "yellow",
+    "normal": "white",
+    "low": "dim",
+}
+
+TASK_STATUS_COLORS = {
+    "completed": "green",
+    "failed": "red",
+}
+
+
+def __getattr__(name):
+    """Resolve ``__version__`` lazily so --help never imports version metadata"""
+    if name == "__version__":
+        from ai_squad.__version__ import __version__ as version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=1)
+def _status_prefixes():
+    """Build the FAIL/OK prefixes once, on first use, so Rich stays lazy"""
+    from rich.text import Text
+    return Text("FAIL Error: ", style="bold red"), Text("OK ", style="bold green")
+
+
+def _print_fail(message):
+    """Print ``FAIL Error: <message>``; the message is never parsed as markup"""
+    from rich.text import Text
+    console.print(_status_prefixes()[0] + Text(str(message), style="bold red"))
+
+
+def _print_ok(message, detail=""):
+    """Print ``OK <message>`` plus an unstyled detail; neither is parsed as markup"""
+    from rich.text import Text
+    text = _status_prefixes()[1] + Text(message, style="bold green")
+    if detail:
+        text.append(detail)
+    console.print(text)
+
+
+class CommandError(click.ClickException):
+    """Expected command failure, rendered by Click in the CLI's FAIL style"""
+    
+    def show(self, file=None):
+        _print_fail(self.format_message())
+
+
+_MODULES = {}
+
+
+def _imp(path):
+    """Import a module on first use and memoize it for later lookups"""
+    module = _MODULES.get(path)
+    if module is None:
+        module = _MODULES[path] = importlib.import_module(path)
+    return module
+
+
+def cli_error_handler(func):
+    """
+    Turn expected command failures into Click exceptions
+    
+    ClickExceptions raised by the command propagate untouched; runtime,
+    OS and value errors become CommandError. Click then prints the message
+    and exits with status 1.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except (RuntimeError, OSError, ValueError) as e:
+            raise CommandError(str(e)) from e
+    return wrapper
+
+
+def _print_rows(title, columns, rows):
+    """
+    Print prebuilt row tuples as a Rich table, or as plain text when large
+    
+    Above ``PLAIN_TABLE_THRESHOLD`` rows, Rich layout and markup parsing
+    dominate, so the rows are written tab-separated straight to the
+    console's file instead.
+    
+    Args:
+        title: Table title
+        columns: (header, style) pairs
+        rows: Sequence of string tuples, one per row
+    """
+    if len(rows) > PLAIN_TABLE_THRESHOLD:
+        out = console.file
+        out.write("\t".join(header for header, _ in columns) + "\n")
+        out.writelines("\t".join(row) + "\n" for row in rows)
+        out.flush()
+        return
+    
+    from rich.table import Table
+    table = Table(title=title)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
+
+
+def _check_gh_auth_cached(ttl: int = 300) -> int:
+    """
+    Return the ``gh auth status`` exit code, reusing a recent success
+    
+    Only successful checks are cached, so a pending ``gh auth login`` is
+    picked up on the next invocation.
+    
+    Args:
+        ttl: Seconds a cached success stays valid
+        
+    Returns:
+        Exit code of ``gh auth status`` (0 when authenticated)
+        
+    Raises:
+        subprocess.TimeoutExpired: If gh does not answer in time
+        FileNotFoundError: If the gh CLI is not installed
+    """
+    import shutil
+    import subprocess
+    from ai_squad.core.ttl_cache import ttl_get
+    
+    def check() -> int:
+        # Detect a missing gh without paying for a failed fork/exec
+        gh_path = shutil.which("gh")
+        if gh_path is None:
+            raise FileNotFoundError("GitHub CLI (gh) not found on PATH")
+        return subprocess.run(
+            [gh_path, "auth", "status"],
+            capture_output=True,
+            text=True,
+            timeout=3,
+            check=False
+        ).returncode
+    
+    return ttl_get("gh_auth", ttl, check, cache_if=lambda code: code == 0)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_banner():
+    """Build the banner logo and panel once; nothing in them varies per process"""
+    from rich.panel import Panel
+    from rich.text import Text
+    from ai_squad.__version__ import __version__
+    
     # Main ASCII logo
     banner = Text()
     banner.append(r"""
@@ -34,40 +227,39 @@ def print_banner():
 /_/ |_/___/     /___/_/\_, /_/\_,_/\_,_/\_,_/  
                       /___/                     
 """, style="cyan bold")
-    console.print(banner)
     
     # Tagline and version in panel
-    console.print(
-        Panel(
-            "[bold cyan]Five expert AI agents orchestrated by a Captain[/bold cyan]\n"
-            "[dim italic]Squad Assembled • Mission Ready • Awaiting Orders[/dim italic]\n\n"
-            "[bold]Product Manager[/bold] • [bold]Architect[/bold] • "
-            "[bold]Engineer[/bold] • [bold]UX Designer[/bold] • "
-            "[bold]Reviewer[/bold]\n\n"
-            "[yellow]🎖️ NEW: Squad Mission Mode - True Autonomous Development![/yellow]\n"
-            "[dim]Provide requirements -> Captain orchestrates multi-agent collaboration[/dim]\n\n"
-            f"[dim]Version {__version__}[/dim]",
-            style="cyan",
-            border_style="bright_cyan"
-        )
+    panel = Panel(
+        "[bold cyan]Five expert AI agents orchestrated by a Captain[/bold cyan]\n"
+        "[dim italic]Squad Assembled • Mission Ready • Awaiting Orders[/dim italic]\n\n"
+        "[bold]Product Manager[/bold] • [bold]Architect[/bold] • "
+        "[bold]Engineer[/bold] • [bold]UX Designer[/bold] • "
+        "[bold]Reviewer[/bold]\n\n"
+        "[yellow]🎖️ NEW: Squad Mission Mode - True Autonomous Development![/yellow]\n"
+        "[dim]Provide requirements -> Captain orchestrates multi-agent collaboration[/dim]\n\n"
+        f"[dim]Version {__version__}[/dim]",
+        style="cyan",
+        border_style="bright_cyan"
     )
+    return banner, panel
+
+
+def print_banner():
+    """Print enhanced AI-Squad banner with agents"""
+    banner, panel = _build_banner()
+    console.print(banner)
+    console.print(panel)
     console.print()
 
 
 def _interactive_setup():
     """Interactive setup for GitHub OAuth authentication"""
+    from ai_squad.core.config import read_project_header
     import subprocess
     
     # Check OAuth authentication
     try:
-        result = subprocess.run(
-            ["gh", "auth", "status"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            check=False
-        )
-        if result.returncode == 0:
+        if _check_gh_auth_cached() == 0:
             console.print("[green][OK] GitHub CLI is authenticated via OAuth[/green]")
             console.print("[dim]  AI-Squad is ready to use full AI capabilities[/dim]")
             return
@@ -91,11 +283,9 @@ def _interactive_setup():
     # Check repo configuration
     config_file = Path("squad.yaml")
     if config_file.exists():
-        with open(config_file, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-        
-        repo = config.get("project", {}).get("github_repo")
-        owner = config.get("project", {}).get("github_owner")
+        header = read_project_header(config_file)
+        repo = header.get("github_repo")
+        owner = header.get("github_owner")
         
         if repo and owner:
             console.print(f"\n[green][OK] GitHub repo configured: {owner}/{repo}[/green]")
@@ -107,184 +297,185 @@ def _interactive_setup():
     console.print("\n[dim]Run [cyan]squad doctor[/cyan] to verify your setup[/dim]")
 
 
-@click.group(invoke_without_command=True)
-@click.option("--version", is_flag=True, help="Show version and exit")
-@click.pass_context
-def main(ctx, version):
+@click.command()
+@cli_error_handler
+@click.option("--force", is_flag=True, help="Overwrite existing files")
+@click.option("--skip-setup", is_flag=True, help="Skip interactive token/repo setup")
+def deploy(force, skip_setup):
+    """Deploy AI-Squad to your project"""
+    from ai_squad.core.init_project import initialize_project
+    print_banner()
+    
+    console.print("[bold cyan]Deploying AI-Squad...[/bold cyan]\n")
+    
+    result = initialize_project(force=force)
+    
+    if result["success"]:
+        console.print("[bold green]OK AI-Squad deployed successfully![/bold green]\n")
+        
+        console.print("[bold]Created:[/bold]")
+        for item in result["created"]:
+            console.print(f"  OK {item}")
+        
+        # Interactive setup for token and repo
+        if not skip_setup:
+            console.print("\n[bold cyan]Let's configure your GitHub setup...[/bold cyan]\n")
+            _interactive_setup()
+        
+        console.print("\n[bold]Next steps:[/bold]")
+        console.print("  1. Deploy an agent: [cyan]squad pm 123[/cyan]")
+        console.print("  2. Or get situation report: [cyan]squad sitrep[/cyan]")
+        console.print("  3. View dashboard: [cyan]squad dashboard[/cyan]")
+    else:
+        console.print(f"[bold red]FAIL Deployment failed: {result['error']}[/bold red]")
+        sys.exit(1)
+
+
+@functools.lru_cache(maxsize=1)
+def _executor_for(workspace: str):
+    """Build the AgentExecutor for a workspace (cached; see _get_executor)"""
+    from ai_squad.core.agent_executor import AgentExecutor
+    executor = AgentExecutor()
+    atexit.register(executor.close)
+    return executor
+
+
+def _get_executor():
     """
-    AI-Squad - Your AI Development Squad
+    Return the process-wide AgentExecutor for the current directory
     
-    Five expert AI agents to accelerate your development:
+    Reusing one executor keeps its config, SDK client and HTTP connection
+    pools alive across agent runs in the same process (e.g. patrol mode).
+    """
+    return _executor_for(str(Path.cwd()))
+
+
+class _Managers:
+    """
+    State managers for one workspace, each built on first access
     
-    • Product Manager - Creates PRDs and user stories
+    Commands share these instances so state files are loaded once per
+    process rather than once per command.
+    """
     
-    • Architect - Designs solutions and writes ADRs
+    def __init__(self, workspace: Path):
+        self.workspace = workspace
     
-    • Engineer - Implements features with tests
+    @functools.cached_property
+    def work(self):
+        return _imp("ai_squad.core.workstate").WorkStateManager(workspace_root=self.workspace)
     
-    • UX Designer - Creates wireframes and flows
+    @functools.cached_property
+    def signal(self):
+        return _imp("ai_squad.core.signal").SignalManager(workspace_root=self.workspace)
     
-    • Reviewer - Reviews code and checks quality
-    """
-    if version:
-        console.print(f"AI-Squad version {__version__}")
-        sys.exit(0)
+    @functools.cached_property
+    def convoy(self):
+        return _imp("ai_squad.core.convoy").ConvoyManager(self.work)
     
-    if ctx.invoked_subcommand is None:
-        print_banner()
-        console.print("[yellow]Run 'squad --help' for usage information[/yellow]\n")
+    @functools.cached_property
+    def delegation(self):
+        return _imp("ai_squad.core.delegation").DelegationManager(
+            workspace_root=self.workspace, signal_manager=self.signal
+        )
+    
+    @functools.cached_property
+    def handoff(self):
+        return _imp("ai_squad.core.handoff").HandoffManager(self.work, self.signal, self.delegation)
+    
+    @functools.cached_property
+    def plans(self):
+        return _imp("ai_squad.core.battle_plan").BattlePlanManager(workspace_root=self.workspace)
 
 
-@main.command()
-@click.option("--force", is_flag=True, help="Overwrite existing files")
-@click.option("--skip-setup", is_flag=True, help="Skip interactive token/repo setup")
-def deploy(force, skip_setup):
-    """Deploy AI-Squad to your project"""
-    print_banner()
+@functools.lru_cache(maxsize=1)
+def _managers_for(workspace: str) -> _Managers:
+    """Cached manager set for a workspace (see _managers)"""
+    return _Managers(Path(workspace))
+
+
+def _managers() -> _Managers:
+    """Return the shared state managers for the current directory"""
+    return _managers_for(str(Path.cwd()))
+
+
+def _run_agent(agent_name: str, label: str, number: int, done: str,
+               success_key: str = "file_path", target: str = "issue"):
+    """
+    Deploy a single agent and report its result
+    
+    Args:
+        agent_name: Agent type passed to AgentExecutor.execute
+        label: Human-readable agent name
+        number: Issue or PR number
+        done: Success message prefix
+        success_key: Result key to report ("files" prints each file)
+        target: What the number refers to ("issue" or "PR")
+    """
+    console.print(f"[bold cyan]Deploying {label} for {target} #{number}...[/bold cyan]\n")
     
-    console.print("[bold cyan]Deploying AI-Squad...[/bold cyan]\n")
+    result = _get_executor().execute(agent_name, number)
     
-    try:
-        result = initialize_project(force=force)
-        
-        if result["success"]:
-            console.print("[bold green]OK AI-Squad deployed successfully![/bold green]\n")
-            
-            console.print("[bold]Created:[/bold]")
-            for item in result["created"]:
-                console.print(f"  OK {item}")
-            
-            # Interactive setup for token and repo
-            if not skip_setup:
-                console.print("\n[bold cyan]Let's configure your GitHub setup...[/bold cyan]\n")
-                _interactive_setup()
-            
-            console.print("\n[bold]Next steps:[/bold]")
-            console.print("  1. Deploy an agent: [cyan]squad pm 123[/cyan]")
-            console.print("  2. Or get situation report: [cyan]squad sitrep[/cyan]")
-            console.print("  3. View dashboard: [cyan]squad dashboard[/cyan]")
-        else:
-            console.print(f"[bold red]FAIL Deployment failed: {result['error']}[/bold red]")
-            sys.exit(1)
-            
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
+    if not result["success"]:
+        console.print(f"[bold red]FAIL: {result['error']}[/bold red]")
         sys.exit(1)
+    
+    if success_key == "files":
+        _print_ok(done)
+        for file in result.get("files", []):
+            console.print(f"  - {file}")
+    else:
+        _print_ok(f"{done}: {result[success_key]}")
 
 
-@main.command()
+@click.command()
+@cli_error_handler
 @click.argument("issue_number", type=int)
 def pm(issue_number):
     """Deploy Product Manager agent (creates PRD)"""
-    console.print(f"[bold cyan]Deploying Product Manager for issue #{issue_number}...[/bold cyan]\n")
-    
-    try:
-        executor = AgentExecutor()
-        result = executor.execute("pm", issue_number)
-        
-        if result["success"]:
-            console.print(f"[bold green]OK PRD created: {result['file_path']}[/bold green]")
-        else:
-            console.print(f"[bold red]FAIL: {result['error']}[/bold red]")
-            sys.exit(1)
-            
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    _run_agent("pm", "Product Manager", issue_number, "PRD created")
 
 
-@main.command()
+@click.command()
+@cli_error_handler
 @click.argument("issue_number", type=int)
 def architect(issue_number):
     """Deploy Architect agent (creates ADR/Spec)"""
-    console.print(f"[bold cyan]Deploying Architect for issue #{issue_number}...[/bold cyan]\n")
-    
-    try:
-        executor = AgentExecutor()
-        result = executor.execute("architect", issue_number)
-        
-        if result["success"]:
-            console.print(f"[bold green]OK ADR created: {result['file_path']}[/bold green]")
-        else:
-            console.print(f"[bold red]FAIL: {result['error']}[/bold red]")
-            sys.exit(1)
-            
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    _run_agent("architect", "Architect", issue_number, "ADR created")
 
 
-@main.command()
+@click.command()
+@cli_error_handler
 @click.argument("issue_number", type=int)
 def engineer(issue_number):
     """Deploy Engineer agent (implements feature)"""
-    console.print(f"[bold cyan]Deploying Engineer for issue #{issue_number}...[/bold cyan]\n")
-    
-    try:
-        executor = AgentExecutor()
-        result = executor.execute("engineer", issue_number)
-        
-        if result["success"]:
-            console.print("[bold green]OK Implementation complete[/bold green]")
-            for file in result.get("files", []):
-                console.print(f"  - {file}")
-        else:
-            console.print(f"[bold red]FAIL: {result['error']}[/bold red]")
-            sys.exit(1)
-            
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    _run_agent("engineer", "Engineer", issue_number, "Implementation complete", success_key="files")
 
 
-@main.command()
+@click.command()
+@cli_error_handler
 @click.argument("issue_number", type=int)
 def ux(issue_number):
     """Deploy UX Designer agent (creates wireframes)"""
-    console.print(f"[bold cyan]Deploying UX Designer for issue #{issue_number}...[/bold cyan]\n")
-    
-    try:
-        executor = AgentExecutor()
-        result = executor.execute("ux", issue_number)
-        
-        if result["success"]:
-            console.print(f"[bold green]OK UX design created: {result['file_path']}[/bold green]")
-        else:
-            console.print(f"[bold red]FAIL: {result['error']}[/bold red]")
-            sys.exit(1)
-            
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    _run_agent("ux", "UX Designer", issue_number, "UX design created")
 
 
-@main.command()
+@click.command()
+@cli_error_handler
 @click.argument("pr_number", type=int)
 def review(pr_number):
     """Deploy Reviewer agent (reviews PR)"""
-    console.print(f"[bold cyan]Deploying Reviewer for PR #{pr_number}...[/bold cyan]\n")
-    
-    try:
-        executor = AgentExecutor()
-        result = executor.execute("reviewer", pr_number)
-        
-        if result["success"]:
-            console.print(f"[bold green]OK Review completed: {result['file_path']}[/bold green]")
-        else:
-            console.print(f"[bold red]FAIL: {result['error']}[/bold red]")
-            sys.exit(1)
-            
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    _run_agent("reviewer", "Reviewer", pr_number, "Review completed", target="PR")
 
 
-@main.command(name="joint-op")
+@click.command(name="joint-op")
+@cli_error_handler
 @click.argument("issue_number", type=int)
 @click.argument("agents", nargs=-1, required=True)
 @click.option("--sequential", "-s", is_flag=True, help="Use sequential mode (no dialogue, 2+ agents)")
 @click.option("--max-iterations", "-m", default=None, type=int, help="Max iteration rounds (default: from config or 3)")
-def joint_op(issue_number, agents, sequential, max_iterations):
+@click.option("--parallel/--serial", default=True, help="In sequential mode, run independent agents (e.g. architect, ux) concurrently")
+def joint_op(issue_number, agents, sequential, max_iterations, parallel):
     """Multi-agent joint operation
     
     Iterative Mode (default - 2 agents):
@@ -294,7 +485,10 @@ def joint_op(issue_number, agents, sequential, max_iterations):
     Sequential Mode (--sequential - 2+ agents):
       Agents execute in dependency order without interaction
       Example: squad joint-op 123 pm architect engineer --sequential
+      Independent agents run concurrently unless --serial is given
     """
+    import asyncio
+    from ai_squad.core.collaboration import arun_collaboration, CollaborationMode
     mode = CollaborationMode.SEQUENTIAL if sequential else CollaborationMode.ITERATIVE
     
     if not sequential and len(agents) != 2:
@@ -309,32 +503,29 @@ def joint_op(issue_number, agents, sequential, max_iterations):
         f"[cyan]Participants: {', '.join(agents)}[/cyan]\n"
     )
     
-    try:
-        result = run_collaboration(issue_number, list(agents), mode=mode, max_iterations=max_iterations)
+    result = asyncio.run(arun_collaboration(
+        issue_number, list(agents), mode=mode, max_iterations=max_iterations, parallel=parallel
+    ))
+    
+    if result["success"]:
+        console.print(f"[bold green][OK] Joint Operation complete![/bold green]")
+        console.print(f"[dim]Mode: {result.get('mode', 'sequential')}[/dim]")
         
-        if result["success"]:
-            console.print(f"[bold green][OK] Joint Operation complete![/bold green]")
-            console.print(f"[dim]Mode: {result.get('mode', 'sequential')}[/dim]")
-            
-            if mode == CollaborationMode.ITERATIVE:
-                console.print(f"[dim]Iterations: {result.get('iterations', 0)}[/dim]")
-                console.print(f"[dim]Approved: {result.get('approved', False)}[/dim]")
-                console.print(f"[dim]Thread: {result.get('thread_id', 'N/A')}[/dim]")
-            
-            console.print("\n[bold]Output Files:[/bold]")
-            for file in result.get("files", []):
-                console.print(f"  - {file}")
-        else:
-            console.print(f"[bold red][FAIL] {result['error']}[/bold red]")
-            sys.exit(1)
-            
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red][FAIL] Error: {e}[/bold red]")
+        if mode == CollaborationMode.ITERATIVE:
+            console.print(f"[dim]Iterations: {result.get('iterations', 0)}[/dim]")
+            console.print(f"[dim]Approved: {result.get('approved', False)}[/dim]")
+            console.print(f"[dim]Thread: {result.get('thread_id', 'N/A')}[/dim]")
+        
+        console.print("\n[bold]Output Files:[/bold]")
+        for file in result.get("files", []):
+            console.print(f"  - {file}")
+    else:
+        console.print(f"[bold red][FAIL] {result['error']}[/bold red]")
         sys.exit(1)
 
 
-@main.command()
-@click.argument("agent_type", type=click.Choice(["pm", "architect", "engineer", "ux", "reviewer"]))
+@click.command()
+@click.argument("agent_type", type=AGENT_CHOICE)
 def chat(agent_type):
     """Interactive chat with an agent
     
@@ -346,38 +537,36 @@ def chat(agent_type):
     console.print("[yellow]Interactive chat coming soon![/yellow]")
 
 
-@main.command()
+@click.command()
+@cli_error_handler
 def sitrep():
     """Generate situation report - validate AI-Squad setup"""
+    from ai_squad.core.doctor import run_doctor_checks
     print_banner()
     
     console.print("[bold cyan]Generating Situation Report...[/bold cyan]\n")
     
-    try:
-        result = run_doctor_checks()
-        
-        console.print("[bold]Check Results:[/bold]")
-        for check in result["checks"]:
-            check_status = "OK" if check["passed"] else "FAIL"
-            console.print(f"  {check_status} {check['name']}: {check['message']}")
-        
-        console.print()
-        
-        if result["all_passed"]:
-            console.print("[bold green]OK All checks passed! AI-Squad is ready to use.[/bold green]")
-        else:
-            console.print("[bold yellow]WARN Some checks failed. See messages above.[/bold yellow]")
-            sys.exit(1)
-            
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
+    result = run_doctor_checks()
+    
+    console.print("[bold]Check Results:[/bold]")
+    for check in result["checks"]:
+        check_status = "OK" if check["passed"] else "FAIL"
+        console.print(f"  {check_status} {check['name']}: {check['message']}")
+    
+    console.print()
+    
+    if result["all_passed"]:
+        console.print("[bold green]OK All checks passed! AI-Squad is ready to use.[/bold green]")
+    else:
+        console.print("[bold yellow]WARN Some checks failed. See messages above.[/bold yellow]")
         sys.exit(1)
 
 
-@main.command()
+@click.command()
+@cli_error_handler
 @click.option("--interval", default=30, type=int, help="Polling interval in seconds (default: 30)")
 @click.option("--repo", help="GitHub repo (owner/repo) - overrides squad.yaml")
-def patrol(interval, repo):
+def watch_patrol(interval, repo):
     """
     Patrol GitHub for label changes and auto-engage agents
     
@@ -392,17 +581,14 @@ def patrol(interval, repo):
     
     Example:
     
-        squad patrol
+        squad watch
         
-        squad patrol --interval 60 --repo jnPiyush/MyProject
+        squad watch --interval 60 --repo jnPiyush/MyProject
     """
     print_banner()
     
     from ai_squad.core.config import Config
-    from ai_squad.core.watch import WatchDaemon, WatchConfig
-    
-    # Validate interval
-    interval = WatchConfig.validate_interval(interval)
+    from ai_squad.core.watch import WatchDaemon, ValidatedWatchConfig, WatchConfigError
     
     # Load config
     try:
@@ -412,17 +598,18 @@ def patrol(interval, repo):
         console.print("[yellow]TIP Run 'squad init' first[/yellow]")
         sys.exit(1)
     
+    # Resolve repo/interval once; the daemon reuses this config
+    try:
+        validated = ValidatedWatchConfig.from_config(config, repo=repo, interval=interval)
+    except WatchConfigError:
+        console.print("[bold red]FAIL GitHub repo not configured[/bold red]")
+        console.print("[yellow]TIP Use --repo option or configure in squad.yaml[/yellow]")
+        sys.exit(1)
+    
     # Check GitHub OAuth authentication
     import subprocess
     try:
-        result = subprocess.run(
-            ["gh", "auth", "status"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            check=False
-        )
-        if result.returncode != 0:
+        if _check_gh_auth_cached() != 0:
             console.print("[bold red]FAIL GitHub authentication required[/bold red]")
             console.print("[yellow]TIP Run: gh auth login[/yellow]")
             sys.exit(1)
@@ -431,33 +618,26 @@ def patrol(interval, repo):
         console.print("[yellow]TIP Install: winget install GitHub.cli[/yellow]")
         sys.exit(1)
     
-    # Check repo
-    if not repo and not config.github_repo:
-        console.print("[bold red]FAIL GitHub repo not configured[/bold red]")
-        console.print("[yellow]TIP Use --repo option or configure in squad.yaml[/yellow]")
-        sys.exit(1)
-    
     console.print("[bold cyan]Starting AI-Squad Watch Mode...[/bold cyan]\n")
     
     try:
-        daemon = WatchDaemon(config, interval=interval, repo=repo)
+        daemon = WatchDaemon.from_validated(validated)
         daemon.run()
     except KeyboardInterrupt:
         console.print("\n[yellow]Watch mode stopped[/yellow]")
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"\n[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
 
 
-@main.command()
+@click.command()
 def update():
     """Update AI-Squad to latest version"""
     console.print("[bold cyan]Updating AI-Squad...[/bold cyan]\n")
     
     import subprocess
     try:
+        # Same interpreter as this CLI; pip output streams straight to the terminal
         subprocess.run(
-            ["pip", "install", "--upgrade", "ai-squad"],
+            [sys.executable, "-m", "pip", "install", "--upgrade",
+             "--disable-pip-version-check", "--no-input", "ai-squad"],
             check=True
         )
         console.print("[bold green]OK AI-Squad updated successfully![/bold green]")
@@ -466,7 +646,8 @@ def update():
         sys.exit(1)
 
 
-@main.command()
+@click.command()
+@cli_error_handler
 @click.argument("issue_number", type=int)
 def clarify(issue_number):
     """
@@ -475,59 +656,93 @@ def clarify(issue_number):
     Example:
         squad clarify 123
     """
+    from rich.console import Group
+    from rich.panel import Panel
     print_banner()
     
     from ai_squad.core.config import Config
     from ai_squad.core.agent_comm import AgentCommunicator
     
-    try:
-        Config.load()
-        communicator = AgentCommunicator()
-        
-        # Get conversation for issue
-        messages = communicator.get_conversation(issue_number)
-        
-        if not messages:
-            console.print(f"[yellow]No clarification requests for issue #{issue_number}[/yellow]")
-            return
-        
-        console.print(f"[bold cyan]Clarifications for Issue #{issue_number}[/bold cyan]\n")
-        
-        for msg in messages:
-            if msg.message_type.value == "question":
-                console.print(Panel(
-                    f"[bold]From:[/bold] {msg.from_agent.title()} Agent\n"
-                    f"[bold]To:[/bold] {msg.to_agent.title()} Agent\n\n"
-                    f"{msg.content}\n\n"
-                    f"[dim]ID: {msg.id}[/dim]",
-                    title=f"Question ({msg.timestamp.strftime('%H:%M:%S')})",
-                    border_style="yellow"
-                ))
-            elif msg.message_type.value == "response":
-                console.print(Panel(
-                    f"[bold]From:[/bold] {msg.from_agent.title()} Agent\n\n"
-                    f"{msg.content}",
-                    title=f"Response ({msg.timestamp.strftime('%H:%M:%S')})",
-                    border_style="green"
-                ))
-        
-        console.print("\n[dim]TIP To respond, use GitHub Copilot Chat in VS Code[/dim]")
-        
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    Config.load()
+    communicator = AgentCommunicator()
+    
+    # Get conversation for issue
+    messages = communicator.get_conversation(issue_number)
+    
+    if not messages:
+        console.print(f"[yellow]No clarification requests for issue #{issue_number}[/yellow]")
+        return
+    
+    console.print(f"[bold cyan]Clarifications for Issue #{issue_number}[/bold cyan]\n")
+    
+    # Collect panels and render once instead of one print per message
+    panels = []
+    for msg in messages:
+        kind = msg.message_type.value
+        when = msg.timestamp.strftime('%H:%M:%S')
+        sender = msg.from_agent.title()
+        if kind == "question":
+            panels.append(Panel(
+                f"[bold]From:[/bold] {sender} Agent\n"
+                f"[bold]To:[/bold] {msg.to_agent.title()} Agent\n\n"
+                f"{msg.content}\n\n"
+                f"[dim]ID: {msg.id}[/dim]",
+                title=f"Question ({when})",
+                border_style="yellow"
+            ))
+        elif kind == "response":
+            panels.append(Panel(
+                f"[bold]From:[/bold] {sender} Agent\n\n"
+                f"{msg.content}",
+                title=f"Response ({when})",
+                border_style="green"
+            ))
+    
+    # Page long conversations on a terminal instead of scrolling them past
+    if console.is_terminal and len(panels) > CLARIFY_PAGER_THRESHOLD:
+        with console.pager(styles=True):
+            console.print(Group(*panels))
+    else:
+        console.print(Group(*panels))
+    
+    console.print("\n[dim]TIP To respond, use GitHub Copilot Chat in VS Code[/dim]")
 
 
 # ============================================================
 # GASTOWN-INSPIRED ORCHESTRATION COMMANDS
 # ============================================================
 
-@main.command()
+def _read_brief(path: str) -> str:
+    """
+    Read a mission brief file as text with universal newlines
+    
+    Files above ``MMAP_BRIEF_THRESHOLD`` are decoded straight from a
+    read-only memory map instead of being copied through read() first.
+    """
+    import mmap
+    import os
+    
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= MMAP_BRIEF_THRESHOLD:
+            return Path(path).read_text(encoding="utf-8")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+@click.command()
+@cli_error_handler
 @click.option("--prompt", "-p", help="Inline mission brief")
 @click.option("--file", "-f", type=click.Path(exists=True), help="Mission brief file path")
 @click.option("--interactive", "-i", is_flag=True, help="Interactive mission briefing")
 @click.option("--plan-only", is_flag=True, help="Only create mission brief, don't deploy to Captain")
-def mission(prompt, file, interactive, plan_only):
+@click.option("--max-parallel", type=click.IntRange(min=1),
+              help="Max agents Captain runs at once (default: collaboration.max_parallel_agents)")
+@click.option("--detach", is_flag=True,
+              help="Queue Captain deployment in a background worker and return immediately")
+def mission(prompt, file, interactive, plan_only, max_parallel, detach):
     """
     SQUAD MISSION MODE - Deploy autonomous development missions
     
@@ -540,29 +755,33 @@ def mission(prompt, file, interactive, plan_only):
     6. Agents execute via handoffs and delegations
     7. Tracks progress and completes the mission
     
-    By default, FULL DEPLOYMENT. Use --plan-only to create brief only.
+    By default, FULL DEPLOYMENT. Use --plan-only to create brief only,
+    or --detach to hand Captain to a background worker
+    (poll with `squad captain-status <task_id>`).
     
     Examples:
         squad mission -p "Create a REST API for user management"
         squad mission -f mission-brief.txt
         squad mission -i
         squad mission -p "Add authentication" --plan-only  # Create brief only
+        squad mission -f mission-brief.txt --max-parallel 2
+        squad mission -p "Add authentication" --detach
     """
-    print_banner()
-    
-    # Validate input
-    input_count = sum([bool(prompt), bool(file), interactive])
-    if input_count == 0:
-        console.print("[bold red]Error: Must provide mission brief via --prompt, --file, or --interactive[/bold red]")
-        console.print("\n[yellow]Examples:[/yellow]")
-        console.print("  squad mission -p \"Create user management API\"")
-        console.print("  squad mission -f mission-brief.txt")
-        console.print("  squad mission -i")
+    # Validate input before any other work
+    input_count = bool(prompt) + bool(file) + bool(interactive)
+    if input_count != 1:
+        if input_count:
+            console.print("[bold red]Error: Use only ONE input method (--prompt, --file, or --interactive)[/bold red]")
+        else:
+            console.print("[bold red]Error: Must provide mission brief via --prompt, --file, or --interactive[/bold red]")
+            console.print("\n[yellow]Examples:[/yellow]")
+            console.print("  squad mission -p \"Create user management API\"")
+            console.print("  squad mission -f mission-brief.txt")
+            console.print("  squad mission -i")
         sys.exit(1)
     
-    if input_count > 1:
-        console.print("[bold red]Error: Use only ONE input method (--prompt, --file, or --interactive)[/bold red]")
-        sys.exit(1)
+    from rich.panel import Panel
+    print_banner()
     
     # Get mission brief
     requirements = None
@@ -570,19 +789,15 @@ def mission(prompt, file, interactive, plan_only):
         requirements = prompt
         console.print(f"[cyan]📋 Mission Brief:[/cyan] {prompt}\n")
     elif file:
-        with open(file, 'r', encoding='utf-8') as f:
-            requirements = f.read()
+        requirements = _read_brief(file)
         console.print(f"[cyan]📋 Mission Brief from:[/cyan] {file}\n")
     elif interactive:
-        console.print("[bold cyan]📋 Interactive Mission Briefing[/bold cyan]")
-        console.print("[dim]Enter your mission requirements (press Ctrl+D or Ctrl+Z when done):[/dim]\n")
-        lines = []
-        try:
-            while True:
-                line = input()
-                lines.append(line)
-        except EOFError:
-            requirements = "\n".join(lines)
+        stdin = click.get_text_stream("stdin")
+        if stdin.isatty():
+            console.print("[bold cyan]📋 Interactive Mission Briefing[/bold cyan]")
+            console.print("[dim]Enter your mission requirements (press Ctrl+D or Ctrl+Z when done):[/dim]\n")
+        # One buffered read to EOF instead of an input() call per line
+        requirements = stdin.read()
         console.print()
     
     if not requirements or not requirements.strip():
@@ -593,13 +808,15 @@ def mission(prompt, file, interactive, plan_only):
     console.print("[dim]📋 Step 1: PM analyzing mission brief...[/dim]")
     
     try:
-        # Import the autonomous orchestration module
-        from ai_squad.core.autonomous import run_autonomous_workflow
+        import asyncio
         
-        result = run_autonomous_workflow(
+        # Import the autonomous orchestration module
+        autonomous = _imp("ai_squad.core.autonomous")
+        result = asyncio.run(autonomous.arun_autonomous_workflow(
             requirements=requirements,
-            plan_only=plan_only
-        )
+            plan_only=plan_only or detach,
+            max_parallel=max_parallel
+        ))
         
         if result["success"]:
             console.print("\n[bold green][OK] Autonomous workflow completed![/bold green]\n")
@@ -614,7 +831,14 @@ def mission(prompt, file, interactive, plan_only):
                 console.print(f"[bold]Mission Objectives:[/bold] {', '.join(obj_numbers)}")
             
             # Show Captain deployment status
-            if not plan_only:
+            if detach and not plan_only:
+                task = _imp("ai_squad.core.tasks").TaskManager().submit_captain(
+                    result["mission_brief"], max_parallel=max_parallel
+                )
+                console.print(f"\n[bold]🎖️ Captain Deployment:[/bold] task {task.task_id} queued")
+                console.print("[dim]Poll progress with:[/dim]")
+                console.print(f"[cyan]  squad captain-status {task.task_id}[/cyan]")
+            elif not plan_only:
                 console.print(f"\n[bold]🎖️ Captain Deployment:[/bold]")
                 deployment = result.get("captain_deployment", {})
                 if deployment.get("success"):
@@ -652,14 +876,33 @@ def mission(prompt, file, interactive, plan_only):
         console.print("  1. Manually create an issue in GitHub")
         console.print("  2. Run: squad captain <issue-number>")
         sys.exit(1)
-    except (RuntimeError, OSError, ValueError) as e:
-        console.print(f"[bold red][FAIL] Error: {e}[/bold red]")
-        sys.exit(1)
 
 
-@main.command()
+def _cached_preflight(issue_number: int, ttl: int = 60) -> dict:
+    """
+    Run Captain preflight checks, reusing a passing result for ``ttl`` seconds
+    
+    Results are keyed by workspace and issue. Failures are never cached, so
+    fixes (``gh auth login``, repo config) take effect immediately.
+    """
+    import hashlib
+    from ai_squad.core.ttl_cache import ttl_get
+    
+    workspace_key = hashlib.sha1(str(Path.cwd()).encode("utf-8")).hexdigest()[:12]
+    return ttl_get(
+        f"preflight-{workspace_key}-{issue_number}",
+        ttl,
+        lambda: _imp("ai_squad.core.preflight").run_preflight_checks(issue_number=issue_number),
+        cache_if=lambda result: bool(result.get("all_passed")),
+    )
+
+
+@click.command()
+@cli_error_handler
 @click.argument("issue_number", type=int)
-def captain(issue_number):
+@click.option("--skip-preflight", is_flag=True,
+              help="Skip GitHub/repo preflight checks (use when you know they pass)")
+def captain(issue_number, skip_preflight):
     """
     Run Captain (Coordinator) agent to orchestrate work on an issue
     
@@ -671,44 +914,73 @@ def captain(issue_number):
     """
     console.print(f"[bold cyan]Captain coordinating issue #{issue_number}...[/bold cyan]\n")
     
-    try:
-        from ai_squad.core.preflight import run_preflight_checks
+    preflight = {"all_passed": True} if skip_preflight else _cached_preflight(issue_number)
+    if not preflight.get("all_passed"):
+        # Table rendering is only needed on the failure path
+        Table = _imp("rich.table").Table
+        box = _imp("rich.box")
+        console.print("[bold red]Preflight checks failed. Fix issues before running Captain.[/bold red]\n")
 
-        preflight = run_preflight_checks(issue_number=issue_number)
-        if not preflight.get("all_passed"):
-            console.print("[bold red]Preflight checks failed. Fix issues before running Captain.[/bold red]\n")
+        table = Table(title="Preflight Checks", box=box.SIMPLE)
+        table.add_column("Check", style="cyan")
+        table.add_column("Status", style="yellow")
+        table.add_column("Message")
 
-            table = Table(title="Preflight Checks", box=box.SIMPLE)
-            table.add_column("Check", style="cyan")
-            table.add_column("Status", style="yellow")
-            table.add_column("Message")
+        for check in preflight.get("checks", []):
+            status_icon = "OK" if check.get("passed") else "FAIL"
+            table.add_row(check.get("name", ""), status_icon, check.get("message", ""))
 
-            for check in preflight.get("checks", []):
-                status_icon = "OK" if check.get("passed") else "FAIL"
-                table.add_row(check.get("name", ""), status_icon, check.get("message", ""))
+        console.print(table)
+        sys.exit(1)
 
-            console.print(table)
-            sys.exit(1)
+    result = _get_executor().execute('captain', issue_number)
+    
+    if result.get('success'):
+        console.print(result.get('output', 'Coordination complete'))
+        console.print("\n[bold green]Captain coordination complete[/bold green]")
+    else:
+        console.print(f"[bold red]Error: {result.get('error')}[/bold red]")
+        sys.exit(1)
 
-        executor = AgentExecutor()
-        result = executor.execute('captain', issue_number)
-        
-        if result.get('success'):
-            console.print(result.get('output', 'Coordination complete'))
-            console.print("\n[bold green]Captain coordination complete[/bold green]")
-        else:
-            console.print(f"[bold red]Error: {result.get('error')}[/bold red]")
-            sys.exit(1)
-        
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]Error: {e}[/bold red]")
+
+@click.command("captain-status")
+@cli_error_handler
+@click.argument("task_id")
+def captain_status(task_id):
+    """
+    Show the state of a background Captain task
+    
+    Example:
+        squad captain-status task-1a2b3c4d
+    """
+    manager = _imp("ai_squad.core.tasks").TaskManager()
+    task = manager.get(task_id)
+    if task is None:
+        console.print(f"[red]Task not found: {task_id}[/red]")
+        sys.exit(1)
+    orphaned = manager.is_orphaned(task)
+    
+    color = TASK_STATUS_COLORS.get(task.status, "yellow")
+    console.print(f"[bold]Task:[/bold] {task.task_id}")
+    console.print(f"[bold]Issue:[/bold] #{task.issue_number}")
+    console.print(f"[bold]Status:[/bold] [{color}]{task.status}[/{color}] (attempts: {task.attempts})")
+    if task.completed_at:
+        console.print(f"[bold]Finished:[/bold] {task.completed_at}")
+    if task.output:
+        console.print(f"\n{task.output}")
+    if task.error:
+        console.print(f"\n[red]Error: {task.error}[/red]")
+    if orphaned:
+        console.print(f"\n[red]Worker process {task.pid} is no longer running; the task did not finish[/red]")
+    if task.status == "failed" or orphaned:
         sys.exit(1)
 
 
-@main.command()
-@click.option("--status", "status_filter", type=click.Choice(["ready", "in-progress", "blocked", "done"]),
+@click.command()
+@cli_error_handler
+@click.option("--status", "status_filter", type=WORK_STATUS_CHOICE,
               help="Filter by status")
-@click.option("--agent", type=click.Choice(["pm", "architect", "engineer", "ux", "reviewer"]),
+@click.option("--agent", type=AGENT_CHOICE,
               help="Filter by assigned agent")
 def ops(status_filter, agent):
     """
@@ -721,71 +993,57 @@ def ops(status_filter, agent):
         squad ops --status ready
         squad ops --agent engineer
     """
-    try:
-        from ai_squad.core.workstate import WorkStateManager, WorkStatus
-        
-        manager = WorkStateManager()
-        
-        # Map CLI status to enum
-        status_filter = None
-        if status_filter:
-            status_map = {
-                "ready": WorkStatus.READY,
-                "in-progress": WorkStatus.IN_PROGRESS,
-                "blocked": WorkStatus.BLOCKED,
-                "done": WorkStatus.DONE,
-            }
-            status_filter = status_map.get(status_filter)
-        
-        items = manager.list_work_items(status=status_filter, agent=agent)
-        
-        if not items:
-            console.print("[yellow]No operations found[/yellow]")
-            return
-        
-        # Create table
-        table = Table(title="Operations")
-        table.add_column("ID", style="cyan")
-        table.add_column("Status", style="yellow")
-        table.add_column("Title")
-        table.add_column("Agent", style="green")
-        table.add_column("Issue")
-        
-        for item in items:
-            status_label = {
-                "backlog": "BACKLOG",
-                "ready": "READY",
-                "in_progress": "IN_PROGRESS",
-                "hooked": "HOOKED",
-                "blocked": "BLOCKED",
-                "in_review": "IN_REVIEW",
-                "done": "DONE",
-                "failed": "FAILED",
-            }.get(item.status.value, "UNKNOWN")
-            
-            table.add_row(
-                item.id,
-                f"{status_label} {item.status.value}",
-                item.title[:40] + "..." if len(item.title) > 40 else item.title,
-                item.agent_assignee or "-",
-                str(item.issue_number) if item.issue_number else "-"
-            )
-        
-        console.print(table)
-        
-        # Show stats
-        stats = manager.get_stats()
-        console.print(f"\n[dim]Total: {stats['total']} | "
-                     f"In Progress: {stats['in_progress']} | "
-                     f"Blocked: {stats['blocked']} | "
-                     f"Completed: {stats['completed']}[/dim]")
-        
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    from rich.table import Table
+    from ai_squad.core.workstate import WorkStatus
+    
+    manager = _managers().work
+    
+    # Map CLI status to enum
+    status_enum = None
+    if status_filter:
+        status_map = {
+            "ready": WorkStatus.READY,
+            "in-progress": WorkStatus.IN_PROGRESS,
+            "blocked": WorkStatus.BLOCKED,
+            "done": WorkStatus.DONE,
+        }
+        status_enum = status_map.get(status_filter)
+    
+    # Create table
+    table = Table(title="Operations")
+    table.add_column("ID", style="cyan")
+    table.add_column("Status", style="yellow")
+    table.add_column("Title", max_width=43, overflow="ellipsis", no_wrap=True)
+    table.add_column("Agent", style="green")
+    table.add_column("Issue")
+    
+    # Rows are added as items stream in; no intermediate list is kept
+    for item in manager.iter_work_items(status=status_enum, agent=agent):
+        status_value = item.status.value
+        table.add_row(
+            item.id,
+            f"{WORK_STATUS_LABELS.get(status_value, 'UNKNOWN')} {status_value}",
+            item.title,
+            item.agent_assignee or "-",
+            str(item.issue_number) if item.issue_number else "-"
+        )
+    
+    if not table.row_count:
+        console.print("[yellow]No operations found[/yellow]")
+        return
+    
+    console.print(table)
+    
+    # Show stats
+    stats = manager.get_stats()
+    console.print(f"\n[dim]Total: {stats['total']} | "
+                 f"In Progress: {stats['in_progress']} | "
+                 f"Blocked: {stats['blocked']} | "
+                 f"Completed: {stats['completed']}[/dim]")
 
 
-@main.command()
+@click.command()
+@cli_error_handler
 @click.option("--label", help="Filter battle plans by label")
 def plans(label):
     """
@@ -798,36 +1056,32 @@ def plans(label):
         squad plans
         squad plans --label bugfix
     """
-    try:
-        from ai_squad.core.battle_plan import BattlePlanManager
-        
-        manager = BattlePlanManager()
-        plan_list = manager.list_strategies(label=label)
-        
-        if not plan_list:
-            console.print("[yellow]No battle plans found[/yellow]")
-            console.print("[dim]TIP Create custom plans in ai_squad/templates/strategies/[/dim]")
-            return
-        
-        console.print("[bold cyan]Available Battle Plans[/bold cyan]\n")
-        
-        for plan in plan_list:
-            console.print(Panel(
-                f"[bold]Description:[/bold] {plan.description}\n"
-                f"[bold]Phases:[/bold] {len(plan.phases)}\n"
-                f"[bold]Labels:[/bold] {', '.join(plan.labels) if plan.labels else 'none'}\n\n"
-                f"[bold]Variables:[/bold] {', '.join(plan.variables.keys()) if plan.variables else 'none'}\n\n"
-                f"[dim]Phases: {' -> '.join(p.name for p in plan.phases)}[/dim]",
-                title=f"Plan: {plan.name}",
-                border_style="cyan"
-            ))
-        
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    from rich.panel import Panel
+    
+    manager = _managers().plans
+    plan_list = manager.list_strategies(label=label)
+    
+    if not plan_list:
+        console.print("[yellow]No battle plans found[/yellow]")
+        console.print("[dim]TIP Create custom plans in ai_squad/templates/strategies/[/dim]")
+        return
+    
+    console.print("[bold cyan]Available Battle Plans[/bold cyan]\n")
+    
+    for plan in plan_list:
+        console.print(Panel(
+            f"[bold]Description:[/bold] {plan.description}\n"
+            f"[bold]Phases:[/bold] {len(plan.phases)}\n"
+            f"[bold]Labels:[/bold] {', '.join(plan.labels) if plan.labels else 'none'}\n\n"
+            f"[bold]Variables:[/bold] {', '.join(plan.variables.keys()) if plan.variables else 'none'}\n\n"
+            f"[dim]Phases: {' -> '.join(p.name for p in plan.phases)}[/dim]",
+            title=f"Plan: {plan.name}",
+            border_style="cyan"
+        ))
 
 
-@main.command()
+@click.command()
+@cli_error_handler
 @click.argument("plan_name")
 @click.argument("issue_number", type=int)
 @click.option("--var", "variables", multiple=True, help="Variable override (key=value)")
@@ -844,38 +1098,31 @@ def run_plan(plan_name, issue_number, variables):
     """
     console.print(f"[bold cyan]Running battle plan '{plan_name}' for issue #{issue_number}...[/bold cyan]\n")
     
-    try:
-        from ai_squad.core.workstate import WorkStateManager
-        from ai_squad.core.battle_plan import BattlePlanManager, BattlePlanExecutor
-        
-        work_manager = WorkStateManager()
-        plan_manager = BattlePlanManager()
-        executor = BattlePlanExecutor(plan_manager, work_manager)
-        
-        variables = _parse_variables(variables)
+    from ai_squad.core.battle_plan import BattlePlanExecutor
+    
+    managers = _managers()
+    executor = BattlePlanExecutor(managers.plans, managers.work)
+    
+    variables = _parse_variables(variables)
 
-        # Start execution
-        execution = executor.start_execution(plan_name, issue_number, variables)
-        
-        if not execution:
-            console.print(f"[bold red]FAIL Battle plan '{plan_name}' not found[/bold red]")
-            console.print("[dim]TIP Run 'squad plans' to see available battle plans[/dim]")
-            sys.exit(1)
-        
-        console.print(f"[green]OK Battle plan execution started: {execution.id}[/green]\n")
-        
-        # Show next steps
-        next_steps = executor.get_next_steps(execution.id)
-        if next_steps:
-            console.print("[bold]Next phases:[/bold]")
-            for step in next_steps:
-                console.print(f"  • [{step.agent}] {step.name}: {step.description}")
-        
-        console.print("\n[dim]TIP Run 'squad work' to see created work items[/dim]")
-        
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
+    # Start execution
+    execution = executor.start_execution(plan_name, issue_number, variables)
+    
+    if not execution:
+        console.print(f"[bold red]FAIL Battle plan '{plan_name}' not found[/bold red]")
+        console.print("[dim]TIP Run 'squad plans' to see available battle plans[/dim]")
         sys.exit(1)
+    
+    console.print(f"[green]OK Battle plan execution started: {execution.id}[/green]\n")
+    
+    # Show next steps
+    next_steps = executor.get_next_steps(execution.id)
+    if next_steps:
+        console.print("[bold]Next phases:[/bold]")
+        for step in next_steps:
+            console.print(f"  • [{step.agent}] {step.name}: {step.description}")
+    
+    console.print("\n[dim]TIP Run 'squad work' to see created work items[/dim]")
 
 
 def _parse_variables(values):
@@ -888,7 +1135,8 @@ def _parse_variables(values):
     return variables
 
 
-@main.command()
+@click.command()
+@cli_error_handler
 @click.option("--convoy-id", help="Convoy ID to show details")
 @click.option("--issue", type=int, help="Filter convoys by issue number")
 def convoys(convoy_id, issue):
@@ -903,57 +1151,51 @@ def convoys(convoy_id, issue):
         squad convoys --convoy-id convoy-abc123
         squad convoys --issue 123
     """
-    try:
-        from ai_squad.core.workstate import WorkStateManager
-        from ai_squad.core.convoy import ConvoyManager
-        
-        work_manager = WorkStateManager()
-        convoy_manager = ConvoyManager(work_manager)
-        
-        if convoy_id:
-            # Show specific convoy
-            summary = convoy_manager.get_convoy_summary(convoy_id)
-            if summary:
-                console.print(summary)
-            else:
-                console.print(f"[yellow]Convoy '{convoy_id}' not found[/yellow]")
-            return
-        
-        # List convoys
-        convoy_list = convoy_manager.list_convoys(issue_number=issue)
-        
-        if not convoy_list:
-            console.print("[yellow]No convoys found[/yellow]")
-            return
-        
-        console.print("[bold cyan]Active Convoys[/bold cyan]\n")
-        
-        table = Table()
-        table.add_column("ID", style="cyan")
-        table.add_column("Name")
-        table.add_column("Status", style="yellow")
-        table.add_column("Members")
-        table.add_column("Progress")
-        
-        for convoy in convoy_list:
-            progress = convoy.get_progress()
-            table.add_row(
-                convoy.id,
-                convoy.name,
-                convoy.status.value,
-                str(progress["total"]),
-                f"{progress['progress_percent']}%"
-            )
-        
-        console.print(table)
-        
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    from rich.table import Table
+    
+    convoy_manager = _managers().convoy
+    
+    if convoy_id:
+        # Show specific convoy
+        summary = convoy_manager.get_convoy_summary(convoy_id)
+        if summary:
+            console.print(summary)
+        else:
+            console.print(f"[yellow]Convoy '{convoy_id}' not found[/yellow]")
+        return
+    
+    # List convoys
+    convoy_list = convoy_manager.list_convoys(issue_number=issue)
+    
+    if not convoy_list:
+        console.print("[yellow]No convoys found[/yellow]")
+        return
+    
+    console.print("[bold cyan]Active Convoys[/bold cyan]\n")
+    
+    table = Table()
+    table.add_column("ID", style="cyan")
+    table.add_column("Name")
+    table.add_column("Status", style="yellow")
+    table.add_column("Members")
+    table.add_column("Progress")
+    
+    for convoy in convoy_list:
+        progress = convoy.get_progress()
+        table.add_row(
+            convoy.id,
+            convoy.name,
+            convoy.status.value,
+            str(progress["total"]),
+            f"{progress['progress_percent']}%"
+        )
+    
+    console.print(table)
 
 
-@main.command()
-@click.argument("agent", type=click.Choice(["pm", "architect", "engineer", "ux", "reviewer", "system"]))
+@click.command()
+@cli_error_handler
+@click.argument("agent", type=AGENT_OR_SYSTEM_CHOICE)
 @click.option("--unread", is_flag=True, help="Show only unread messages")
 def signal(agent, unread):
     """
@@ -965,62 +1207,56 @@ def signal(agent, unread):
         squad signal engineer
         squad signal pm --unread
     """
-    try:
-        from ai_squad.core.signal import SignalManager
-        
-        manager = SignalManager()
-        
-        # Get inbox
-        messages = manager.get_inbox(agent, unread_only=unread)
-        
-        console.print(f"[bold cyan]Signal Messages for {agent.upper()}[/bold cyan]\n")
-        
-        if not messages:
-            console.print("[yellow]No messages[/yellow]")
-            return
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.text import Text
+    
+    manager = _managers().signal
+    
+    # Get inbox
+    messages = manager.get_inbox(agent, unread_only=unread)
+    
+    console.print(f"[bold cyan]Signal Messages for {agent.upper()}[/bold cyan]\n")
+    
+    if not messages:
+        console.print("[yellow]No messages[/yellow]")
+        return
+    
+    panels = []
+    for msg in messages:
+        status_label = SIGNAL_STATUS_LABELS.get(msg.status.value, "MESSAGE")
+        priority_color = SIGNAL_PRIORITY_COLORS.get(msg.priority.value, "white")
         
-        for msg in messages:
-            status_label = {
-                "pending": "PENDING",
-                "delivered": "DELIVERED",
-                "read": "READ",
-                "acknowledged": "ACK",
-                "expired": "EXPIRED",
-            }.get(msg.status.value, "MESSAGE")
-            
-            priority_color = {
-                "urgent": "red",
-                "high": "yellow",
-                "normal": "white",
-                "low": "dim",
-            }.get(msg.priority.value, "white")
-            
-            console.print(Panel(
+        body = Text(msg.body, end="\n\n")
+        body.truncate(200, overflow="ellipsis")
+        panels.append(Panel(
+            Group(
                 f"[bold]From:[/bold] {msg.sender}\n"
-                f"[bold]Priority:[/bold] [{priority_color}]{msg.priority.value}[/{priority_color}]\n\n"
-                f"{msg.body[:200]}{'...' if len(msg.body) > 200 else ''}\n\n"
+                f"[bold]Priority:[/bold] [{priority_color}]{msg.priority.value}[/{priority_color}]\n",
+                body,
                 f"[dim]{msg.created_at}[/dim]",
-                title=f"{status_label} {msg.subject}",
-                border_style="cyan" if msg.status.value in ("pending", "delivered") else "dim"
-            ))
-        
-        # Show stats
-        stats = manager.get_stats()
-        signal_stats = stats["by_signal"].get(agent, {})
-        console.print(f"\n[dim]Inbox: {signal_stats.get('inbox', 0)} | "
-                     f"Unread: {signal_stats.get('unread', 0)} | "
-                     f"Sent: {signal_stats.get('outbox', 0)}[/dim]")
-        
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+            ),
+            title=f"{status_label} {msg.subject}",
+            border_style="cyan" if msg.status.value in ("pending", "delivered") else "dim"
+        ))
+    
+    # One render pass for the whole inbox
+    console.print(Group(*panels))
+    
+    # Show stats
+    stats = manager.get_stats()
+    signal_stats = stats["by_signal"].get(agent, {})
+    console.print(f"\n[dim]Inbox: {signal_stats.get('inbox', 0)} | "
+                 f"Unread: {signal_stats.get('unread', 0)} | "
+                 f"Sent: {signal_stats.get('outbox', 0)}[/dim]")
 
 
-@main.command()
+@click.command()
+@cli_error_handler
 @click.argument("work_item_id")
-@click.argument("from_agent", type=click.Choice(["pm", "architect", "engineer", "ux", "reviewer"]))
-@click.argument("to_agent", type=click.Choice(["pm", "architect", "engineer", "ux", "reviewer"]))
-@click.option("--reason", type=click.Choice(["workflow", "escalation", "specialization", "blocker"]),
+@click.argument("from_agent", type=AGENT_CHOICE)
+@click.argument("to_agent", type=AGENT_CHOICE)
+@click.option("--reason", type=HANDOFF_REASON_CHOICE,
               default="workflow", help="Reason for handoff")
 @click.option("--summary", help="Summary of work done")
 def handoff(work_item_id, from_agent, to_agent, reason, summary):
@@ -1035,488 +1271,445 @@ def handoff(work_item_id, from_agent, to_agent, reason, summary):
     """
     console.print(f"[bold cyan]Initiating handoff: {from_agent} -> {to_agent}[/bold cyan]\n")
     
-    try:
-        from ai_squad.core.workstate import WorkStateManager
-        from ai_squad.core.signal import SignalManager
-        from ai_squad.core.handoff import HandoffManager, HandoffReason, HandoffContext
-        
-        work_manager = WorkStateManager()
-        signal_manager = SignalManager()
-        from ai_squad.core.delegation import DelegationManager
-        delegation_manager = DelegationManager(workspace_root=Path.cwd(), signal_manager=signal_manager)
-        handoff_manager = HandoffManager(work_manager, signal_manager, delegation_manager)
-        
-        # Map reason string to enum
-        reason_map = {
-            "workflow": HandoffReason.WORKFLOW,
-            "escalation": HandoffReason.ESCALATION,
-            "specialization": HandoffReason.SPECIALIZATION,
-            "blocker": HandoffReason.BLOCKER,
-        }
-        
-        # Create context
-        context = None
-        if summary:
-            context = HandoffContext(
-                summary=summary,
-                current_state="Work transferred via CLI"
-            )
-        
-        # Initiate handoff
-        handoff_obj = handoff_manager.initiate_handoff(
-            work_item_id=work_item_id,
-            from_agent=from_agent,
-            to_agent=to_agent,
-            reason=reason_map[reason],
-            context=context
+    handoff_mod = _imp("ai_squad.core.handoff")
+    handoff_manager = _managers().handoff
+    
+    # Create context
+    context = None
+    if summary:
+        context = handoff_mod.HandoffContext(
+            summary=summary,
+            current_state="Work transferred via CLI"
         )
-        
-        if handoff_obj:
-            status_value = getattr(handoff_obj.status, "value", str(handoff_obj.status))
-            console.print(f"[green]OK Handoff initiated: {handoff_obj.id}[/green]")
-            console.print(f"[dim]Status: {status_value}[/dim]")
-            console.print(f"\n[dim]TIP {to_agent.upper()} agent will receive notification[/dim]")
-        else:
-            console.print("[bold red]FAIL Failed to initiate handoff[/bold red]")
-            sys.exit(1)
-        
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
+    
+    # Initiate handoff
+    handoff_obj = handoff_manager.initiate_handoff(
+        work_item_id=work_item_id,
+        from_agent=from_agent,
+        to_agent=to_agent,
+        reason=handoff_mod.HandoffReason(reason),  # CLI choices are enum values
+        context=context
+    )
+    
+    if handoff_obj:
+        status_value = getattr(handoff_obj.status, "value", str(handoff_obj.status))
+        console.print(f"[green]OK Handoff initiated: {handoff_obj.id}[/green]")
+        console.print(f"[dim]Status: {status_value}[/dim]")
+        console.print(f"\n[dim]TIP {to_agent.upper()} agent will receive notification[/dim]")
+    else:
+        console.print("[bold red]FAIL Failed to initiate handoff[/bold red]")
         sys.exit(1)
 
 
-@main.command()
-def status():
+@click.command()
+@cli_error_handler
+def orchestration_status():
     """
     Show overall AI-Squad orchestration status
     
     Displays work items, active convoys, pending handoffs,
     and unread messages across all agents.
     """
+    from rich.panel import Panel
     print_banner()
     
-    try:
-        from ai_squad.core.workstate import WorkStateManager
-        from ai_squad.core.convoy import ConvoyManager, ConvoyStatus
-        from ai_squad.core.signal import SignalManager
-        from ai_squad.core.handoff import HandoffManager
-        
-        work_manager = WorkStateManager()
-        convoy_manager = ConvoyManager(work_manager)
-        signal_manager = SignalManager()
-        from ai_squad.core.delegation import DelegationManager
-        delegation_manager = DelegationManager(workspace_root=Path.cwd(), signal_manager=signal_manager)
-        handoff_manager = HandoffManager(work_manager, signal_manager, delegation_manager)
-        
-        console.print("[bold cyan]AI-Squad Orchestration Status[/bold cyan]\n")
-        
-        # Work Items Summary
-        work_stats = work_manager.get_stats()
-        console.print(Panel(
-            f"[bold]Total:[/bold] {work_stats['total']}\n"
-            f"[green]In Progress:[/green] {work_stats['in_progress']}\n"
-            f"[red]Blocked:[/red] {work_stats['blocked']}\n"
-            f"[cyan]Completed:[/cyan] {work_stats['completed']}",
-            title="Work Items",
-            border_style="cyan"
-        ))
-        
-        # Active Convoys
-        active_convoys = convoy_manager.list_convoys(status=ConvoyStatus.RUNNING)
-        pending_convoys = convoy_manager.list_convoys(status=ConvoyStatus.PENDING)
-        console.print(Panel(
-            f"[bold]Running:[/bold] {len(active_convoys)}\n"
-            f"[bold]Pending:[/bold] {len(pending_convoys)}",
-            title="Convoys",
-            border_style="yellow"
-        ))
-        
-        # Pending Handoffs
-        handoff_stats = handoff_manager.get_stats()
-        console.print(Panel(
-            f"[bold]Pending:[/bold] {handoff_stats['pending']}\n"
-            f"[bold]Completed:[/bold] {handoff_stats['completed']}\n"
-            f"[bold]Rejected:[/bold] {handoff_stats['rejected']}",
-            title="Handoffs",
-            border_style="green"
-        ))
-        
-        # Signal Summary
-        signal_stats = signal_manager.get_stats()
-        total_unread = sum(
-            sig.get("unread", 0) 
-            for sig in signal_stats["by_signal"].values()
+    ConvoyStatus = _imp("ai_squad.core.convoy").ConvoyStatus
+    managers = _managers()
+    work_manager = managers.work
+    convoy_manager = managers.convoy
+    signal_manager = managers.signal
+    handoff_manager = managers.handoff
+    
+    console.print("[bold cyan]AI-Squad Orchestration Status[/bold cyan]\n")
+    
+    # Managers are resolved above on this thread; only the independent
+    # stats reads run concurrently. Errors re-raise when results are unpacked.
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        work_stats, active_convoys, pending_convoys, handoff_stats, signal_stats = pool.map(
+            lambda fetch: fetch(),
+            [
+                work_manager.get_stats,
+                lambda: convoy_manager.list_convoys(status=ConvoyStatus.RUNNING),
+                lambda: convoy_manager.list_convoys(status=ConvoyStatus.PENDING),
+                handoff_manager.get_stats,
+                signal_manager.get_stats,
+            ],
         )
-        console.print(Panel(
-            f"[bold]Total Messages:[/bold] {signal_stats['total_messages']}\n"
-            f"[bold]Unread:[/bold] {total_unread}",
-            title="Signals",
-            border_style="magenta"
-        ))
-        
-        # Quick Tips
-        console.print("\n[dim]Quick commands:[/dim]")
-        console.print("[dim]  • squad work            - View work items[/dim]")
-        console.print("[dim]  • squad convoys         - View convoys[/dim]")
-        console.print("[dim]  • squad signal <agent> - View agent signal[/dim]")
-        console.print("[dim]  • squad captain <issue> - Coordinate issue[/dim]")
-        console.print("[dim]  • squad health          - View routing health[/dim]")
-        console.print("[dim]  • squad capabilities    - Manage capability packages[/dim]")
-        console.print("[dim]  • squad scout           - View scout runs[/dim]")
-        
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
-
-
-@main.command()
+    
+    # Work Items Summary
+    console.print(Panel(
+        f"[bold]Total:[/bold] {work_stats['total']}\n"
+        f"[green]In Progress:[/green] {work_stats['in_progress']}\n"
+        f"[red]Blocked:[/red] {work_stats['blocked']}\n"
+        f"[cyan]Completed:[/cyan] {work_stats['completed']}",
+        title="Work Items",
+        border_style="cyan"
+    ))
+    
+    # Active Convoys
+    console.print(Panel(
+        f"[bold]Running:[/bold] {len(active_convoys)}\n"
+        f"[bold]Pending:[/bold] {len(pending_convoys)}",
+        title="Convoys",
+        border_style="yellow"
+    ))
+    
+    # Pending Handoffs
+    console.print(Panel(
+        f"[bold]Pending:[/bold] {handoff_stats['pending']}\n"
+        f"[bold]Completed:[/bold] {handoff_stats['completed']}\n"
+        f"[bold]Rejected:[/bold] {handoff_stats['rejected']}",
+        title="Handoffs",
+        border_style="green"
+    ))
+    
+    # Signal Summary
+    # SignalManager.get_stats always sets "unread" per owner
+    total_unread = sum(sig["unread"] for sig in signal_stats["by_signal"].values())
+    console.print(Panel(
+        f"[bold]Total Messages:[/bold] {signal_stats['total_messages']}\n"
+        f"[bold]Unread:[/bold] {total_unread}",
+        title="Signals",
+        border_style="magenta"
+    ))
+    
+    # Quick Tips
+    console.print("\n[dim]Quick commands:[/dim]")
+    console.print("[dim]  • squad work            - View work items[/dim]")
+    console.print("[dim]  • squad convoys         - View convoys[/dim]")
+    console.print("[dim]  • squad signal <agent> - View agent signal[/dim]")
+    console.print("[dim]  • squad captain <issue> - Coordinate issue[/dim]")
+    console.print("[dim]  • squad status          - View routing health[/dim]")
+    console.print("[dim]  • squad capabilities    - Manage capability packages[/dim]")
+    console.print("[dim]  • squad scout           - View scout runs[/dim]")
+
+
+@click.command()
+@cli_error_handler
 def status():
     """View operational status and circuit breaker status"""
-    try:
-        from ai_squad.core.router import HealthView, HealthConfig
-        
-        console.print("[bold cyan]Operational Status Report[/bold cyan]\n")
-        
-        health_view = HealthView()
-        health_cfg = HealthConfig()
-        summary = health_view.summarize(config=health_cfg)
+    from rich.panel import Panel
+    router = _imp("ai_squad.core.router")
+    
+    console.print("[bold cyan]Operational Status Report[/bold cyan]\n")
+    
+    health_view = router.HealthView()
+    health_cfg = router.HealthConfig()
+    summary = health_view.summarize(config=health_cfg)
+    
+    # Overall stats
+    console.print(Panel(
+        f"[bold]Total Events:[/bold] {summary['total']}\n"
+        f"[green]Routed:[/green] {summary['routed']}\n"
+        f"[red]Blocked:[/red] {summary['blocked']}\n"
+        f"[yellow]Block Rate:[/yellow] {summary.get('block_rate', 0):.1%}\n"
+        f"[bold]Status:[/bold] {summary.get('overall_status', 'unknown')}",
+        title="Overall Health",
+        border_style="cyan"
+    ))
+    
+    # By destination
+    if summary.get("by_destination"):
+        table = _imp("rich.table").Table(title="Destination Health")
+        table.add_column("Destination", style="cyan")
+        table.add_column("Total", style="white")
+        table.add_column("Routed", style="green")
+        table.add_column("Blocked", style="red")
+        table.add_column("Block Rate", style="yellow")
+        
+        rows = [
+            (
+                dest,
+                str(stats["total"]),
+                str(stats["routed"]),
+                str(stats["blocked"]),
+                f"{stats['blocked'] / stats['total'] * 100:.1f}%" if stats["total"] else "0.0%",
+            )
+            for dest, stats in summary["by_destination"].items()
+        ]
+        for row in rows:
+            table.add_row(*row)
         
-        # Overall stats
-        console.print(Panel(
-            f"[bold]Total Events:[/bold] {summary['total']}\n"
-            f"[green]Routed:[/green] {summary['routed']}\n"
-            f"[red]Blocked:[/red] {summary['blocked']}\n"
-            f"[yellow]Block Rate:[/yellow] {summary.get('block_rate', 0):.1%}\n"
-            f"[bold]Status:[/bold] {summary.get('overall_status', 'unknown')}",
-            title="Overall Health",
-            border_style="cyan"
+        console.print(table)
+    
+    # By priority
+    if summary.get("by_priority"):
+        console.print("\n[bold]By Priority:[/bold]\n" + "\n".join(
+            f"  {priority}: {stats['routed']}/{stats['total']} routed"
+            for priority, stats in summary["by_priority"].items()
         ))
-        
-        # By destination
-        if summary.get("by_destination"):
-            table = Table(title="Destination Health")
-            table.add_column("Destination", style="cyan")
-            table.add_column("Total", style="white")
-            table.add_column("Routed", style="green")
-            table.add_column("Blocked", style="red")
-            table.add_column("Block Rate", style="yellow")
-            
-            for dest, stats in summary["by_destination"].items():
-                total = stats["total"]
-                routed = stats["routed"]
-                blocked = stats["blocked"]
-                block_rate = (blocked / total * 100) if total else 0
-                table.add_row(
-                    dest,
-                    str(total),
-                    str(routed),
-                    str(blocked),
-                    f"{block_rate:.1f}%"
-                )
-            
-            console.print(table)
-        
-        # By priority
-        if summary.get("by_priority"):
-            console.print("\n[bold]By Priority:[/bold]")
-            for priority, stats in summary["by_priority"].items():
-                console.print(f"  {priority}: {stats['routed']}/{stats['total']} routed")
-        
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
 
 
-@main.group()
+@click.group()
 def capabilities():
     """Manage capability packages"""
 
 
 @capabilities.command("list")
+@cli_error_handler
 def capabilities_list():
     """List installed capability packages"""
-    try:
-        from ai_squad.core.capability_registry import CapabilityRegistry
-        
-        registry = CapabilityRegistry()
-        packages = registry.list()
-        
-        if not packages:
-            console.print("[yellow]No capability packages installed[/yellow]")
-            return
-        
-        table = Table(title="Installed Capabilities")
-        table.add_column("Name", style="cyan")
-        table.add_column("Version", style="white")
-        table.add_column("Scope", style="yellow")
-        table.add_column("Tags", style="green")
-        
-        for pkg in packages:
-            table.add_row(
-                pkg.name,
-                pkg.version,
-                pkg.scope,
-                ", ".join(pkg.capability_tags)
-            )
-        
-        console.print(table)
-        
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    from rich.table import Table
+    from ai_squad.core.capability_registry import CapabilityRegistry
+    
+    registry = CapabilityRegistry()
+    packages = registry.list()
+    
+    if not packages:
+        console.print("[yellow]No capability packages installed[/yellow]")
+        return
+    
+    table = Table(title="Installed Capabilities")
+    table.add_column("Name", style="cyan")
+    table.add_column("Version", style="white")
+    table.add_column("Scope", style="yellow")
+    table.add_column("Tags", style="green")
+    
+    for pkg in packages:
+        table.add_row(
+            pkg.name,
+            pkg.version,
+            pkg.scope,
+            ", ".join(pkg.capability_tags)
+        )
+    
+    console.print(table)
 
 
 @capabilities.command("install")
+@cli_error_handler
 @click.argument("package_path", type=click.Path(exists=True))
 def capabilities_install(package_path):
     """Install a capability package from directory or tarball"""
-    try:
-        from ai_squad.core.capability_registry import CapabilityRegistry
-        
-        registry = CapabilityRegistry()
-        pkg = registry.install(Path(package_path))
-        
-        console.print(f"[bold green]OK Installed {pkg.name} v{pkg.version}[/bold green]")
-        console.print(f"   Scope: {pkg.scope}")
-        console.print(f"   Tags: {', '.join(pkg.capability_tags)}")
-        
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    from ai_squad.core.capability_registry import CapabilityRegistry
+    
+    registry = CapabilityRegistry()
+    pkg = registry.install(Path(package_path))
+    
+    _print_ok(f"Installed {pkg.name} v{pkg.version}")
+    console.print(f"   Scope: {pkg.scope}")
+    console.print(f"   Tags: {', '.join(pkg.capability_tags)}")
 
 
 @capabilities.command("key")
+@cli_error_handler
 @click.option("--set", "set_key", help="Set signature key for capability verification")
 @click.option("--show", "show_key", is_flag=True, help="Show whether a key is configured")
 def capabilities_key(set_key, show_key):
     """Manage capability signature key"""
-    try:
-        key_path = Path.cwd() / ".squad" / "capabilities" / "signature.key"
-        key_path.parent.mkdir(parents=True, exist_ok=True)
-
-        if set_key:
-            key_path.write_text(set_key.strip(), encoding="utf-8")
-            console.print("[bold green]OK Signature key saved[/bold green]")
-            return
+    import os
+    import tempfile
 
-        if show_key:
-            if key_path.exists():
-                console.print("[green]Signature key is configured[/green]")
-            else:
-                console.print("[yellow]No signature key configured[/yellow]")
-            return
+    key_path = Path.cwd() / ".squad" / "capabilities" / "signature.key"
+    key_path.parent.mkdir(parents=True, exist_ok=True)
 
-        console.print("[yellow]Provide --set or --show[/yellow]")
+    if set_key:
+        # Write a private temp file and swap it in, so the key on disk is
+        # always either the old one or the complete new one
+        fd, tmp_name = tempfile.mkstemp(dir=key_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(set_key.strip())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_name, key_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        _print_ok("Signature key saved")
+        return
+
+    if show_key:
+        if key_path.exists():
+            console.print("[green]Signature key is configured[/green]")
+        else:
+            console.print("[yellow]No signature key configured[/yellow]")
+        return
 
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    console.print("[yellow]Provide --set or --show[/yellow]")
 
 
-@main.group()
+@click.group()
 def delegation():
     """Manage delegation links"""
 
 
 @delegation.command("list")
+@cli_error_handler
 def delegation_list():
     """List all delegation links"""
-    try:
-        from ai_squad.core.delegation import DelegationManager
-        
-        manager = DelegationManager()
-        links = manager.list()
-        
-        if not links:
-            console.print("[yellow]No delegation links found[/yellow]")
-            return
-        
-        table = Table(title="Delegation Links")
-        table.add_column("ID", style="cyan")
-        table.add_column("From", style="white")
-        table.add_column("To", style="white")
-        table.add_column("Work Item", style="yellow")
-        table.add_column("Status", style="green")
-        table.add_column("Created", style="dim")
-        
-        for link in links:
-            table.add_row(
-                link.id,
-                link.from_agent,
-                link.to_agent,
-                link.work_item_id,
-                link.status.value,
-                link.created_at[:19]  # Trim timestamp
-            )
-        
-        console.print(table)
-        
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
-
-
-@main.group()
+    from ai_squad.core.delegation import DelegationManager
+    
+    manager = DelegationManager()
+    links = manager.list()
+    
+    if not links:
+        console.print("[yellow]No delegation links found[/yellow]")
+        return
+    
+    rows = [
+        (link.id, link.from_agent, link.to_agent, link.work_item_id,
+         link.status.value, link.created_at[:19])  # Trim timestamp
+        for link in links
+    ]
+    _print_rows("Delegation Links", (
+        ("ID", "cyan"),
+        ("From", "white"),
+        ("To", "white"),
+        ("Work Item", "yellow"),
+        ("Status", "green"),
+        ("Created", "dim"),
+    ), rows)
+
+
+@click.group()
 def graph():
     """Manage operational graph"""
 
 
-@main.group()
+@click.group()
 def scout():
     """Manage scout worker runs"""
 
 
 @scout.command("list")
+@cli_error_handler
 def scout_list():
     """List scout worker runs"""
-    try:
-        from ai_squad.core.scout_worker import ScoutWorker
+    from ai_squad.core.scout_worker import ScoutWorker
 
-        worker = ScoutWorker()
-        runs = worker.list_runs()
+    worker = ScoutWorker()
+    summaries = worker.list_run_summaries()
 
-        if not runs:
-            console.print("[yellow]No scout runs found[/yellow]")
-            return
-
-        table = Table(title="Scout Runs")
-        table.add_column("Run ID", style="cyan")
-        table.add_column("Tasks", style="white")
-        table.add_column("Completed", style="green")
+    if not summaries:
+        console.print("[yellow]No scout runs found[/yellow]")
+        return
 
-        for run_id in runs:
-            run = worker.load_run(run_id)
-            tasks = len(run.tasks) if run else 0
-            completed = len([t for t in (run.tasks if run else []) if t.status == "completed"])
-            table.add_row(run_id, str(tasks), str(completed))
-
-        console.print(table)
-
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    rows = [(run_id, str(tasks), str(completed)) for run_id, tasks, completed in summaries]
+    _print_rows("Scout Runs", (
+        ("Run ID", "cyan"),
+        ("Tasks", "white"),
+        ("Completed", "green"),
+    ), rows)
 
 
 @scout.command("show")
+@cli_error_handler
 @click.argument("run_id")
 def scout_show(run_id):
     """Show details for a scout run"""
-    try:
-        from ai_squad.core.scout_worker import ScoutWorker
+    from rich.panel import Panel
+    from rich.table import Table
+    from ai_squad.core.scout_worker import ScoutWorker
 
-        worker = ScoutWorker()
-        run = worker.load_run(run_id)
+    worker = ScoutWorker()
+    run = worker.load_run(run_id)
 
-        if not run:
-            console.print("[yellow]Scout run not found[/yellow]")
-            return
-
-        console.print(Panel(f"Run: {run.run_id}\nCreated: {run.created_at}", title="Scout Run"))
-        table = Table(title="Tasks")
-        table.add_column("Task", style="cyan")
-        table.add_column("Status", style="white")
-        table.add_column("Error", style="red")
+    if not run:
+        console.print("[yellow]Scout run not found[/yellow]")
+        return
 
-        for task in run.tasks:
-            table.add_row(task.name, task.status, task.error or "")
+    console.print(Panel(f"Run: {run.run_id}\nCreated: {run.created_at}", title="Scout Run"))
+    table = Table(title="Tasks")
+    table.add_column("Task", style="cyan")
+    table.add_column("Status", style="white")
+    table.add_column("Error", style="red")
 
-        console.print(table)
+    for task in run.tasks:
+        table.add_row(task.name, task.status, task.error or "")
 
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    console.print(table)
 
 
 @scout.command("run")
+@cli_error_handler
 @click.option("--task", "tasks", multiple=True, help="Scout task to run (repeatable)")
-def scout_run(tasks):
+@click.option("--jobs", "-j", type=click.IntRange(min=1), default=None,
+              help="Tasks to run at once (default: all selected, up to 32)")
+def scout_run(tasks, jobs):
     """Run a scout worker task"""
-    try:
-        from ai_squad.core.scout_worker import ScoutWorker
+    import os
+    from ai_squad.core.scout_worker import ScoutWorker
 
-        selected = list(tasks) or ["noop"]
-        def _noop():
-            return "ok"
-
-        def _list_squad_files():
-            return [p.name for p in (Path.cwd() / ".squad").glob("*")]
-
-        def _check_routing_events():
-            return (Path.cwd() / ".squad" / "events" / "routing.jsonl").exists()
-
-        task_map = {
-            "noop": _noop,
-            "list_squad_files": _list_squad_files,
-            "check_routing_events": _check_routing_events,
-        }
-        run_tasks = {name: task_map[name] for name in selected if name in task_map}
-        if not run_tasks:
-            console.print("[yellow]No valid tasks selected[/yellow]")
-            return
+    selected = list(tasks) or ["noop"]
+    def _noop():
+        return "ok"
 
-        worker = ScoutWorker()
-        run = worker.run(run_tasks, metadata={"tasks": selected})
-        console.print(f"[bold green]OK Scout run completed[/bold green] {run.run_id}")
-
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    def _list_squad_files():
+        # Names come straight from the directory read; no per-entry stat
+        try:
+            with os.scandir(Path.cwd() / ".squad") as it:
+                return [entry.name for entry in it]
+        except FileNotFoundError:
+            return []
+
+    def _check_routing_events():
+        return (Path.cwd() / ".squad" / "events" / "routing.jsonl").exists()
+
+    task_map = {
+        "noop": _noop,
+        "list_squad_files": _list_squad_files,
+        "check_routing_events": _check_routing_events,
+    }
+    run_tasks = {name: task_map[name] for name in selected if name in task_map}
+    if not run_tasks:
+        console.print("[yellow]No valid tasks selected[/yellow]")
+        return
+
+    worker = ScoutWorker()
+    jobs = jobs or min(32, len(run_tasks))
+    run = worker.run(run_tasks, metadata={"tasks": selected}, jobs=jobs)
+    _print_ok("Scout run completed", f" {run.run_id}")
 
 
 @graph.command("export")
+@cli_error_handler
 @click.option("--format", "export_format", type=click.Choice(["mermaid"]), default="mermaid", help="Export format")
 def graph_export(export_format):
     """Export operational graph"""
-    try:
-        from ai_squad.core.operational_graph import OperationalGraph
-        
-        op_graph = OperationalGraph()
-        
-        if export_format == "mermaid":
-            diagram = op_graph.export_mermaid()
-            console.print(diagram)
-        
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    from ai_squad.core.operational_graph import OperationalGraph
+    
+    op_graph = OperationalGraph()
+    
+    if export_format == "mermaid":
+        diagram = op_graph.export_mermaid()
+        console.print(diagram)
 
 
 @graph.command("impact")
+@cli_error_handler
 @click.argument("node_id")
 def graph_impact(node_id):
     """Analyze impact of changes to a node"""
-    try:
-        from ai_squad.core.operational_graph import OperationalGraph
-        
-        op_graph = OperationalGraph()
-        impact = op_graph.impact_analysis(node_id)
-        
-        if "error" in impact:
-            console.print(f"[bold red]FAIL {impact['error']}[/bold red]")
-            return
-        
-        console.print(f"[bold cyan]Impact Analysis for {node_id}[/bold cyan]\n")
-        console.print(f"[bold]Direct Dependents:[/bold] {len(impact['direct_dependents'])}")
-        console.print(f"[bold]Total Affected:[/bold] {impact['total_affected']}")
-        
-        if impact['owners']:
-            console.print("\n[bold]Owners:[/bold]")
-            for owner in impact['owners']:
-                console.print(f"  • {owner}")
-        
-        if impact['affected_nodes']:
-            console.print("\n[bold]Affected Nodes:[/bold]")
-            for node in impact['affected_nodes'][:10]:  # Limit to first 10
-                console.print(f"  • {node}")
-            if len(impact['affected_nodes']) > 10:
-                console.print(f"  ... and {len(impact['affected_nodes']) - 10} more")
-        
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    from ai_squad.core.operational_graph import OperationalGraph
+    
+    op_graph = OperationalGraph()
+    impact = op_graph.impact_analysis(node_id)
+    
+    if "error" in impact:
+        console.print(f"[bold red]FAIL {impact['error']}[/bold red]")
+        return
+    
+    console.print(f"[bold cyan]Impact Analysis for {node_id}[/bold cyan]\n")
+    console.print(f"[bold]Direct Dependents:[/bold] {len(impact['direct_dependents'])}")
+    console.print(f"[bold]Total Affected:[/bold] {impact['total_affected']}")
+    
+    if impact['owners']:
+        console.print("\n[bold]Owners:[/bold]")
+        for owner in impact['owners']:
+            console.print(f"  • {owner}")
+    
+    if impact['affected_nodes']:
+        console.print("\n[bold]Affected Nodes:[/bold]")
+        for node in impact['affected_nodes'][:10]:  # Limit to first 10
+            console.print(f"  • {node}")
+        if len(impact['affected_nodes']) > 10:
+            console.print(f"  ... and {len(impact['affected_nodes']) - 10} more")
 
 
-@main.command()
+@click.command()
+@cli_error_handler
 @click.option("--host", default="127.0.0.1", help="Host to bind to")
 @click.option("--port", default=5050, type=int, help="Port to bind to")
 @click.option("--debug", is_flag=True, help="Enable debug mode")
@@ -1550,169 +1743,257 @@ def dashboard(host, port, debug):
         console.print("[bold red]FAIL Flask is not installed[/bold red]")
         console.print("[yellow]Install with: pip install flask[/yellow]")
         sys.exit(1)
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
 
 
-@main.group()
+@click.group()
 def theater():
     """Manage theaters, sectors, and routing"""
 
 
 @theater.command("list")
+@cli_error_handler
 def theater_list():
     """List theaters and sectors"""
-    from ai_squad.core.config import Config
+    from ai_squad.core.config import get_config
     from ai_squad.core.theater import TheaterRegistry
 
-    try:
-        config = Config.load()
-        registry = TheaterRegistry(config=config.data)
-        theaters = registry.list_theaters()
-        if not theaters:
-            console.print("[yellow]No theaters configured[/yellow]")
-            return
-        for t in theaters:
-            console.print(f"[bold cyan]{t.name}[/bold cyan]")
-            for sector in t.sectors.values():
-                console.print(f"  • {sector.name} -> {sector.repo_path}")
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    config = get_config()
+    registry = TheaterRegistry(config=config.data)
+    theaters = registry.list_theaters()
+    if not theaters:
+        console.print("[yellow]No theaters configured[/yellow]")
+        return
+    for t in theaters:
+        console.print(f"[bold cyan]{t.name}[/bold cyan]")
+        for sector in t.sectors.values():
+            console.print(f"  • {sector.name} -> {sector.repo_path}")
 
 
 @theater.command("add-sector")
+@cli_error_handler
 @click.argument("theater_name")
 @click.argument("sector_name")
 @click.argument("repo_path")
 @click.option("--staging-path", default=None, help="Optional staging area path")
 def theater_add_sector(theater_name, sector_name, repo_path, staging_path):
     """Add a sector to a theater"""
-    from ai_squad.core.config import Config
+    from ai_squad.core.config import get_config
     from ai_squad.core.theater import TheaterRegistry
 
-    try:
-        config = Config.load()
-        registry = TheaterRegistry(config=config.data)
-        sector = registry.add_sector(theater_name, sector_name, repo_path, staging_path)
-        console.print(f"[bold green]OK Added sector {sector.name}[/bold green]")
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    config = get_config()
+    registry = TheaterRegistry(config=config.data)
+    sector = registry.add_sector(theater_name, sector_name, repo_path, staging_path)
+    _print_ok(f"Added sector {sector.name}")
 
 
 @theater.command("route")
+@cli_error_handler
 @click.argument("theater_name")
 @click.argument("prefix")
 @click.argument("sector_name")
 def theater_route(theater_name, prefix, sector_name):
     """Set routing prefix to sector"""
-    from ai_squad.core.config import Config
+    from ai_squad.core.config import get_config
     from ai_squad.core.theater import TheaterRegistry
 
-    try:
-        config = Config.load()
-        registry = TheaterRegistry(config=config.data)
-        registry.set_route(theater_name, prefix, sector_name)
-        console.print(f"[bold green]OK Routed {prefix} -> {sector_name}[/bold green]")
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    config = get_config()
+    registry = TheaterRegistry(config=config.data)
+    registry.set_route(theater_name, prefix, sector_name)
+    _print_ok(f"Routed {prefix} -> {sector_name}")
 
 
 @theater.command("staging")
+@cli_error_handler
 @click.argument("theater_name")
 def theater_staging(theater_name):
     """Ensure staging areas exist"""
-    from ai_squad.core.config import Config
+    from ai_squad.core.config import get_config
     from ai_squad.core.theater import TheaterRegistry
 
-    try:
-        config = Config.load()
-        registry = TheaterRegistry(config=config.data)
-        paths = registry.ensure_staging_areas(theater_name)
-        console.print(f"[bold green]OK Staging areas ready ({len(paths)})[/bold green]")
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    config = get_config()
+    registry = TheaterRegistry(config=config.data)
+    paths = registry.ensure_staging_areas(theater_name)
+    _print_ok(f"Staging areas ready ({len(paths)})")
 
 
-@main.command()
+@click.command()
+@cli_error_handler
 def recon():
     """Generate reconnaissance summary"""
-    from ai_squad.core.config import Config
+    from ai_squad.core.config import get_config
     from ai_squad.core.recon import ReconManager
 
-    try:
-        config = Config.load()
-        recon_manager = ReconManager(routing_config=config.get("routing", {}))
-        summary = recon_manager.build_summary()
-        path = recon_manager.save_summary(summary)
-        console.print(f"[bold green]OK Recon summary saved to {path}[/bold green]")
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    config = get_config()
+    recon_manager = ReconManager(routing_config=config.get("routing", {}))
+    summary = recon_manager.build_summary()
+    path = recon_manager.save_summary(summary)
+    _print_ok(f"Recon summary saved to {path}")
 
 
-@main.command()
+@click.command()
+@cli_error_handler
 def patrol():
     """Run patrol to detect stale work"""
-    from ai_squad.core.config import Config
+    from ai_squad.core.config import get_config
     from ai_squad.core.patrol import PatrolManager
 
-    try:
-        config = Config.load()
-        patrol_cfg = config.get("patrol", {}) or {}
-        manager = PatrolManager(
-            stale_minutes=patrol_cfg.get("stale_minutes", 120),
-            statuses=patrol_cfg.get("statuses", None),
-        )
-        events = manager.run()
-        console.print(f"[bold green]OK Patrol complete ({len(events)} stale items)[/bold green]")
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    config = get_config()
+    patrol_cfg = config.get("patrol", {}) or {}
+    manager = PatrolManager(
+        stale_minutes=patrol_cfg.get("stale_minutes", 120),
+        statuses=patrol_cfg.get("statuses", None),
+    )
+    events = manager.run()
+    _print_ok(f"Patrol complete ({len(events)} stale items)")
 
 
-@main.group()
+@click.group()
 def report():
     """View after-operation reports"""
 
 
 @report.command("list")
-def report_list():
+@cli_error_handler
+@click.option("--limit", default=20, type=int, help="Show only the N most recent reports (0 for all)")
+def report_list(limit):
     """List after-operation reports"""
+    import heapq
+    import os
     from ai_squad.core.reporting import ReportManager
 
-    try:
-        mgr = ReportManager()
-        if not mgr.reports_dir.exists():
-            console.print("[yellow]No reports found[/yellow]")
-            return
-        for path in sorted(mgr.reports_dir.glob("after-operation-*.md")):
-            console.print(f"• {path.name}")
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+    mgr = ReportManager()
+    names = mgr.list_reports()
+    total = len(names)
+    if not total:
+        console.print("[yellow]No reports found[/yellow]")
+        return
+    if 0 < limit < total:
+        # Only stat when truncating; O(N log k) instead of a full sort
+        reports_dir = str(mgr.reports_dir)
+        names = sorted(heapq.nlargest(
+            limit, names, key=lambda name: os.stat(os.path.join(reports_dir, name)).st_mtime_ns
+        ))
+    console.print("\n".join(f"• {name}" for name in names))
+    if len(names) < total:
+        console.print(f"[dim]Showing {len(names)} most recent of {total} reports (--limit 0 for all)[/dim]")
 
 
 @report.command("show")
+@cli_error_handler
 @click.argument("report_name")
 def report_show(report_name):
     """Show an after-operation report"""
+    import os
+    import shutil
     from ai_squad.core.reporting import ReportManager
 
+    mgr = ReportManager()
+    full_path = os.path.join(str(mgr.reports_dir), report_name)
     try:
-        mgr = ReportManager()
-        path = mgr.reports_dir / report_name
-        if not path.exists():
-            console.print(f"[bold red]FAIL Report not found: {report_name}[/bold red]")
-            return
-        console.print(path.read_text(encoding="utf-8"))
-    except (RuntimeError, OSError, ValueError, click.ClickException) as e:
-        console.print(f"[bold red]FAIL Error: {e}[/bold red]")
-        sys.exit(1)
+        f = open(full_path, encoding="utf-8", buffering=65536)
+    except FileNotFoundError:
+        console.print(f"[bold red]FAIL Report not found: {report_name}[/bold red]")
+        return
+    # Reports are plain markdown: copy through in 64KB chunks instead of
+    # reading the whole file and running it through Rich markup parsing
+    with f:
+        out = console.file
+        shutil.copyfileobj(f, out, 65536)
+        out.write("\n")
+        out.flush()
+
+
+# ============================================================
+# ENTRY POINT
+# ============================================================
+
+_COMMANDS = {
+    "deploy": deploy,
+    "pm": pm,
+    "architect": architect,
+    "engineer": engineer,
+    "ux": ux,
+    "review": review,
+    "joint-op": joint_op,
+    "chat": chat,
+    "sitrep": sitrep,
+    "watch": watch_patrol,
+    "patrol": patrol,
+    "update": update,
+    "clarify": clarify,
+    "mission": mission,
+    "captain": captain,
+    "captain-status": captain_status,
+    "ops": ops,
+    "plans": plans,
+    "run-plan": run_plan,
+    "convoys": convoys,
+    "signal": signal,
+    "handoff": handoff,
+    "orchestration": orchestration_status,
+    "status": status,
+    "capabilities": capabilities,
+    "delegation": delegation,
+    "graph": graph,
+    "scout": scout,
+    "dashboard": dashboard,
+    "theater": theater,
+    "recon": recon,
+    "report": report,
+}
+
+
+class SquadGroup(click.Group):
+    """
+    Top-level group that hands hot subcommands straight to their command
+    
+    ``squad orchestration``/``squad ops`` and friends skip group option parsing
+    and subcommand resolution; each command still parses its own
+    arguments with Click, so options and --help behave the same.
+    """
+    
+    FAST_COMMANDS = frozenset({
+        "mission", "captain", "ops", "plans", "run-plan",
+        "convoys", "signal", "handoff", "orchestration", "status",
+    })
+    
+    def main(self, args=None, prog_name=None, **extra):
+        argv = sys.argv[1:] if args is None else list(args)
+        if argv and argv[0] in self.FAST_COMMANDS:
+            name = argv[0]
+            return self.commands[name].main(
+                argv[1:], prog_name=f"{prog_name or 'squad'} {name}", **extra
+            )
+        return super().main(args, prog_name, **extra)
+
+
+@click.group(cls=SquadGroup, invoke_without_command=True, commands=_COMMANDS)
+@click.option("--version", is_flag=True, help="Show version and exit")
+@click.pass_context
+def main(ctx, version):
+    """
+    AI-Squad - Your AI Development Squad
+    
+    Five expert AI agents to accelerate your development:
+    
+    • Product Manager - Creates PRDs and user stories
+    
+    • Architect - Designs solutions and writes ADRs
+    
+    • Engineer - Implements features with tests
+    
+    • UX Designer - Creates wireframes and flows
+    
+    • Reviewer - Reviews code and checks quality
+    """
+    if version:
+        from ai_squad.__version__ import __version__
+        console.print(f"AI-Squad version {__version__}")
+        sys.exit(0)
+    
+    if ctx.invoked_subcommand is None:
+        print_banner()
+        console.print("[yellow]Run 'squad --help' for usage information[/yellow]\n")
 
 
 if __name__ == "__main__":
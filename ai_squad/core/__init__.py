@@ -1,76 +1,96 @@
-"""Core package initialization"""
+"""Core package initialization
 
-from ai_squad.core.agent_executor import AgentExecutor
-from ai_squad.core.config import Config
-from ai_squad.core.init_project import initialize_project
+Public classes are imported lazily (PEP 562): ``from ai_squad.core import X``
+loads only the submodule that defines ``X``, so CLI commands that need one
+manager do not pay for importing every other one.
+"""
+import importlib
 
-# AI Provider chain (Copilot -> OpenAI -> Azure -> Template)
-from ai_squad.core.ai_provider import (
-    AIProviderChain,
-    AIProviderType,
-    AIResponse,
-    get_ai_provider,
-    generate_content,
-)
+# Exported name -> defining submodule
+_LAZY = {
+    "AgentExecutor": "ai_squad.core.agent_executor",
+    "Config": "ai_squad.core.config",
+    "initialize_project": "ai_squad.core.init_project",
+    # AI Provider chain (Copilot -> OpenAI -> Azure -> Template)
+    "AIProviderChain": "ai_squad.core.ai_provider",
+    "AIProviderType": "ai_squad.core.ai_provider",
+    "AIResponse": "ai_squad.core.ai_provider",
+    "get_ai_provider": "ai_squad.core.ai_provider",
+    "generate_content": "ai_squad.core.ai_provider",
+    # A2A Protocol alignment - Agent discovery and capability-based routing
+    "AgentCard": "ai_squad.core.agent_card",
+    "AgentCapability": "ai_squad.core.agent_card",
+    "InputSchema": "ai_squad.core.agent_card",
+    "OutputSchema": "ai_squad.core.agent_card",
+    "DEFAULT_AGENT_CARDS": "ai_squad.core.agent_card",
+    "AgentRegistry": "ai_squad.core.agent_registry",
+    "AgentInstance": "ai_squad.core.agent_registry",
+    "get_registry": "ai_squad.core.agent_registry",
+    "reset_registry": "ai_squad.core.agent_registry",
+    # AI-Squad orchestration modules
+    "WorkItem": "ai_squad.core.workstate",
+    "WorkStateManager": "ai_squad.core.workstate",
+    "WorkStatus": "ai_squad.core.workstate",
+    "HookManager": "ai_squad.core.hooks",
+    "WorkerLifecycleManager": "ai_squad.core.worker_lifecycle",
+    "BattlePlan": "ai_squad.core.battle_plan",
+    "BattlePlanPhase": "ai_squad.core.battle_plan",
+    "BattlePlanManager": "ai_squad.core.battle_plan",
+    "BattlePlanExecutor": "ai_squad.core.battle_plan",
+    "BattlePlanExecution": "ai_squad.core.battle_plan",
+    "Captain": "ai_squad.core.captain",
+    "TaskBreakdown": "ai_squad.core.captain",
+    "ConvoyPlan": "ai_squad.core.captain",
+    "Convoy": "ai_squad.core.convoy",
+    "ConvoyMember": "ai_squad.core.convoy",
+    "ConvoyManager": "ai_squad.core.convoy",
+    "ConvoyBuilder": "ai_squad.core.convoy",
+    "ConvoyStatus": "ai_squad.core.convoy",
+    "Signal": "ai_squad.core.signal",
+    "SignalManager": "ai_squad.core.signal",
+    "MessagePriority": "ai_squad.core.signal",
+    "MessageStatus": "ai_squad.core.signal",
+    "Handoff": "ai_squad.core.handoff",
+    "HandoffContext": "ai_squad.core.handoff",
+    "HandoffManager": "ai_squad.core.handoff",
+    "HandoffStatus": "ai_squad.core.handoff",
+    "HandoffReason": "ai_squad.core.handoff",
+    "CapabilityRegistry": "ai_squad.core.capability_registry",
+    "DelegationManager": "ai_squad.core.delegation",
+    "DelegationStatus": "ai_squad.core.delegation",
+    "OrgRouter": "ai_squad.core.router",
+    "PolicyRule": "ai_squad.core.router",
+    "HealthView": "ai_squad.core.router",
+    "DiscoveryIndex": "ai_squad.core.discovery",
+    "IdentityDossier": "ai_squad.core.identity",
+    "IdentityManager": "ai_squad.core.identity",
+    "ScoutWorker": "ai_squad.core.scout_worker",
+    "OperationalGraph": "ai_squad.core.operational_graph",
+    "NodeType": "ai_squad.core.operational_graph",
+    "EdgeType": "ai_squad.core.operational_graph",
+    "TheaterRegistry": "ai_squad.core.theater",
+    "Theater": "ai_squad.core.theater",
+    "Sector": "ai_squad.core.theater",
+    "ReconManager": "ai_squad.core.recon",
+    "ReconSummary": "ai_squad.core.recon",
+    "PatrolManager": "ai_squad.core.patrol",
+    "PatrolEvent": "ai_squad.core.patrol",
+    "ReportManager": "ai_squad.core.reporting",
+    "AfterOperationReport": "ai_squad.core.reporting",
+}
 
-# A2A Protocol alignment - Agent discovery and capability-based routing
-from ai_squad.core.agent_card import (
-    AgentCard,
-    AgentCapability,
-    InputSchema,
-    OutputSchema,
-    DEFAULT_AGENT_CARDS,
-)
-from ai_squad.core.agent_registry import (
-    AgentRegistry,
-    AgentInstance,
-    get_registry,
-    reset_registry,
-)
 
-# AI-Squad orchestration modules
-from ai_squad.core.workstate import WorkItem, WorkStateManager, WorkStatus
-from ai_squad.core.hooks import HookManager
-from ai_squad.core.worker_lifecycle import WorkerLifecycleManager
-from ai_squad.core.battle_plan import (
-    BattlePlan,
-    BattlePlanPhase,
-    BattlePlanManager,
-    BattlePlanExecutor,
-    BattlePlanExecution,
-)
-from ai_squad.core.captain import Captain, TaskBreakdown, ConvoyPlan
-from ai_squad.core.convoy import (
-    Convoy,
-    ConvoyMember,
-    ConvoyManager,
-    ConvoyBuilder,
-    ConvoyStatus,
-)
-from ai_squad.core.signal import (
-    Signal,
-    SignalManager,
-    MessagePriority,
-    MessageStatus,
-)
-from ai_squad.core.handoff import (
-    Handoff,
-    HandoffContext,
-    HandoffManager,
-    HandoffStatus,
-    HandoffReason,
-)
-from ai_squad.core.capability_registry import CapabilityRegistry
-from ai_squad.core.delegation import DelegationManager, DelegationStatus
-from ai_squad.core.router import OrgRouter, PolicyRule, HealthView
-from ai_squad.core.discovery import DiscoveryIndex
-from ai_squad.core.identity import IdentityDossier, IdentityManager
-from ai_squad.core.scout_worker import ScoutWorker
-from ai_squad.core.operational_graph import OperationalGraph, NodeType, EdgeType
-from ai_squad.core.theater import TheaterRegistry, Theater, Sector
-from ai_squad.core.recon import ReconManager, ReconSummary
-from ai_squad.core.patrol import PatrolManager, PatrolEvent
-from ai_squad.core.reporting import ReportManager, AfterOperationReport
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 __all__ = [
     # Original exports
@@ -10,9 +10,14 @@ This enables:
 - Schema validation for inputs/outputs
 - Version compatibility checks
 """
+from collections.abc import Mapping
+import copy
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+import functools
+import io
+import sys
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
 import json
 
 
@@ -55,19 +60,62 @@ class AgentCapability(str, Enum):
     AGENT_DELEGATION = "agent-delegation"
 
 
-@dataclass
+# Capability value -> member; dict.get skips unknown values without raising.
+# Keys are interned so lookups with interned strings match by identity.
+_CAPABILITY_BY_VALUE: Dict[str, AgentCapability] = {
+    sys.intern(cap.value): cap for cap in AgentCapability
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _json_encoder(indent: Optional[int]) -> json.JSONEncoder:
+    """Shared encoder per indent; json.dumps(indent=...) builds a new one per call"""
+    return json.JSONEncoder(indent=indent)
+
+
+# Schema type names checked with isinstance; other names compare type(value).__name__
+_TYPE_TABLE: Dict[str, type] = {
+    "int": int, "str": str, "dict": dict, "list": list,
+    "bool": bool, "float": float, "tuple": tuple,
+}
+
+# Sentinel for absent fields, so data.get() does a single lookup
+_MISSING = object()
+
+
+@dataclass(slots=True)
 class InputSchema:
     """Schema for agent input validation"""
     required_fields: List[str] = field(default_factory=list)
     optional_fields: List[str] = field(default_factory=list)
     field_types: Dict[str, str] = field(default_factory=dict)
     
+    # Straight-line validator generated by compile() on first validate()
+    _compiled: Optional[Callable[[Dict[str, Any]], List[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "required": self.required_fields,
-            "optional": self.optional_fields,
-            "types": self.field_types,
-        }
+        """Shared, read-only dict; built once and reused by every card's to_dict()"""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "required": self.required_fields,
+                "optional": self.optional_fields,
+                "types": self.field_types,
+            }
+        return self._dict_cache
+    
+    def write_json(self, fp: TextIO) -> None:
+        """Write to_dict() as single-line JSON to fp without building the dict"""
+        encode = _json_encoder(None).encode
+        fp.write('{"required": ')
+        fp.write(encode(self.required_fields))
+        fp.write(', "optional": ')
+        fp.write(encode(self.optional_fields))
+        fp.write(', "types": ')
+        fp.write(encode(self.field_types))
+        fp.write("}")
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "InputSchema":
@@ -77,34 +125,84 @@ class InputSchema:
             field_types=data.get("types", {}),
         )
     
+    def invalidate_cache(self) -> None:
+        """Recompile validation checks and rebuild to_dict() after mutating the schema"""
+        self._compiled = None
+        self._dict_cache = None
+    
+    def compile(self) -> Callable[[Dict[str, Any]], List[str]]:
+        """
+        Generate a validator specialized to this schema
+        
+        Field names, type names and messages are embedded as repr() literals,
+        so the generated function does no schema iteration or formatting
+        beyond the actual type name of a mismatched value. Types listed in
+        _TYPE_TABLE are checked with isinstance (bool is still rejected
+        for "int"); other names fall back to comparing type names.
+        """
+        namespace: Dict[str, Any] = {"_MISSING": _MISSING}
+        lines = ["def validate(data):", "    errors = []"]
+        for name in self.required_fields:
+            message = f"Missing required field: {name}"
+            lines.append(f"    if {name!r} not in data:")
+            lines.append(f"        errors.append({message!r})")
+        for name, expected in self.field_types.items():
+            prefix = f"Field '{name}' expected {expected}, got "
+            expected_type = _TYPE_TABLE.get(expected)
+            if expected_type is None:
+                mismatch = f"type(value).__name__ != {expected!r}"
+            else:
+                namespace[expected] = expected_type
+                mismatch = f"not isinstance(value, {expected})"
+                if expected_type is int:
+                    mismatch = f"{mismatch} or isinstance(value, bool)"
+            lines.append(f"    value = data.get({name!r}, _MISSING)")
+            lines.append(f"    if value is not _MISSING and ({mismatch}):")
+            lines.append(f"        errors.append({prefix!r} + type(value).__name__)")
+        lines.append("    return errors")
+        exec(compile("\n".join(lines), "<InputSchema.validate>", "exec"), namespace)  # noqa: S102
+        return namespace["validate"]
+    
     def validate(self, data: Dict[str, Any]) -> List[str]:
         """Validate input data against schema, return list of errors"""
-        errors = []
-        for field_name in self.required_fields:
-            if field_name not in data:
-                errors.append(f"Missing required field: {field_name}")
-        
-        for field_name, expected_type in self.field_types.items():
-            if field_name in data:
-                actual_type = type(data[field_name]).__name__
-                if actual_type != expected_type:
-                    errors.append(
-                        f"Field '{field_name}' expected {expected_type}, got {actual_type}"
-                    )
-        return errors
+        validator = self._compiled
+        if validator is None:
+            validator = self._compiled = self.compile()
+        return validator(data)
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputSchema:
     """Schema for agent output declaration"""
-    artifacts: List[str] = field(default_factory=list)  # File types produced
+    artifacts: Tuple[str, ...] = ()  # File types produced
     fields: Dict[str, str] = field(default_factory=dict)  # Output field types
     
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self.artifacts = tuple(self.artifacts)
+    
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "artifacts": self.artifacts,
-            "fields": self.fields,
-        }
+        """Shared, read-only dict; built once and reused by every card's to_dict()"""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "artifacts": list(self.artifacts),
+                "fields": self.fields,
+            }
+        return self._dict_cache
+    
+    def invalidate_cache(self) -> None:
+        """Rebuild to_dict() after mutating the schema"""
+        self._dict_cache = None
+    
+    def write_json(self, fp: TextIO) -> None:
+        """Write to_dict() as single-line JSON to fp without building the dict"""
+        encode = _json_encoder(None).encode
+        fp.write('{"artifacts": ')
+        fp.write(encode(self.artifacts))
+        fp.write(', "fields": ')
+        fp.write(encode(self.fields))
+        fp.write("}")
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "OutputSchema":
@@ -114,12 +212,17 @@ class OutputSchema:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentCard:
     """
     A2A-Inspired Agent Capability Card
     
     Declares an agent's identity, capabilities, and interface schema.
+    List-valued fields are stored as tuples (lists passed in are converted),
+    and capability checks use a frozenset built at construction; call
+    invalidate_cache() after reassigning fields on an existing card.
+    Equality and hashing use the canonical JSON, so duplicate cards from
+    different sources collapse in sets and dict keys.
     Used for:
     - Agent discovery and registration
     - Capability-based task routing
@@ -143,25 +246,79 @@ class AgentCard:
     version: str = "1.0.0"             # Agent version (semver)
     
     # Capabilities
-    capabilities: List[AgentCapability] = field(default_factory=list)
+    capabilities: Tuple[AgentCapability, ...] = ()
     
     # Schemas
     input_schema: InputSchema = field(default_factory=InputSchema)
     output_schema: OutputSchema = field(default_factory=OutputSchema)
     
     # Dependencies
-    depends_on: List[str] = field(default_factory=list)  # Agent names this depends on
+    depends_on: Tuple[str, ...] = ()  # Agent names this depends on
     
     # Metadata
-    tags: List[str] = field(default_factory=list)
+    tags: Tuple[str, ...] = ()
     metadata: Dict[str, Any] = field(default_factory=dict)
     
     # A2A Protocol fields
     url: Optional[str] = None          # Agent endpoint URL (for remote agents)
     authentication: Optional[str] = None  # Auth method (e.g., "oauth2", "api_key")
     
+    # Serialization caches; cards are treated as frozen once built
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _json_cache: Dict[Optional[int], str] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _cap_set: FrozenSet[AgentCapability] = field(default=frozenset(), init=False, repr=False, compare=False)
+    _canonical: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self.capabilities = tuple(self.capabilities)
+        self.depends_on = tuple(self.depends_on)
+        self.tags = tuple(self.tags)
+        self._cap_set = frozenset(self.capabilities)
+    
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to A2A-compatible JSON-LD format"""
+        """
+        Convert to A2A-compatible JSON-LD format
+        
+        The dict is built once and shared; treat it as read-only, and call
+        invalidate_cache() after mutating the card.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return self._dict_cache
+    
+    def invalidate_cache(self) -> None:
+        """Drop cached to_dict()/to_json() output after mutating the card"""
+        self._dict_cache = None
+        self._json_cache.clear()
+        self._cap_set = frozenset(self.capabilities)
+        self._canonical = None
+        self._hash = None
+        self.input_schema.invalidate_cache()
+        self.output_schema.invalidate_cache()
+    
+    def canonical_json(self) -> str:
+        """Compact, key-sorted JSON of to_dict(); identical cards give identical text"""
+        if self._canonical is None:
+            self._canonical = json.dumps(
+                self.to_dict(), sort_keys=True, separators=(",", ":"), default=str
+            )
+        return self._canonical
+    
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self.canonical_json())
+        return self._hash
+    
+    def __eq__(self, other: object) -> bool:
+        """Cards are equal when their canonical JSON matches (hash checked first)"""
+        if self is other:
+            return True
+        if not isinstance(other, AgentCard):
+            return NotImplemented
+        return hash(self) == hash(other) and self.canonical_json() == other.canonical_json()
+    
+    def _build_dict(self) -> Dict[str, Any]:
         return {
             "@context": "https://schema.org/",
             "@type": "SoftwareAgent",
@@ -172,22 +329,56 @@ class AgentCard:
             "capabilities": [c.value for c in self.capabilities],
             "inputSchema": self.input_schema.to_dict(),
             "outputSchema": self.output_schema.to_dict(),
-            "dependsOn": self.depends_on,
-            "tags": self.tags,
+            "dependsOn": list(self.depends_on),
+            "tags": list(self.tags),
             "metadata": self.metadata,
             "url": self.url,
             "authentication": self.authentication,
         }
     
+    def write_json(self, fp: TextIO) -> None:
+        """
+        Write to_dict() as single-line JSON to fp, field by field
+        
+        Produces the same text as ``to_json(indent=None)`` but skips the
+        intermediate dict, so serializing a card once (e.g. streaming many
+        cards to a file or socket) visits each field a single time.
+        """
+        encode = _json_encoder(None).encode
+        fp.write('{"@context": "https://schema.org/", "@type": "SoftwareAgent", "name": ')
+        fp.write(encode(self.name))
+        fp.write(', "displayName": ')
+        fp.write(encode(self.display_name))
+        fp.write(', "description": ')
+        fp.write(encode(self.description))
+        fp.write(', "version": ')
+        fp.write(encode(self.version))
+        fp.write(', "capabilities": ')
+        fp.write(encode([c.value for c in self.capabilities]))
+        fp.write(', "inputSchema": ')
+        self.input_schema.write_json(fp)
+        fp.write(', "outputSchema": ')
+        self.output_schema.write_json(fp)
+        fp.write(', "dependsOn": ')
+        fp.write(encode(self.depends_on))
+        fp.write(', "tags": ')
+        fp.write(encode(self.tags))
+        fp.write(', "metadata": ')
+        fp.write(encode(self.metadata))
+        fp.write(', "url": ')
+        fp.write(encode(self.url))
+        fp.write(', "authentication": ')
+        fp.write(encode(self.authentication))
+        fp.write("}")
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AgentCard":
         """Create from dictionary"""
-        capabilities = []
-        for cap in data.get("capabilities", []):
-            try:
-                capabilities.append(AgentCapability(cap))
-            except ValueError:
-                pass  # Skip unknown capabilities
+        # Unknown capabilities (e.g. from newer registries) are skipped
+        lookup = _CAPABILITY_BY_VALUE.get
+        capabilities = [
+            cap for cap in map(lookup, data.get("capabilities", ())) if cap is not None
+        ]
         
         return cls(
             name=data.get("name", ""),
@@ -204,179 +395,324 @@ class AgentCard:
             authentication=data.get("authentication"),
         )
     
-    def to_json(self, indent: int = 2) -> str:
-        """Serialize to JSON"""
-        return json.dumps(self.to_dict(), indent=indent)
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """
+        Serialize to JSON (cached per indent)
+        
+        ``indent=None`` gives compact output through the stdlib's C encoder;
+        indented output uses the slower pure-Python path, so it is the one
+        that benefits most from the cache. Compact output for a card whose
+        dict has not been built yet is streamed with write_json() instead.
+        """
+        encoded = self._json_cache.get(indent)
+        if encoded is None:
+            if indent is None and self._dict_cache is None:
+                buf = io.StringIO()
+                self.write_json(buf)
+                encoded = buf.getvalue()
+            else:
+                encoded = _json_encoder(indent).encode(self.to_dict())
+            self._json_cache[indent] = encoded
+        return encoded
     
     @classmethod
-    def from_json(cls, json_str: str) -> "AgentCard":
-        """Deserialize from JSON"""
-        return cls.from_dict(json.loads(json_str))
+    def from_json(cls, json_str: Union[str, bytes, bytearray]) -> "AgentCard":
+        """
+        Deserialize from JSON text or UTF-8 bytes (no separate decode step)
+        
+        Results are cached by the exact input, so repeated blobs return the
+        same shared instance; treat it as read-only or use from_json_copy().
+        """
+        if isinstance(json_str, bytearray):
+            return cls.from_dict(json.loads(json_str))
+        return _decode_card(cls, json_str)
+    
+    @classmethod
+    def from_json_copy(cls, json_str: Union[str, bytes, bytearray]) -> "AgentCard":
+        """Like from_json(), but return a private copy that is safe to mutate"""
+        return copy.deepcopy(cls.from_json(json_str))
     
     def has_capability(self, capability: AgentCapability) -> bool:
         """Check if agent has a specific capability"""
-        return capability in self.capabilities
+        return capability in self._cap_set
     
     def can_handle(self, required_capabilities: List[AgentCapability]) -> bool:
         """Check if agent can handle all required capabilities"""
-        return all(cap in self.capabilities for cap in required_capabilities)
+        return self._cap_set.issuperset(required_capabilities)
     
     def validate_input(self, data: Dict[str, Any]) -> List[str]:
         """Validate input data against schema"""
         return self.input_schema.validate(data)
 
 
-# Pre-defined agent cards for AI-Squad agents
-PM_CARD = AgentCard(
-    name="pm",
-    display_name="Product Manager",
-    description="Expert Product Manager specializing in PRDs, user stories, and requirements analysis",
-    version="1.0.0",
-    capabilities=[
-        AgentCapability.PRD_GENERATION,
-        AgentCapability.REQUIREMENTS_ANALYSIS,
-        AgentCapability.EPIC_BREAKDOWN,
-        AgentCapability.USER_STORY_CREATION,
-    ],
-    input_schema=InputSchema(
-        required_fields=["issue_number"],
-        optional_fields=["context", "requirements"],
-        field_types={"issue_number": "int", "context": "dict"},
-    ),
-    output_schema=OutputSchema(
-        artifacts=["docs/prd/PRD-{issue}.md"],
-        fields={"prd_path": "str", "user_stories": "list"},
-    ),
-    depends_on=[],
-    tags=["product", "requirements", "planning"],
-)
-
-ARCHITECT_CARD = AgentCard(
-    name="architect",
-    display_name="Software Architect",
-    description="Expert Software Architect specializing in system design, ADRs, and technical specifications",
-    version="1.0.0",
-    capabilities=[
-        AgentCapability.ADR_GENERATION,
-        AgentCapability.TECHNICAL_SPEC,
-        AgentCapability.API_DESIGN,
-        AgentCapability.SYSTEM_DESIGN,
-    ],
-    input_schema=InputSchema(
-        required_fields=["issue_number"],
-        optional_fields=["prd_path", "context"],
-        field_types={"issue_number": "int"},
-    ),
-    output_schema=OutputSchema(
-        artifacts=["docs/adr/ADR-{issue}.md", "docs/specs/SPEC-{issue}.md"],
-        fields={"adr_path": "str", "spec_path": "str"},
-    ),
-    depends_on=["pm"],
-    tags=["architecture", "design", "technical"],
-)
-
-ENGINEER_CARD = AgentCard(
-    name="engineer",
-    display_name="Software Engineer",
-    description="Expert Software Engineer specializing in implementation, testing, and code quality",
-    version="1.0.0",
-    capabilities=[
-        AgentCapability.CODE_GENERATION,
-        AgentCapability.CODE_IMPLEMENTATION,
-        AgentCapability.TEST_GENERATION,
-        AgentCapability.REFACTORING,
-        AgentCapability.BUG_FIX,
-    ],
-    input_schema=InputSchema(
-        required_fields=["issue_number"],
-        optional_fields=["spec_path", "adr_path", "context"],
-        field_types={"issue_number": "int"},
-    ),
-    output_schema=OutputSchema(
-        artifacts=["src/**/*.py", "tests/**/*.py"],
-        fields={"files_created": "list", "pr_number": "int"},
-    ),
-    depends_on=["pm", "architect"],
-    tags=["engineering", "implementation", "testing"],
-)
-
-UX_CARD = AgentCard(
-    name="ux",
-    display_name="UX Designer",
-    description="Expert UX Designer specializing in user flows, wireframes, and accessibility",
-    version="1.0.0",
-    capabilities=[
-        AgentCapability.WIREFRAME_GENERATION,
-        AgentCapability.USER_FLOW_DESIGN,
-        AgentCapability.PROTOTYPE_GENERATION,
-        AgentCapability.ACCESSIBILITY_REVIEW,
-    ],
-    input_schema=InputSchema(
-        required_fields=["issue_number"],
-        optional_fields=["prd_path", "context"],
-        field_types={"issue_number": "int"},
-    ),
-    output_schema=OutputSchema(
-        artifacts=["docs/ux/UX-{issue}.md", "docs/ux/prototypes/prototype-{issue}.html"],
-        fields={"ux_path": "str", "prototype_path": "str"},
-    ),
-    depends_on=["pm"],
-    tags=["ux", "design", "accessibility"],
-)
-
-REVIEWER_CARD = AgentCard(
-    name="reviewer",
-    display_name="Code Reviewer",
-    description="Expert Code Reviewer specializing in code quality, security, and performance",
-    version="1.0.0",
-    capabilities=[
-        AgentCapability.CODE_REVIEW,
-        AgentCapability.SECURITY_AUDIT,
-        AgentCapability.PERFORMANCE_REVIEW,
-        AgentCapability.DOCUMENTATION_REVIEW,
-    ],
-    input_schema=InputSchema(
-        required_fields=["pr_number"],
-        optional_fields=["context", "focus_areas"],
-        field_types={"pr_number": "int"},
-    ),
-    output_schema=OutputSchema(
-        artifacts=["docs/reviews/REVIEW-{pr}.md"],
-        fields={"review_path": "str", "approved": "bool"},
-    ),
-    depends_on=[],
-    tags=["review", "quality", "security"],
-)
-
-CAPTAIN_CARD = AgentCard(
-    name="captain",
-    display_name="Squad Captain",
-    description="Meta-agent that orchestrates other agents and manages workflows",
-    version="1.0.0",
-    capabilities=[
-        AgentCapability.TASK_COORDINATION,
-        AgentCapability.WORKFLOW_MANAGEMENT,
-        AgentCapability.AGENT_DELEGATION,
-    ],
-    input_schema=InputSchema(
-        required_fields=["mission"],
-        optional_fields=["agents", "strategy"],
-        field_types={"mission": "str"},
-    ),
-    output_schema=OutputSchema(
-        artifacts=[],
-        fields={"work_items": "list", "delegations": "list"},
-    ),
-    depends_on=[],
-    tags=["orchestration", "coordination", "meta-agent"],
-)
+@functools.lru_cache(maxsize=256)
+def _decode_card(cls: type, json_str: Union[str, bytes]) -> AgentCard:
+    return cls.from_dict(json.loads(json_str))
 
-# Default cards registry
-DEFAULT_AGENT_CARDS: Dict[str, AgentCard] = {
-    "pm": PM_CARD,
-    "architect": ARCHITECT_CARD,
-    "engineer": ENGINEER_CARD,
-    "ux": UX_CARD,
-    "reviewer": REVIEWER_CARD,
-    "captain": CAPTAIN_CARD,
+
+# Pre-defined agent cards for AI-Squad agents, built on first use
+def _make_pm_card() -> AgentCard:
+    return AgentCard(
+        name="pm",
+        display_name="Product Manager",
+        description="Expert Product Manager specializing in PRDs, user stories, and requirements analysis",
+        version="1.0.0",
+        capabilities=[
+            AgentCapability.PRD_GENERATION,
+            AgentCapability.REQUIREMENTS_ANALYSIS,
+            AgentCapability.EPIC_BREAKDOWN,
+            AgentCapability.USER_STORY_CREATION,
+        ],
+        input_schema=InputSchema(
+            required_fields=["issue_number"],
+            optional_fields=["context", "requirements"],
+            field_types={"issue_number": "int", "context": "dict"},
+        ),
+        output_schema=OutputSchema(
+            artifacts=["docs/prd/PRD-{issue}.md"],
+            fields={"prd_path": "str", "user_stories": "list"},
+        ),
+        depends_on=[],
+        tags=["product", "requirements", "planning"],
+    )
+
+
+def _make_architect_card() -> AgentCard:
+    return AgentCard(
+        name="architect",
+        display_name="Software Architect",
+        description="Expert Software Architect specializing in system design, ADRs, and technical specifications",
+        version="1.0.0",
+        capabilities=[
+            AgentCapability.ADR_GENERATION,
+            AgentCapability.TECHNICAL_SPEC,
+            AgentCapability.API_DESIGN,
+            AgentCapability.SYSTEM_DESIGN,
+        ],
+        input_schema=InputSchema(
+            required_fields=["issue_number"],
+            optional_fields=["prd_path", "context"],
+            field_types={"issue_number": "int"},
+        ),
+        output_schema=OutputSchema(
+            artifacts=["docs/adr/ADR-{issue}.md", "docs/specs/SPEC-{issue}.md"],
+            fields={"adr_path": "str", "spec_path": "str"},
+        ),
+        depends_on=["pm"],
+        tags=["architecture", "design", "technical"],
+    )
+
+
+def _make_engineer_card() -> AgentCard:
+    return AgentCard(
+        name="engineer",
+        display_name="Software Engineer",
+        description="Expert Software Engineer specializing in implementation, testing, and code quality",
+        version="1.0.0",
+        capabilities=[
+            AgentCapability.CODE_GENERATION,
+            AgentCapability.CODE_IMPLEMENTATION,
+            AgentCapability.TEST_GENERATION,
+            AgentCapability.REFACTORING,
+            AgentCapability.BUG_FIX,
+        ],
+        input_schema=InputSchema(
+            required_fields=["issue_number"],
+            optional_fields=["spec_path", "adr_path", "context"],
+            field_types={"issue_number": "int"},
+        ),
+        output_schema=OutputSchema(
+            artifacts=["src/**/*.py", "tests/**/*.py"],
+            fields={"files_created": "list", "pr_number": "int"},
+        ),
+        depends_on=["pm", "architect"],
+        tags=["engineering", "implementation", "testing"],
+    )
+
+
+def _make_ux_card() -> AgentCard:
+    return AgentCard(
+        name="ux",
+        display_name="UX Designer",
+        description="Expert UX Designer specializing in user flows, wireframes, and accessibility",
+        version="1.0.0",
+        capabilities=[
+            AgentCapability.WIREFRAME_GENERATION,
+            AgentCapability.USER_FLOW_DESIGN,
+            AgentCapability.PROTOTYPE_GENERATION,
+            AgentCapability.ACCESSIBILITY_REVIEW,
+        ],
+        input_schema=InputSchema(
+            required_fields=["issue_number"],
+            optional_fields=["prd_path", "context"],
+            field_types={"issue_number": "int"},
+        ),
+        output_schema=OutputSchema(
+            artifacts=["docs/ux/UX-{issue}.md", "docs/ux/prototypes/prototype-{issue}.html"],
+            fields={"ux_path": "str", "prototype_path": "str"},
+        ),
+        depends_on=["pm"],
+        tags=["ux", "design", "accessibility"],
+    )
+
+
+def _make_reviewer_card() -> AgentCard:
+    return AgentCard(
+        name="reviewer",
+        display_name="Code Reviewer",
+        description="Expert Code Reviewer specializing in code quality, security, and performance",
+        version="1.0.0",
+        capabilities=[
+            AgentCapability.CODE_REVIEW,
+            AgentCapability.SECURITY_AUDIT,
+            AgentCapability.PERFORMANCE_REVIEW,
+            AgentCapability.DOCUMENTATION_REVIEW,
+        ],
+        input_schema=InputSchema(
+            required_fields=["pr_number"],
+            optional_fields=["context", "focus_areas"],
+            field_types={"pr_number": "int"},
+        ),
+        output_schema=OutputSchema(
+            artifacts=["docs/reviews/REVIEW-{pr}.md"],
+            fields={"review_path": "str", "approved": "bool"},
+        ),
+        depends_on=[],
+        tags=["review", "quality", "security"],
+    )
+
+
+def _make_captain_card() -> AgentCard:
+    return AgentCard(
+        name="captain",
+        display_name="Squad Captain",
+        description="Meta-agent that orchestrates other agents and manages workflows",
+        version="1.0.0",
+        capabilities=[
+            AgentCapability.TASK_COORDINATION,
+            AgentCapability.WORKFLOW_MANAGEMENT,
+            AgentCapability.AGENT_DELEGATION,
+        ],
+        input_schema=InputSchema(
+            required_fields=["mission"],
+            optional_fields=["agents", "strategy"],
+            field_types={"mission": "str"},
+        ),
+        output_schema=OutputSchema(
+            artifacts=[],
+            fields={"work_items": "list", "delegations": "list"},
+        ),
+        depends_on=[],
+        tags=["orchestration", "coordination", "meta-agent"],
+    )
+
+# Module attribute -> DEFAULT_AGENT_CARDS key
+_CARD_ATTRS = {
+    "PM_CARD": "pm",
+    "ARCHITECT_CARD": "architect",
+    "ENGINEER_CARD": "engineer",
+    "UX_CARD": "ux",
+    "REVIEWER_CARD": "reviewer",
+    "CAPTAIN_CARD": "captain",
 }
+
+
+class _DefaultCards(Mapping):
+    """Read-only mapping of the default cards that builds each on first access"""
+    
+    _factories: Dict[str, Callable[[], AgentCard]] = {
+        "pm": _make_pm_card,
+        "architect": _make_architect_card,
+        "engineer": _make_engineer_card,
+        "ux": _make_ux_card,
+        "reviewer": _make_reviewer_card,
+        "captain": _make_captain_card,
+    }
+    
+    def __init__(self) -> None:
+        self._cards: Dict[str, AgentCard] = {}
+    
+    def __getitem__(self, name: str) -> AgentCard:
+        card = self._cards.get(name)
+        if card is None:
+            card = self._cards[name] = self._factories[name]()
+        return card
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._factories)
+    
+    def __len__(self) -> int:
+        return len(self._factories)
+    
+    def __contains__(self, name: object) -> bool:
+        return name in self._factories
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._factories)})"
+
+
+# Default cards registry
+DEFAULT_AGENT_CARDS: Mapping[str, AgentCard] = _DefaultCards()
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve PM_CARD etc., CAPABILITY_INDEX and DEFAULT_CARDS_MANIFEST_JSON
+    on first access (PEP 562)
+    """
+    if name in _CARD_ATTRS:
+        value: Any = DEFAULT_AGENT_CARDS[_CARD_ATTRS[name]]
+    elif name == "CAPABILITY_INDEX":
+        value = _capability_index()[0]
+    elif name == "DEFAULT_CARDS_MANIFEST_JSON":
+        value = _build_cards_manifest()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def _build_cards_manifest() -> bytes:
+    """Encode every default card as one JSON-LD CollectionPage, as UTF-8 bytes"""
+    manifest = {
+        "@context": "https://schema.org/",
+        "@type": "CollectionPage",
+        "itemListElement": [card.to_dict() for card in DEFAULT_AGENT_CARDS.values()],
+    }
+    return _json_encoder(None).encode(manifest).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=1)
+def _capability_index() -> Tuple[
+    Dict[AgentCapability, Tuple[AgentCard, ...]], Dict[AgentCapability, FrozenSet[str]]
+]:
+    """
+    Build capability -> default cards (in DEFAULT_AGENT_CARDS order) and
+    capability -> card names, constructing every default card once
+    """
+    index: Dict[AgentCapability, Tuple[AgentCard, ...]] = {}
+    names: Dict[AgentCapability, FrozenSet[str]] = {}
+    for card in DEFAULT_AGENT_CARDS.values():
+        for cap in card.capabilities:
+            index[cap] = index.get(cap, ()) + (card,)
+            names[cap] = names.get(cap, frozenset()) | {card.name}
+    return index, names
+
+
+def find_agents_for(capability: AgentCapability) -> Tuple[AgentCard, ...]:
+    """Return the default cards that declare a capability"""
+    return _capability_index()[0].get(capability, ())
+
+
+def find_agents_for_all(capabilities: Iterable[AgentCapability]) -> Tuple[AgentCard, ...]:
+    """Return the default cards that declare every given capability"""
+    capability_names = _capability_index()[1]
+    names: Optional[FrozenSet[str]] = None
+    for capability in capabilities:
+        matched = capability_names.get(capability, frozenset())
+        names = matched if names is None else names & matched
+        if not names:
+            return ()
+    if names is None:
+        return tuple(DEFAULT_AGENT_CARDS.values())
+    return tuple(card for card in DEFAULT_AGENT_CARDS.values() if card.name in names)
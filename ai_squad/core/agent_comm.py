@@ -4,15 +4,30 @@ Agent Communication Framework
 Enables inter-agent communication for clarifications and collaboration.
 Note: Leverages GitHub Copilot Chat window for interactive clarifications.
 """
-from typing import Dict, Any, Optional, List
+from typing import Deque, Dict, Any, Optional, List, Set, Tuple, TYPE_CHECKING
+import asyncio
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-import uuid
-import time
+import functools
+import inspect
 import logging
+import os
+import queue
+import string
+import sys
+import threading
+import time
+from types import ModuleType
 
 from ai_squad.core.events import RoutingEvent, StructuredEventEmitter
+from ai_squad.core.retry import AGENT_ROUTING_RETRY, CircuitState, RetryConfig, UnrecoverableHandlerError
+# Re-exported so handlers can signal transient failures
+from ai_squad.core.retry import RecoverableHandlerError  # noqa: F401
+
+if TYPE_CHECKING:
+    from ai_squad.core.agent_registry import AgentRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -25,10 +40,15 @@ class MessageType(Enum):
     CLARIFICATION = "clarification"
 
 
-@dataclass
+def _new_message_id() -> str:
+    """32 hex chars: nanosecond timestamp then 64 random bits, so ids sort by creation"""
+    return f"{time.time_ns():016x}{os.urandom(8).hex()}"
+
+
+@dataclass(slots=True)
 class AgentMessage:
-    """Message between agents"""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    """Message between agents (slotted; queues may hold many of these)"""
+    id: str = field(default_factory=_new_message_id)
     from_agent: str = ""
     to_agent: str = ""
     message_type: MessageType = MessageType.QUESTION
@@ -38,6 +58,29 @@ class AgentMessage:
     response_to: Optional[str] = None
     issue_number: Optional[int] = None
     
+    # Sorted context keys for routing telemetry, computed on first use
+    _context_keys: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+    # timestamp.isoformat(), computed on first serialization
+    _timestamp_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Agent names come from a small vocabulary; messages loaded from
+        # storage or JSON share one string object per name this way
+        self.from_agent = sys.intern(self.from_agent)
+        self.to_agent = sys.intern(self.to_agent)
+    
+    def context_keys(self) -> Tuple[str, ...]:
+        """Sorted context keys, cached since a message emits several routing events"""
+        if self._context_keys is None:
+            self._context_keys = tuple(sorted(self.context)) if self.context else ()
+        return self._context_keys
+    
+    def timestamp_iso(self) -> str:
+        """ISO-8601 timestamp, formatted once for to_dict() and storage"""
+        if self._timestamp_iso is None:
+            self._timestamp_iso = self.timestamp.isoformat()
+        return self._timestamp_iso
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return {
@@ -47,12 +90,120 @@ class AgentMessage:
             "message_type": self.message_type.value,
             "content": self.content,
             "context": self.context,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_iso(),
             "response_to": self.response_to,
             "issue_number": self.issue_number,
         }
 
 
+@functools.lru_cache(maxsize=1)
+def _registry_module() -> ModuleType:
+    """agent_registry, imported on first routed message rather than at import"""
+    from ai_squad.core import agent_registry
+    return agent_registry
+
+
+@functools.lru_cache(maxsize=None)
+def _agent_title(name: str) -> str:
+    """Display form of an agent name (e.g. "pm" -> "Pm"), computed once per name"""
+    return name.title()
+
+
+def _comment_fields(message: AgentMessage) -> Dict[str, Any]:
+    """Template fields describing a message for the GitHub comment templates"""
+    return {
+        "from_agent": _agent_title(message.from_agent),
+        "to_agent": _agent_title(message.to_agent),
+        "from_agent_name": message.from_agent,
+        "content": message.content,
+        "issue_number": message.issue_number,
+        "message_id": message.id,
+        "timestamp": message.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+
+
+# How long the background poster waits to merge further comments into a batch
+COMMENT_COALESCE_SECONDS = 0.5
+
+# Queued by close() to stop the background poster after it drains the queue
+_STOP_POSTER = object()
+
+
+# GitHub comment templates, rendered from _comment_fields() by the posting helpers
+_USER_CLARIFICATION_COMMENT = """NOTE: **Clarification Needed**
+
+**From**: {from_agent} Agent  
+**Question**: {content}
+
+**To respond**: 
+1. Open this issue in VS Code
+2. Use GitHub Copilot Chat (`Ctrl+Shift+I` or `Cmd+Shift+I`)
+3. Type: `@workspace respond to {from_agent_name} agent for issue #{issue_number}`
+4. Provide your answer
+
+*Message ID: `{message_id}`*
+"""
+
+_AUTOMATED_REQUEST_COMMENT = """AUTO: **Agent Communication (Automated Mode)**
+
+**From**: {from_agent} Agent  
+**To**: {to_agent} Agent  
+**Question**: {content}
+
+*This will be handled automatically by the target agent in watch mode.*
+
+*Message ID: `{message_id}`*
+*Timestamp: {timestamp}*
+"""
+
+_MANUAL_REQUEST_COMMENT = """NOTE: **Clarification Needed (Manual Mode)**
+
+**From**: {from_agent} Agent  
+**Question**: {content}
+
+**To respond**:  
+1. Open this issue in VS Code
+2. Use GitHub Copilot Chat (`Ctrl+Shift+I` or `Cmd+Shift+I`)
+3. Type: `@workspace respond to {from_agent_name} agent for issue #{issue_number}`
+4. Provide your answer
+
+*Message ID: `{message_id}`*
+*Timestamp: {timestamp}*
+"""
+
+_RESPONSE_COMMENT = """NOTE: **Agent Response**
+
+**From**: {from_agent} Agent  
+**In Response To**: {to_agent} Agent  
+**Answer**: {content}
+
+*Original Question: {question}*  
+*Message ID: `{message_id}`*  
+*Timestamp: {timestamp}*
+"""
+
+
+def _compile_comment(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Split a comment template into (literal, field name) pairs once, at import"""
+    return tuple((literal, name) for literal, name, _, _ in string.Formatter().parse(template))
+
+
+def _render_comment(parts: Tuple[Tuple[str, Optional[str]], ...], fields: Dict[str, Any]) -> str:
+    """Join precompiled template parts; faster than re-parsing with str.format()"""
+    out = []
+    for literal, name in parts:
+        out.append(literal)
+        if name is not None:
+            out.append(str(fields[name]))
+    return "".join(out)
+
+
+_USER_CLARIFICATION_PARTS = _compile_comment(_USER_CLARIFICATION_COMMENT)
+_AUTOMATED_REQUEST_PARTS = _compile_comment(_AUTOMATED_REQUEST_COMMENT)
+_MANUAL_REQUEST_PARTS = _compile_comment(_MANUAL_REQUEST_COMMENT)
+_RESPONSE_PARTS = _compile_comment(_RESPONSE_COMMENT)
+
+
 class AgentCommunicator:
     """
     Handles inter-agent communication
@@ -60,9 +211,23 @@ class AgentCommunicator:
     Supports two modes:
     - Automated Mode: Agent-to-agent clarifications (e.g., Architect asks PM)
     - Manual Mode: User-to-agent clarifications via GitHub Copilot Chat
+    
+    Messages are indexed by id, recipient and issue as they are recorded,
+    so lookups do not scan message_queue; messages appended to the queue
+    directly are kept in history but not indexed. ask() and respond() are
+    safe to call from several threads (e.g. handlers run via to_thread).
     """
     
-    def __init__(self, github_tool=None, execution_mode: str = "manual", event_emitter: Optional[StructuredEventEmitter] = None):
+    def __init__(
+        self,
+        github_tool=None,
+        execution_mode: str = "manual",
+        event_emitter: Optional[StructuredEventEmitter] = None,
+        retry_config: Optional[RetryConfig] = None,
+        max_queued: int = 10_000,
+        registry: Optional["AgentRegistry"] = None,
+        background_comments: bool = False,
+    ):
         """
         Initialize communicator
         
@@ -70,12 +235,73 @@ class AgentCommunicator:
             github_tool: GitHub tool for storing messages as issue comments
             execution_mode: "automated" (watch mode) or "manual" (CLI)
             event_emitter: Optional structured event emitter for routing telemetry
+            retry_config: Handler retry policy (defaults to AGENT_ROUTING_RETRY,
+                exponential backoff with jitter)
+            max_queued: Messages kept in history; the oldest are evicted
+                (with their index entries and responses) beyond this
+            registry: Agent registry to route through; defaults to the
+                global registry, looked up when a message is routed
+            background_comments: Post GitHub comments from a daemon thread,
+                merging consecutive comments on the same issue; call
+                close() before exiting so queued comments are not lost
         """
         self.github = github_tool
         self.execution_mode = execution_mode
-        self.message_queue: List[AgentMessage] = []
+        self.message_queue: Deque[AgentMessage] = deque(maxlen=max_queued)
         self.responses: Dict[str, str] = {}
         self.event_emitter = event_emitter or StructuredEventEmitter()
+        self.retry_config = retry_config or AGENT_ROUTING_RETRY
+        self._registry = registry
+        
+        # Lookup indexes over message_queue, maintained by _record(); the lock
+        # covers only queue/index updates and copies, never GitHub or routing I/O
+        self._lock = threading.Lock()
+        self._by_id: Dict[str, AgentMessage] = {}
+        self._pending_by_agent: Dict[str, Dict[str, AgentMessage]] = defaultdict(dict)
+        self._by_issue: Dict[int, Deque[AgentMessage]] = defaultdict(deque)
+        
+        # Routing tasks scheduled by ask() when called inside an event loop
+        self._routing_tasks: Set[asyncio.Task] = set()
+        
+        # Background comment poster (started on first comment when enabled)
+        self.background_comments = background_comments
+        self._comment_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._comment_thread: Optional[threading.Thread] = None
+        self._comments_pending = 0
+        self._comments_done = threading.Condition()
+    
+    def _record(self, message: AgentMessage) -> None:
+        """Append a message to the queue and update the lookup indexes"""
+        with self._lock:
+            self._record_locked(message)
+    
+    def _record_locked(self, message: AgentMessage) -> None:
+        history = self.message_queue
+        if history.maxlen is not None and len(history) == history.maxlen:
+            self._forget(history[0])
+        history.append(message)
+        self._by_id[message.id] = message
+        if message.message_type is MessageType.QUESTION:
+            self._pending_by_agent[message.to_agent][message.id] = message
+        if message.issue_number is not None:
+            self._by_issue[message.issue_number].append(message)
+    
+    def _forget(self, message: AgentMessage) -> None:
+        """Drop index entries for a message about to be evicted (lock held)"""
+        if self._by_id.get(message.id) is message:
+            del self._by_id[message.id]
+        self.responses.pop(message.id, None)
+        pending = self._pending_by_agent.get(message.to_agent)
+        if pending:
+            pending.pop(message.id, None)
+            if not pending:
+                del self._pending_by_agent[message.to_agent]
+        conversation = self._by_issue.get(message.issue_number)
+        if conversation and conversation[0] is message:
+            # The oldest queued message is also the oldest of its issue
+            conversation.popleft()
+            if not conversation:
+                del self._by_issue[message.issue_number]
     
     def ask(
         self,
@@ -112,7 +338,7 @@ class AgentCommunicator:
         )
         
         # Store message
-        self.message_queue.append(message)
+        self._record(message)
         self._emit_routing_event(
             message,
             status="accepted",
@@ -126,8 +352,15 @@ class AgentCommunicator:
         # Route based on execution mode
         if self.execution_mode == "automated":
             # Automated mode: Agent-to-agent communication
-            # For agent-to-agent, route the message
-            self._route_message(message)
+            # Inside an event loop, route in the background instead of blocking it
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self._route_message(message)
+            else:
+                task = loop.create_task(self._aroute_message(message))
+                self._routing_tasks.add(task)
+                task.add_done_callback(self._routing_tasks.discard)
         else:
             # Manual mode: Agent-to-user via GitHub Copilot Chat
             self._request_user_clarification(message)
@@ -152,28 +385,28 @@ class AgentCommunicator:
         Returns:
             True if successful
         """
-        # Find original message
-        original = next(
-            (m for m in self.message_queue if m.id == message_id),
-            None
-        )
-        
-        if not original:
-            return False
-        
-        # Create response message
-        response_msg = AgentMessage(
-            from_agent=agent,
-            to_agent=original.from_agent,
-            message_type=MessageType.RESPONSE,
-            content=response,
-            context=original.context,
-            response_to=message_id,
-            issue_number=original.issue_number
-        )
-        
-        self.message_queue.append(response_msg)
-        self.responses[message_id] = response
+        with self._lock:
+            original = self._by_id.get(message_id)
+            
+            if not original:
+                return False
+            
+            # Create response message
+            response_msg = AgentMessage(
+                from_agent=agent,
+                to_agent=original.from_agent,
+                message_type=MessageType.RESPONSE,
+                content=response,
+                context=original.context,
+                response_to=message_id,
+                issue_number=original.issue_number
+            )
+            
+            self._record_locked(response_msg)
+            self.responses[message_id] = response
+            pending = self._pending_by_agent.get(original.to_agent)
+            if pending:
+                pending.pop(message_id, None)
         
         # Post response to GitHub
         if self.github and original.issue_number:
@@ -191,12 +424,9 @@ class AgentCommunicator:
         Returns:
             List of pending questions
         """
-        return [
-            msg for msg in self.message_queue
-            if msg.to_agent == agent
-            and msg.message_type == MessageType.QUESTION
-            and msg.id not in self.responses
-        ]
+        with self._lock:
+            pending = self._pending_by_agent.get(agent)
+            return list(pending.values()) if pending else []
     
     def get_conversation(self, issue_number: int) -> List[AgentMessage]:
         """
@@ -208,17 +438,26 @@ class AgentCommunicator:
         Returns:
             List of messages
         """
-        return [
-            msg for msg in self.message_queue
-            if msg.issue_number == issue_number
-        ]
+        with self._lock:
+            return list(self._by_issue.get(issue_number, ()))
     
     def _route_message(self, message: AgentMessage) -> Optional[str]:
+        """Synchronous wrapper around _aroute_message for callers without a loop"""
+        return asyncio.run(self._aroute_message(message))
+    
+    async def _aroute_message(self, message: AgentMessage) -> Optional[str]:
         """
         Route message to target agent using AgentRegistry.
         
         A2A-aligned: Uses capability-based routing when available.
-        Includes retry logic with exponential backoff and circuit breaker.
+        Includes retry logic with jittered exponential backoff (see
+        retry_config) and circuit breaker. Only exceptions listed in
+        retry_config.retryable_exceptions are retried; any other error, or
+        UnrecoverableHandlerError, rejects the message immediately without
+        counting against the circuit breaker. Backoff waits with
+        asyncio.sleep, and sync handlers run in a worker thread, so retries
+        never block the event loop. When the breaker is half-open a single
+        caller sends one probe (status "probe"); others see it as open.
         
         Args:
             message: Message to route
@@ -226,22 +465,26 @@ class AgentCommunicator:
         Returns:
             Response or None if async/unavailable
         """
-        from ai_squad.core.agent_registry import get_registry
-        
-        registry = get_registry()
+        registry = self._registry
+        if registry is None:
+            # Resolved through the module each call, so reset_registry() is honoured
+            registry = _registry_module().get_registry()
         
         # Check if target agent has a registered handler
         handler = registry.get_handler(message.to_agent)
         
         if handler:
             # Invoke with retry logic
-            max_retries = 3
-            base_delay = 1.0  # seconds
+            max_retries = self.retry_config.max_attempts
             
             for attempt in range(max_retries):
+                probing = False
                 try:
-                    # Check circuit breaker
-                    if registry.is_circuit_open(message.to_agent):
+                    # Check circuit breaker; half-open allows one probe call
+                    state = registry.circuit_state(message.to_agent)
+                    if state is CircuitState.HALF_OPEN:
+                        probing = registry.begin_probe(message.to_agent)
+                    if state is CircuitState.OPEN or (state is CircuitState.HALF_OPEN and not probing):
                         logger.warning(
                             "Circuit breaker open for %s, skipping",
                             message.to_agent
@@ -252,14 +495,25 @@ class AgentCommunicator:
                             reason="agent_unavailable",
                         )
                         return None
+                    if probing:
+                        logger.info("Circuit half-open for %s, sending probe", message.to_agent)
+                        self._emit_routing_event(
+                            message,
+                            status="probe",
+                            reason="circuit_half_open",
+                        )
                     
-                    result = handler({
+                    payload = {
                         "message_id": message.id,
                         "from_agent": message.from_agent,
                         "content": message.content,
                         "context": message.context,
                         "issue_number": message.issue_number,
-                    })
+                    }
+                    if inspect.iscoroutinefunction(handler):
+                        result = await handler(payload)
+                    else:
+                        result = await asyncio.to_thread(handler, payload)
                     
                     # Success - reset circuit breaker
                     registry.record_success(message.to_agent)
@@ -276,17 +530,32 @@ class AgentCommunicator:
                     return str(result) if result else None
                     
                 except Exception as e:
-                    # Record failure for circuit breaker
+                    if (isinstance(e, UnrecoverableHandlerError)
+                            or not isinstance(e, self.retry_config.retryable_exceptions)):
+                        # Permanent failure - retrying cannot help
+                        if probing:
+                            registry.end_probe(message.to_agent)
+                        logger.error(
+                            "Handler failed with unrecoverable error: %s", e
+                        )
+                        self._emit_routing_event(
+                            message,
+                            status="rejected",
+                            reason=f"unrecoverable_error: {e}",
+                        )
+                        return None
+                    
+                    # Record failure for circuit breaker (a failed probe reopens it)
                     registry.record_failure(message.to_agent)
                     
-                    if attempt < max_retries - 1:
-                        # Exponential backoff
-                        delay = base_delay * (2 ** attempt)
+                    if attempt < max_retries - 1 and not probing:
+                        # Exponential backoff, jittered to spread concurrent retries
+                        delay = self.retry_config.get_delay(attempt)
                         logger.warning(
                             "Handler failed (attempt %d/%d): %s. Retrying in %.1fs",
                             attempt + 1, max_retries, e, delay
                         )
-                        time.sleep(delay)
+                        await asyncio.sleep(delay)
                     else:
                         # Final attempt failed
                         logger.error(
@@ -341,7 +610,7 @@ class AgentCommunicator:
             message_id=message.id,
             issue_number=message.issue_number,
             reason=reason,
-            metadata={"context_keys": sorted(message.context.keys()) if message.context else []},
+            metadata={"context_keys": message.context_keys()},
         )
         self.event_emitter.emit_routing(event)
     
@@ -357,76 +626,117 @@ class AgentCommunicator:
         """
         # Post a comment suggesting the user respond via Copilot Chat
         if self.github and message.issue_number:
-            comment = f"""NOTE: **Clarification Needed**
-
-**From**: {message.from_agent.title()} Agent  
-**Question**: {message.content}
-
-**To respond**: 
-1. Open this issue in VS Code
-2. Use GitHub Copilot Chat (`Ctrl+Shift+I` or `Cmd+Shift+I`)
-3. Type: `@workspace respond to {message.from_agent} agent for issue #{message.issue_number}`
-4. Provide your answer
-
-*Message ID: `{message.id}`*
-"""
-            self.github.add_comment(message.issue_number, comment)
+            comment = _render_comment(_USER_CLARIFICATION_PARTS, _comment_fields(message))
+            self._add_comment(message.issue_number, comment)
         
         return None
     
+    def _add_comment(self, issue_number: int, body: str) -> None:
+        """Post a comment now, or hand it to the background poster"""
+        if not self.background_comments:
+            self.github.add_comment(issue_number, body)
+            return
+        
+        with self._comments_done:
+            self._comments_pending += 1
+            if self._comment_thread is None:
+                self._comment_thread = threading.Thread(
+                    target=self._comment_worker,
+                    daemon=True,
+                    name="AgentCommentPoster",
+                )
+                self._comment_thread.start()
+        self._comment_queue.put((issue_number, body))
+    
+    def _comment_worker(self) -> None:
+        """Post queued comments, merging runs on the same issue into one call"""
+        stopping = False
+        while not stopping:
+            item = self._comment_queue.get()
+            if item is _STOP_POSTER:
+                return
+            batch = [item]
+            deadline = time.monotonic() + COMMENT_COALESCE_SECONDS
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    item = self._comment_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP_POSTER:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            merged: List[Tuple[int, List[str]]] = []
+            for issue_number, body in batch:
+                if merged and merged[-1][0] == issue_number:
+                    merged[-1][1].append(body)
+                else:
+                    merged.append((issue_number, [body]))
+            
+            for issue_number, bodies in merged:
+                try:
+                    self.github.add_comment(issue_number, "\n---\n\n".join(bodies))
+                except Exception as e:
+                    logger.warning("Failed to post comment on #%s: %s", issue_number, e)
+            
+            with self._comments_done:
+                self._comments_pending -= len(batch)
+                self._comments_done.notify_all()
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued background comments to be posted
+        
+        Returns:
+            True if nothing is left pending, False on timeout
+        """
+        with self._comments_done:
+            return self._comments_done.wait_for(
+                lambda: self._comments_pending == 0, timeout=timeout
+            )
+    
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Post any queued background comments and stop the poster thread
+        
+        A later comment starts a fresh poster thread.
+        
+        Returns:
+            True if the poster exited, False on timeout
+        """
+        with self._comments_done:
+            thread, self._comment_thread = self._comment_thread, None
+        if thread is None:
+            return True
+        self._comment_queue.put(_STOP_POSTER)
+        thread.join(timeout)
+        return not thread.is_alive()
+    
     def _post_clarification_request(self, message: AgentMessage):
         """Post clarification request to GitHub"""
-        if not message.issue_number:
+        if not self.github or not message.issue_number:
             return
         
         if self.execution_mode == "automated":
             # Agent-to-agent in automated mode
-            comment = f"""AUTO: **Agent Communication (Automated Mode)**
-
-**From**: {message.from_agent.title()} Agent  
-**To**: {message.to_agent.title()} Agent  
-**Question**: {message.content}
-
-*This will be handled automatically by the target agent in watch mode.*
-
-*Message ID: `{message.id}`*
-*Timestamp: {message.timestamp.strftime('%Y-%m-%d %H:%M:%S')}*
-"""
+            comment = _render_comment(_AUTOMATED_REQUEST_PARTS, _comment_fields(message))
         else:
             # Agent-to-user in manual mode
-            comment = f"""NOTE: **Clarification Needed (Manual Mode)**
-
-**From**: {message.from_agent.title()} Agent  
-**Question**: {message.content}
-
-**To respond**:  
-1. Open this issue in VS Code
-2. Use GitHub Copilot Chat (`Ctrl+Shift+I` or `Cmd+Shift+I`)
-3. Type: `@workspace respond to {message.from_agent} agent for issue #{message.issue_number}`
-4. Provide your answer
-
-*Message ID: `{message.id}`*
-*Timestamp: {message.timestamp.strftime('%Y-%m-%d %H:%M:%S')}*
-"""
+            comment = _render_comment(_MANUAL_REQUEST_PARTS, _comment_fields(message))
         
-        self.github.add_comment(message.issue_number, comment)
+        self._add_comment(message.issue_number, comment)
     
     def _post_response(self, response: AgentMessage, original: AgentMessage):
         """Post response to GitHub"""
-        if not response.issue_number:
+        if not self.github or not response.issue_number:
             return
         
-        comment = f"""NOTE: **Agent Response**
-
-**From**: {response.from_agent.title()} Agent  
-**In Response To**: {original.from_agent.title()} Agent  
-**Answer**: {response.content}
-
-*Original Question: {original.content}*  
-*Message ID: `{response.id}`*  
-*Timestamp: {response.timestamp.strftime('%Y-%m-%d %H:%M:%S')}*
-"""
-        self.github.add_comment(response.issue_number, comment)
+        fields = _comment_fields(response)
+        fields["to_agent"] = _agent_title(original.from_agent)
+        fields["question"] = original.content
+        comment = _render_comment(_RESPONSE_PARTS, fields)
+        self._add_comment(response.issue_number, comment)
 
 
 class ClarificationMixin:
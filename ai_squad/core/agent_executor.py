@@ -4,10 +4,13 @@ Agent Executor
 Executes agents using GitHub Copilot SDK as the primary choice.
 Falls back to template-based generation if SDK is not available.
 """
+import asyncio
+from functools import lru_cache
 import os
 import logging
 import warnings
-from typing import Dict, Any, Optional
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
 
 from ai_squad.agents.base import InvalidIssueNumberError, SDKExecutionError
 
@@ -28,13 +31,55 @@ from ai_squad.core.worker_lifecycle import WorkerLifecycleManager
 from ai_squad.core.signal import SignalManager
 from ai_squad.core.handoff import HandoffManager
 from ai_squad.core.delegation import DelegationManager
-from ai_squad.core.router import OrgRouter, PolicyRule, HealthConfig
+from ai_squad.core.router import Candidate, OrgRouter, PolicyRule, HealthConfig
 from ai_squad.core.reporting import ReportManager
-from ai_squad.core.validation import validate_agent_execution, PrerequisiteError
+from ai_squad.core.validation import (
+    validate_agent_execution,
+    validate_agent_execution_bulk,
+    AgentType,
+    PrerequisiteError,
+    PrerequisiteValidator,
+    ValidationResult,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _prerequisite_mtimes(agent_type: str, workspace_root: Path) -> Tuple[int, ...]:
+    """
+    mtimes of the directories holding an agent's prerequisite documents
+    
+    Creating or deleting a PRD/ADR/SPEC file bumps its directory's mtime, so
+    this tuple changes whenever a validation result could change.
+    """
+    mtimes = []
+    for prereq_type in PrerequisiteValidator.DEPENDENCIES.get(AgentType(agent_type), []):
+        pattern = PrerequisiteValidator.PREREQUISITE_REGISTRY[prereq_type].path_pattern
+        if not pattern:
+            continue
+        try:
+            mtimes.append((workspace_root / pattern).parent.stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(0)
+    return tuple(mtimes)
+
+
+@lru_cache(maxsize=512)
+def _validate_cached(
+    agent_type: str,
+    issue_number: int,
+    workspace_str: str,
+    mtimes: Tuple[int, ...],
+) -> ValidationResult:
+    """Non-strict validate_agent_execution, memoized per prerequisite directory state"""
+    return validate_agent_execution(
+        agent_type=agent_type,
+        issue_number=issue_number,
+        workspace_root=Path(workspace_str),
+        strict=False,
+    )
+
+
 class AgentExecutionError(RuntimeError):
     """Raised when agent execution fails"""
 
@@ -61,6 +106,12 @@ class AgentExecutor:
         """Initialize agent executor with optional injected managers."""
         self.config = config or Config.load(config_path)
         
+        # Event loop reused by the sync execute_strategy/execute_convoy wrappers
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Convoy concurrency guard, bound to whichever loop first uses it
+        self._convoy_sem: Optional[asyncio.Semaphore] = None
+        self._convoy_sem_loop: Optional[asyncio.AbstractEventLoop] = None
+        
         # Check for GitHub CLI OAuth authentication (only method supported)
         self.has_gh_oauth = self._check_gh_oauth()
         
@@ -118,7 +169,6 @@ class AgentExecutor:
             )
         
         # NEW: Create shared orchestration managers FIRST (single source of truth)
-        from pathlib import Path
         workspace_root = Path(getattr(self.config, "workspace_root", Path.cwd()))
         self.workstate_mgr = workstate_manager or WorkStateManager(
             workspace_root=workspace_root,
@@ -159,6 +209,14 @@ class AgentExecutor:
             workspace_root=workspace_root,
             config=self.config.data,
         )
+        self.max_concurrency = max(1, int(routing_cfg.get("max_concurrency", 8)))
+        # CLI routing settings, resolved once rather than on every execute()
+        self._enforce_cli = bool(routing_cfg.get("enforce_cli_routing", False))
+        self._default_candidate_kwargs = {
+            "trust_level": routing_cfg.get("trust_level", "high"),
+            "data_sensitivity": routing_cfg.get("data_sensitivity", "internal"),
+        }
+        self._default_priority = routing_cfg.get("priority", "normal")
         
         # Async agent executor for convoy with error handling
         async def _async_agent_executor(agent_type: str, work_item_id: str, **_: Any) -> str:
@@ -168,7 +226,9 @@ class AgentExecutor:
                 if not work_item or not work_item.issue_number:
                     raise ValueError(f"Work item {work_item_id} has no issue number")
                 
-                result = self.execute(agent_type, work_item.issue_number)
+                # Run the blocking agent call off the loop so convoy members overlap
+                async with self._convoy_semaphore():
+                    result = await asyncio.to_thread(self.execute, agent_type, work_item.issue_number)
                 if not result.get("success"):
                     raise RuntimeError(result.get("error", "Unknown error"))
                 
@@ -225,7 +285,6 @@ class AgentExecutor:
     def _detect_vscode_copilot_session() -> Optional[str]:
         """Detect VS Code Copilot session ID (includes enterprise license info)"""
         try:
-            import os
             # Check VS Code Copilot Chat workspace sessions
             vscode_storage = os.path.expanduser(
                 r"~\AppData\Roaming\Code\User\globalStorage\github.copilot-chat"
@@ -280,16 +339,17 @@ class AgentExecutor:
         # Skip validation for Captain (meta-agent coordinator) and PM (no prerequisites)
         if agent_type not in ["captain", "pm"]:
             try:
-                from pathlib import Path
                 workspace_root = Path(getattr(self.config, "workspace_root", Path.cwd()))
                 
                 logger.info("Validating prerequisites for %s (issue=%s)", agent_type, issue_number)
-                validate_agent_execution(
-                    agent_type=agent_type,
-                    issue_number=issue_number,
-                    workspace_root=workspace_root,
-                    strict=True  # Raise exception if validation fails
+                result = _validate_cached(
+                    agent_type,
+                    issue_number,
+                    str(workspace_root),
+                    _prerequisite_mtimes(agent_type, workspace_root),
                 )
+                if not result.valid:
+                    raise PrerequisiteError(AgentType(agent_type), result.missing_prerequisites, issue_number)
                 logger.info("Prerequisites validated successfully for %s", agent_type)
                 
             except PrerequisiteError as e:
@@ -305,76 +365,167 @@ class AgentExecutor:
                 # Unexpected validation error - log but don't block
                 logger.warning("Prerequisite validation encountered error (non-blocking): %s", e)
         
-        if self.org_router and agent_type != "captain":
-            enforce_cli = self.orchestration.get("routing_config", {}).get("enforce_cli_routing", False)
-            if enforce_cli:
-                from ai_squad.core.router import Candidate
-
-                candidate = Candidate(
-                    name=agent_type,
-                    capability_tags=[agent_type],
-                    trust_level=self.orchestration.get("routing_config", {}).get("trust_level", "high"),
-                    data_sensitivity=self.orchestration.get("routing_config", {}).get("data_sensitivity", "internal"),
-                )
-                chosen = self.org_router.route(
-                    candidates=[candidate],
-                    requested_capability_tags=[agent_type],
-                    data_sensitivity=candidate.data_sensitivity,
-                    trust_level=candidate.trust_level,
-                    priority=self.orchestration.get("routing_config", {}).get("priority", "normal"),
-                    metadata={"issue_number": issue_number, "origin": "cli"},
-                )
-                if not chosen:
-                    return {
-                        "success": False,
-                        "error": "Routing policy blocked this agent",
-                        "using_sdk": self.using_sdk,
-                    }
+        return self._execute_validated(agent_type, issue_number)
+    
+    def _execute_validated(self, agent_type: str, issue_number: int) -> Dict[str, Any]:
+        """Route and run an agent whose prerequisites have already been checked"""
+        if self._enforce_cli and self.org_router and agent_type != "captain":
+            candidate = Candidate(
+                name=agent_type,
+                capability_tags=[agent_type],
+                **self._default_candidate_kwargs,
+            )
+            chosen = self.org_router.route(
+                candidates=[candidate],
+                requested_capability_tags=[agent_type],
+                data_sensitivity=candidate.data_sensitivity,
+                trust_level=candidate.trust_level,
+                priority=self._default_priority,
+                metadata={"issue_number": issue_number, "origin": "cli"},
+            )
+            if not chosen:
+                return {
+                    "success": False,
+                    "error": "Routing policy blocked this agent",
+                    "using_sdk": self.using_sdk,
+                }
 
         agent = self.agents[agent_type]
-        worker = self.worker_lifecycle.spawn(agent_type=agent_type, issue_number=issue_number)
         
-        try:
-            result = agent.execute(issue_number)
-            # Add SDK usage info to result
-            result["using_sdk"] = self.using_sdk
-            if not self.using_sdk:
-                result["notice"] = (
-                    "Generated using template-based fallback. "
-                    "Install github-copilot-sdk for AI-powered generation."
-                )
-            self.worker_lifecycle.complete(worker.id)
-            return result
+        with self.worker_lifecycle.session(agent_type=agent_type, issue_number=issue_number) as worker:
+            try:
+                result = agent.execute(issue_number)
+                # Add SDK usage info to result
+                result["using_sdk"] = self.using_sdk
+                if not self.using_sdk:
+                    result["notice"] = (
+                        "Generated using template-based fallback. "
+                        "Install github-copilot-sdk for AI-powered generation."
+                    )
+                return result
+                
+            except InvalidIssueNumberError as e:
+                logger.error("Invalid issue number: %s", e)
+                worker.mark_failed(str(e))
+                return {
+                    "success": False,
+                    "error": f"Invalid issue number: {e}",
+                    "using_sdk": self.using_sdk
+                }
+            except SDKExecutionError as e:
+                logger.error("SDK execution failed: %s", e)
+                worker.mark_failed(str(e))
+                return {
+                    "success": False,
+                    "error": f"SDK error: {e}",
+                    "using_sdk": self.using_sdk
+                }
+            except (ValueError, KeyError, IOError, OSError) as e:
+                logger.error("Agent execution failed: %s", e)
+                worker.mark_failed(str(e))
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "using_sdk": self.using_sdk
+                }
+    
+    def execute_batch(
+        self,
+        jobs: List[Tuple[str, int]],
+        max_concurrency: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute many (agent_type, issue_number) jobs concurrently
+        
+        Args:
+            jobs: Pairs of agent type and GitHub issue number
+            max_concurrency: Max agents running at once (defaults to routing.max_concurrency)
             
-        except InvalidIssueNumberError as e:
-            logger.error("Invalid issue number: %s", e)
-            self.worker_lifecycle.fail(worker.id, str(e))
-            return {
-                "success": False,
-                "error": f"Invalid issue number: {e}",
-                "using_sdk": self.using_sdk
-            }
-        except SDKExecutionError as e:
-            logger.error("SDK execution failed: %s", e)
-            self.worker_lifecycle.fail(worker.id, str(e))
-            return {
-                "success": False,
-                "error": f"SDK error: {e}",
-                "using_sdk": self.using_sdk
-            }
-        except (ValueError, KeyError, IOError, OSError) as e:
-            logger.error("Agent execution failed: %s", e)
-            self.worker_lifecycle.fail(worker.id, str(e))
-            return {
-                "success": False,
-                "error": str(e),
-                "using_sdk": self.using_sdk
-            }
+        Returns:
+            One result dict per job, in the same order as jobs
+        """
+        return self._run(self.aexecute_batch(jobs, max_concurrency))
+    
+    async def aexecute_batch(
+        self,
+        jobs: List[Tuple[str, int]],
+        max_concurrency: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Execute a batch of jobs on the caller's event loop (see execute_batch)"""
+        workspace_root = Path(getattr(self.config, "workspace_root", Path.cwd()))
+        
+        # One prerequisite scan per agent type instead of one per job
+        by_agent: Dict[str, List[int]] = {}
+        for agent_type, issue_number in jobs:
+            if agent_type in self.agents and agent_type not in ["captain", "pm"]:
+                by_agent.setdefault(agent_type, []).append(issue_number)
+        
+        failures: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        for agent_type, issue_numbers in by_agent.items():
+            try:
+                results = validate_agent_execution_bulk(agent_type, issue_numbers, workspace_root)
+            except (RuntimeError, OSError, ValueError) as e:
+                logger.warning("Prerequisite validation encountered error (non-blocking): %s", e)
+                continue
+            for issue_number, result in results.items():
+                if not result.valid:
+                    error = PrerequisiteError(AgentType(agent_type), result.missing_prerequisites, issue_number)
+                    logger.error("Prerequisite validation failed: %s", error)
+                    failures[(agent_type, issue_number)] = {
+                        "success": False,
+                        "error": str(error),
+                        "error_type": "prerequisite_validation",
+                        "using_sdk": self.using_sdk
+                    }
+        
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        
+        async def _run_job(agent_type: str, issue_number: int) -> Dict[str, Any]:
+            if agent_type not in self.agents:
+                return {
+                    "success": False,
+                    "error": f"Unknown agent type: {agent_type}. Available: {list(self.agents.keys())}"
+                }
+            failure = failures.get((agent_type, issue_number))
+            if failure is not None:
+                return dict(failure)
+            async with semaphore:
+                return await asyncio.to_thread(self._execute_validated, agent_type, issue_number)
+        
+        return list(await asyncio.gather(*[_run_job(a, i) for a, i in jobs]))
     
     def list_agents(self) -> list:
         """Get list of available agents"""
         return list(self.agents.keys())
     
+    def _convoy_semaphore(self) -> asyncio.Semaphore:
+        """Return the convoy semaphore for the running loop, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        if self._convoy_sem is None or self._convoy_sem_loop is not loop:
+            self._convoy_sem = asyncio.Semaphore(self.max_concurrency)
+            self._convoy_sem_loop = loop
+        return self._convoy_sem
+    
+    def _run(self, coro: Any) -> Any:
+        """
+        Run a coroutine on this executor's reusable event loop
+        
+        Unlike asyncio.run(), the loop (and its default thread pool) is kept
+        between calls, so repeated sync strategy/convoy runs don't pay for
+        loop setup and teardown. Callers already inside an event loop should
+        await the a* methods instead.
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+    
+    def close(self) -> None:
+        """Shut down the reusable event loop used by the sync wrappers"""
+        loop, self._loop = self._loop, None
+        if loop is not None and not loop.is_closed():
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
+    
     def execute_strategy(
         self,
         strategy_name: str,
@@ -382,7 +533,15 @@ class AgentExecutor:
         variables: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Execute a battle plan workflow synchronously."""
-        import asyncio
+        return self._run(self.aexecute_strategy(strategy_name, issue_number, variables))
+    
+    async def aexecute_strategy(
+        self,
+        strategy_name: str,
+        issue_number: int,
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Execute a battle plan workflow on the caller's event loop."""
 
         async def _agent_callback(
             issue_number: int,
@@ -398,12 +557,10 @@ class AgentExecutor:
                 agent_executor=_agent_callback,
             )
 
-            execution_id = asyncio.run(
-                executor.execute_strategy(
-                    strategy_name=strategy_name,
-                    issue_number=issue_number,
-                    variables=variables or {},
-                )
+            execution_id = await executor.execute_strategy(
+                strategy_name=strategy_name,
+                issue_number=issue_number,
+                variables=variables or {},
             )
 
             execution = executor.get_execution(execution_id)
@@ -433,10 +590,12 @@ class AgentExecutor:
         Returns:
             Dict with execution result
         """
+        return self._run(self.aexecute_convoy(convoy_id))
+    
+    async def aexecute_convoy(self, convoy_id: str) -> Dict[str, Any]:
+        """Execute a convoy on the caller's event loop (see execute_convoy)"""
         try:
-            # Execute convoy using async runtime
-            import asyncio
-            convoy = asyncio.run(self.convoy_mgr.execute_convoy(convoy_id))
+            convoy = await self.convoy_mgr.execute_convoy(convoy_id)
             
             return {
                 "success": True,
@@ -15,16 +15,18 @@ Usage:
 """
 import json
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Set, Type
 
 from ai_squad.core.agent_card import (
     AgentCard,
     AgentCapability,
     DEFAULT_AGENT_CARDS,
 )
+from ai_squad.core.retry import CircuitState
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +65,12 @@ class AgentRegistry:
     - Agent health tracking
     """
     
+    # Circuit breaker: consecutive failures to open, and cooldown before a
+    # half-open probe (doubled after each failed probe, up to the maximum)
+    CIRCUIT_FAILURE_THRESHOLD = 5
+    CIRCUIT_COOLDOWN_SECONDS = 60.0
+    CIRCUIT_MAX_COOLDOWN_SECONDS = 960.0
+    
     def __init__(
         self,
         workspace_root: Optional[Path] = None,
@@ -84,6 +92,9 @@ class AgentRegistry:
         self._request_counts: Dict[str, int] = {}  # Track agent load
         self._failure_counts: Dict[str, int] = {}  # Circuit breaker
         self._circuit_open_until: Dict[str, float] = {}  # Circuit breaker timeout
+        self._circuit_cooldown: Dict[str, float] = {}  # Current cooldown per agent
+        self._half_open: Set[str] = set()  # Cooldown elapsed, awaiting a probe result
+        self._probing: Set[str] = set()  # Agents with a half-open probe in flight
         self._health_check_thread = None
         
         if auto_register_defaults:
@@ -500,43 +511,77 @@ class AgentRegistry:
     # Circuit Breaker Pattern
     
     def record_success(self, agent_name: str) -> None:
-        """Record successful agent invocation (resets circuit breaker)"""
+        """Record successful agent invocation (closes circuit breaker)"""
         self._failure_counts[agent_name] = 0
-        if agent_name in self._circuit_open_until:
-            del self._circuit_open_until[agent_name]
+        self._circuit_open_until.pop(agent_name, None)
+        self._circuit_cooldown.pop(agent_name, None)
+        if agent_name in self._half_open:
+            self._half_open.discard(agent_name)
+            logger.info("Circuit breaker closed for %s", agent_name)
+        self._probing.discard(agent_name)
     
     def record_failure(self, agent_name: str) -> None:
         """Record failed agent invocation (may open circuit breaker)"""
+        if agent_name in self._half_open:
+            # Failed probe: reopen with a longer cooldown
+            cooldown = min(
+                self._circuit_cooldown.get(agent_name, self.CIRCUIT_COOLDOWN_SECONDS) * 2,
+                self.CIRCUIT_MAX_COOLDOWN_SECONDS,
+            )
+            self._open_circuit(agent_name, cooldown)
+            return
+        
         self._failure_counts[agent_name] = self._failure_counts.get(agent_name, 0) + 1
         
-        # Open circuit after 5 consecutive failures
-        if self._failure_counts[agent_name] >= 5:
-            import time
-            # Circuit stays open for 60 seconds
-            self._circuit_open_until[agent_name] = time.time() + 60
-            self.mark_offline(agent_name)
-            logger.warning(
-                "Circuit breaker opened for %s (5 failures)",
-                agent_name
-            )
+        # Open circuit after consecutive failures
+        if self._failure_counts[agent_name] >= self.CIRCUIT_FAILURE_THRESHOLD:
+            self._open_circuit(agent_name, self.CIRCUIT_COOLDOWN_SECONDS)
+    
+    def _open_circuit(self, agent_name: str, cooldown: float) -> None:
+        self._circuit_open_until[agent_name] = time.time() + cooldown
+        self._circuit_cooldown[agent_name] = cooldown
+        self._half_open.discard(agent_name)
+        self._probing.discard(agent_name)
+        self.mark_offline(agent_name)
+        logger.warning(
+            "Circuit breaker opened for %s (retry in %.0fs)",
+            agent_name, cooldown
+        )
     
-    def is_circuit_open(self, agent_name: str) -> bool:
-        """Check if circuit breaker is open for an agent"""
-        import time
-        
-        if agent_name not in self._circuit_open_until:
-            return False
+    def circuit_state(self, agent_name: str) -> CircuitState:
+        """
+        Get circuit breaker state for an agent
         
-        # Check if recovery timeout has passed
-        if time.time() > self._circuit_open_until[agent_name]:
-            # Try to recover
-            del self._circuit_open_until[agent_name]
+        OPEN until the cooldown passes, then HALF_OPEN until a probe
+        invocation is recorded: success closes the circuit, failure
+        reopens it with a doubled cooldown.
+        """
+        open_until = self._circuit_open_until.get(agent_name)
+        if open_until is None:
+            return CircuitState.CLOSED
+        if time.time() <= open_until:
+            return CircuitState.OPEN
+        if agent_name not in self._half_open:
+            self._half_open.add(agent_name)
             self._failure_counts[agent_name] = 0
-            logger.info("Circuit breaker recovered for %s", agent_name)
+            logger.info("Circuit breaker half-open for %s", agent_name)
+        return CircuitState.HALF_OPEN
+    
+    def is_circuit_open(self, agent_name: str) -> bool:
+        """Check if circuit breaker is open (half-open counts as not open)"""
+        return self.circuit_state(agent_name) is CircuitState.OPEN
+    
+    def begin_probe(self, agent_name: str) -> bool:
+        """Claim the single half-open probe for an agent; False if unavailable"""
+        if agent_name in self._probing or self.circuit_state(agent_name) is not CircuitState.HALF_OPEN:
             return False
-        
+        self._probing.add(agent_name)
         return True
     
+    def end_probe(self, agent_name: str) -> None:
+        """Release a probe claim without recording a result"""
+        self._probing.discard(agent_name)
+    
     # Health Monitoring
     
     def start_health_monitor(self, interval_seconds: int = 30) -> None:
@@ -548,7 +593,6 @@ class AgentRegistry:
             return
         
         def health_check_loop():
-            import time
             logger.info("Health monitor started (interval=%ds)", interval_seconds)
             
             while True:
@@ -410,6 +410,17 @@ class GitHubModelsProvider(AIProvider):
         self.org = org or os.getenv("GITHUB_MODELS_ORG")  # Enterprise organization
         self._initialized = False
         self._is_enterprise = False
+        self._session = None
+    
+    def _get_session(self):
+        """Return a keep-alive HTTP session so repeated calls reuse TLS connections"""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+            self._session = session
+        return self._session
     
     @staticmethod
     def _get_gh_token() -> Optional[str]:
@@ -445,8 +456,8 @@ class GitHubModelsProvider(AIProvider):
             
         # Verify token has access and check for enterprise/premium
         try:
-            import requests
-            response = requests.get(
+            session = self._get_session()
+            response = session.get(
                 "https://api.github.com/user",
                 headers={
                     "Authorization": f"Bearer {self.token}",
@@ -460,7 +471,7 @@ class GitHubModelsProvider(AIProvider):
                 # Check for enterprise/premium features
                 if self.org:
                     # Verify org membership for enterprise access
-                    org_response = requests.get(
+                    org_response = session.get(
                         f"https://api.github.com/orgs/{self.org}/members/{user_data.get('login')}",
                         headers={
                             "Authorization": f"Bearer {self.token}",
@@ -510,8 +521,6 @@ class GitHubModelsProvider(AIProvider):
         model_name = model_mapping.get(requested_model, requested_model)
         
         try:
-            import requests
-            
             # GitHub Models API endpoint (supports enterprise)
             url = f"{self.endpoint}/chat/completions"
             
@@ -535,7 +544,7 @@ class GitHubModelsProvider(AIProvider):
                 "max_tokens": min(max_tokens, 4000)  # GitHub Models free tier limit
             }
             
-            response = requests.post(url, headers=headers, json=data, timeout=60)
+            response = self._get_session().post(url, headers=headers, json=data, timeout=60)
             
             if response.status_code == 200:
                 result = response.json()
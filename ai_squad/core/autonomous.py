@@ -13,15 +13,42 @@ Military Theme Integration:
 """
 import logging
 import asyncio
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent GitHub calls when creating mission objectives
+GITHUB_CONCURRENCY = 4
+
 
 def run_autonomous_workflow(
     requirements: str,
-    plan_only: bool = False
+    plan_only: bool = False,
+    max_parallel: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Run Squad Mission workflow from requirements to completion.
+    
+    Synchronous wrapper around :func:`arun_autonomous_workflow`.
+    
+    Args:
+        requirements: Squad Mission requirements (text)
+        plan_only: If True, create mission brief without deploying to Captain
+        max_parallel: Max agents Captain runs at once
+        
+    Returns:
+        Dict with mission deployment results
+    """
+    return asyncio.run(arun_autonomous_workflow(
+        requirements, plan_only=plan_only, max_parallel=max_parallel
+    ))
+
+
+async def arun_autonomous_workflow(
+    requirements: str,
+    plan_only: bool = False,
+    max_parallel: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Run Squad Mission workflow from requirements to completion.
@@ -34,9 +61,14 @@ def run_autonomous_workflow(
     5. Deploy Mission to Captain for orchestration
     6. Captain coordinates using Battle Plans and Convoys
     
+    Blocking GitHub calls run in worker threads so objective issues are
+    created concurrently, and Captain runs on the same event loop.
+    
     Args:
         requirements: Squad Mission requirements (text)
         plan_only: If True, create mission brief without deploying to Captain
+        max_parallel: Max agents Captain runs at once
+            (default: collaboration.max_parallel_agents)
         
     Returns:
         Dict with mission deployment results
@@ -70,7 +102,8 @@ def run_autonomous_workflow(
         
         # Step 2: Create Mission Brief (GitHub issue)
         logger.info("📝 Creating Mission Brief in GitHub")
-        mission_issue = _create_mission_brief(
+        mission_issue = await asyncio.to_thread(
+            _create_mission_brief,
             github=github,
             mission_analysis=mission_analysis,
             config=config
@@ -84,7 +117,7 @@ def run_autonomous_workflow(
         
         # Step 3: Create Mission Objectives (story issues)
         logger.info("[MISSION] Breaking down into Mission Objectives")
-        objective_issues = _create_mission_objectives(
+        objective_issues = await _acreate_mission_objectives(
             github=github,
             mission_analysis=mission_analysis,
             mission_issue=mission_issue,
@@ -102,13 +135,13 @@ def run_autonomous_workflow(
         # Step 4: Deploy Mission to Captain (unless plan-only)
         if not plan_only:
             logger.info("🎖️ DEPLOYING MISSION TO CAPTAIN")
-            captain = Captain(config)
+            captain = Captain(config, max_parallel=max_parallel)
             
             # Deploy mission brief to Captain for orchestration
             logger.info(f"⚔️ Deploying mission #{mission_issue} to Captain")
             
             # Captain coordinates using Battle Plans and Convoys
-            deployment = _deploy_to_captain(
+            deployment = await _adeploy_to_captain(
                 captain=captain,
                 issue_number=mission_issue,
                 config=config
@@ -244,11 +277,62 @@ def _create_mission_objectives(
     Returns:
         List of objective issue dicts with 'number' key
     """
-    objective_issues = []
+    objective_issues = [
+        _create_mission_objective(github, idx, objective, mission_issue, config)
+        for idx, objective in enumerate(mission_analysis["objectives"], 1)
+    ]
+    objective_issues = [issue for issue in objective_issues if issue]
+    
+    logger.info(f"[OK] Created {len(objective_issues)} mission objectives")
+    return objective_issues
+
+
+async def _acreate_mission_objectives(
+    github: Any,
+    mission_analysis: Dict[str, Any],
+    mission_issue: int,
+    config: Any,
+    concurrency: int = GITHUB_CONCURRENCY
+) -> List[Dict[str, Any]]:
+    """
+    Create mission objective issues concurrently, keeping objective order
+    
+    Returns:
+        List of objective issue dicts with 'number' key
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def create(idx: int, objective: str) -> Optional[Dict[str, Any]]:
+        async with semaphore:
+            return await asyncio.to_thread(
+                _create_mission_objective, github, idx, objective, mission_issue, config
+            )
+    
+    results = await asyncio.gather(*(
+        create(idx, objective)
+        for idx, objective in enumerate(mission_analysis["objectives"], 1)
+    ))
+    objective_issues = [issue for issue in results if issue]
+    
+    logger.info(f"[OK] Created {len(objective_issues)} mission objectives")
+    return objective_issues
+
+
+def _create_mission_objective(
+    github: Any,
+    idx: int,
+    objective: str,
+    mission_issue: int,
+    config: Any
+) -> Optional[Dict[str, Any]]:
+    """
+    Create one objective issue and link it from the mission brief
     
-    for idx, objective in enumerate(mission_analysis["objectives"], 1):
-        title = f"[OBJECTIVE {idx}] {objective[:70]}"  # Truncate long titles
-        body = f"""# Mission Objective
+    Returns:
+        Objective issue dict, or None if creation failed
+    """
+    title = f"[OBJECTIVE {idx}] {objective[:70]}"  # Truncate long titles
+    body = f"""# Mission Objective
 
 {objective}
 
@@ -261,24 +345,21 @@ Part of Mission #{mission_issue}
 ---
 *Objective created by AI-Squad v{config.get('version', '0.6.0')}*
 """
-        
-        issue = github.create_issue(
-            title=title,
-            body=body,
-            labels=["type:story", "ai-squad:objective", "status:pending-deployment"]
+    
+    issue = github.create_issue(
+        title=title,
+        body=body,
+        labels=["type:story", "ai-squad:objective", "status:pending-deployment"]
+    )
+    
+    if issue:
+        # Add comment to mission brief linking this objective
+        github.add_comment(
+            mission_issue,
+            f"[OBJECTIVE] Created: #{issue['number']} - {objective[:50]}..."
         )
-        
-        if issue:
-            objective_issues.append(issue)
-            
-            # Add comment to mission brief linking this objective
-            github.add_comment(
-                mission_issue,
-                f"[OBJECTIVE] Created: #{issue['number']} - {objective[:50]}..."
-            )
     
-    logger.info(f"[OK] Created {len(objective_issues)} mission objectives")
-    return objective_issues
+    return issue
 
 
 def _deploy_to_captain(
@@ -297,6 +378,20 @@ def _deploy_to_captain(
     - Dispatch to agents using handoffs
     - Monitor progress
     
+    Returns:
+        Dict with deployment status
+    """
+    return asyncio.run(_adeploy_to_captain(captain, issue_number, config))
+
+
+async def _adeploy_to_captain(
+    captain: Any,
+    issue_number: int,
+    config: Any
+) -> Dict[str, Any]:
+    """
+    Deploy mission to Captain on the running event loop
+    
     Returns:
         Dict with deployment status
     """
@@ -305,7 +400,7 @@ def _deploy_to_captain(
     try:
         # Captain's run method handles orchestration
         # It will analyze task, select battle plan, create convoys, etc.
-        summary = asyncio.run(captain.run(issue_number))
+        summary = await captain.run(issue_number)
         
         logger.info(f"[OK] Captain deployment complete for #{issue_number}")
         return {
@@ -3,14 +3,17 @@ Battle Plan System
 
 YAML-based workflow definitions for reusable multi-agent orchestration patterns.
 """
+import copy
 import logging
 import inspect
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from ai_squad.core.config import load_yaml
 from ai_squad.core.runtime_paths import resolve_runtime_dir
 import yaml
 
@@ -91,7 +94,7 @@ class BattlePlan:
 
     @classmethod
     def from_yaml(cls, yaml_content: str) -> "BattlePlan":
-        data = yaml.safe_load(yaml_content)
+        data = load_yaml(yaml_content)
         return cls.from_dict(data)
 
     @classmethod
@@ -149,6 +152,31 @@ class BattlePlan:
         return groups
 
 
+@lru_cache(maxsize=8)
+def _parse_builtin_plans(
+    directory: str,
+    fingerprint: Tuple[Tuple[str, int, int], ...],
+) -> Tuple[Tuple[Tuple[str, Any], ...], Tuple[Tuple[str, str], ...]]:
+    """
+    Parse the built-in plan YAML files in ``directory``.
+    
+    ``fingerprint`` holds each file's (name, mtime_ns, size) and only serves
+    as part of the cache key, so editing a plan forces a re-parse.
+    
+    Returns:
+        ``(plans, failures)``: ``(file_name, data)`` pairs for parsed files
+        and ``(file_name, error)`` pairs for files that failed to load
+    """
+    plans, failures = [], []
+    for name, _, _ in fingerprint:
+        path = Path(directory) / name
+        try:
+            plans.append((name, load_yaml(path.read_text(encoding="utf-8"))))
+        except (OSError, ValueError, yaml.YAMLError) as exc:
+            failures.append((name, str(exc)))
+    return tuple(plans), tuple(failures)
+
+
 class BattlePlanManager:
     """Manages battle plan definitions and execution."""
 
@@ -172,12 +200,12 @@ class BattlePlanManager:
 
     def _load_strategies(self) -> None:
         if self.BUILTIN_STRATEGIES_DIR.exists():
-            for path in self.BUILTIN_STRATEGIES_DIR.glob("*.yaml"):
+            for path, data in self._load_builtin_plan_data():
                 try:
-                    strategy = BattlePlan.from_file(path)
+                    strategy = BattlePlan.from_dict(data)
                     self._strategies[strategy.name] = strategy
                     logger.debug("Loaded built-in battle plan: %s", strategy.name)
-                except (OSError, ValueError, yaml.YAMLError) as exc:
+                except ValueError as exc:
                     logger.warning("Failed to load built-in battle plan %s: %s", path, exc)
 
         if self.strategies_dir.exists():
@@ -191,6 +219,25 @@ class BattlePlanManager:
 
         logger.info("Loaded %d battle plans", len(self._strategies))
 
+    def _load_builtin_plan_data(self) -> List[Tuple[Path, Any]]:
+        """
+        Parsed built-in plan YAML as ``(path, data)`` pairs.
+        
+        The parse is cached in-process, keyed by each file's name, mtime and
+        size, so later managers only stat the files.
+        """
+        directory = self.BUILTIN_STRATEGIES_DIR
+        fingerprint = []
+        for path in sorted(directory.glob("*.yaml")):
+            stat = path.stat()
+            fingerprint.append((path.name, stat.st_mtime_ns, stat.st_size))
+        
+        plans, failures = _parse_builtin_plans(str(directory), tuple(fingerprint))
+        for name, error in failures:
+            logger.warning("Failed to load built-in battle plan %s: %s", directory / name, error)
+        # Callers build plans from this data; keep the cached copy pristine
+        return [(directory / name, copy.deepcopy(data)) for name, data in plans]
+
     def get_strategy(self, name: str) -> Optional[BattlePlan]:
         return self._strategies.get(name)
 
@@ -13,6 +13,7 @@ import hashlib
 import hmac
 import yaml
 
+from ai_squad.core.config import load_yaml
 from ai_squad.core.runtime_paths import resolve_runtime_dir
 
 logger = logging.getLogger(__name__)
@@ -148,7 +149,7 @@ class CapabilityRegistry:
 
     def _load_manifest(self, path: Path) -> Dict:
         if path.suffix in {".yaml", ".yml"}:
-            return yaml.safe_load(path.read_text(encoding="utf-8"))
+            return load_yaml(path.read_text(encoding="utf-8"))
         return json.loads(path.read_text(encoding="utf-8"))
 
     def _save_installed(self) -> None:
@@ -188,7 +189,7 @@ class CapabilityRegistry:
     @staticmethod
     def _manifest_bytes_without_checksum(path: Path) -> bytes:
         if path.suffix in {".yaml", ".yml"}:
-            data = yaml.safe_load(path.read_text(encoding="utf-8"))
+            data = load_yaml(path.read_text(encoding="utf-8"))
             if isinstance(data, dict):
                 data.pop("checksum_sha256", None)
             return yaml.safe_dump(data, sort_keys=True).encode("utf-8")
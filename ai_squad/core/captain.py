@@ -4,6 +4,7 @@ Captain Agent (Coordinator)
 The Captain (inspired by Gastown's Mayor) is a meta-agent that coordinates other agents.
 It breaks down complex tasks, creates convoys, dispatches work, and monitors progress.
 """
+import asyncio
 import logging
 import json
 from dataclasses import dataclass, field
@@ -98,7 +99,8 @@ Always provide clear, structured coordination plans.
         strategy_manager: Optional[BattlePlanManager] = None,
         convoy_manager: Optional[ConvoyManager] = None,
         signal_manager: Optional[Any] = None,
-        handoff_manager: Optional[Any] = None
+        handoff_manager: Optional[Any] = None,
+        max_parallel: Optional[int] = None
     ):
         """
         Initialize Captain agent.
@@ -107,6 +109,7 @@ Always provide clear, structured coordination plans.
             config: Agent configuration
             sdk: GitHub Copilot SDK instance
             orchestration: Shared orchestration managers
+            max_parallel: Max agents run at once (default: collaboration.max_parallel_agents)
         """
         super().__init__(config, sdk, orchestration)
         
@@ -119,6 +122,7 @@ Always provide clear, structured coordination plans.
         self.convoy_manager = convoy_manager or self.convoy or None
         self.signal_manager = signal_manager or self.signal
         self.handoff_manager = handoff_manager or self.handoff
+        self.max_parallel = max_parallel or self.config.get("collaboration.max_parallel_agents", 5)
         self.org_router = self.orchestration.get("router")
         self.routing_config = self.orchestration.get("routing_config", {}) or {}
         # Keep orchestration in sync for downstream consumers
@@ -133,18 +137,22 @@ Always provide clear, structured coordination plans.
     def _execute_agent(self, issue: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """Synchronous execution hook required by BaseAgent."""
         issue_number = issue.get("number") or issue.get("id") or "unknown"
-        summary = f"Captain coordination initialized for issue #{issue_number}"
         try:
-            import asyncio
-
-            try:
-                asyncio.get_running_loop()
-                # Avoid running a nested loop in sync context
-                raise RuntimeError("Captain run called with active event loop")
-            except RuntimeError:
-                summary = asyncio.run(self.run(issue_number))
-        except (RuntimeError, ValueError, OSError) as e:
-            logger.warning("Captain run failed, falling back to minimal summary: %s", e)
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Avoid running a nested loop in sync context
+            return {
+                "success": False,
+                "error": "Captain run called with active event loop",
+            }
+        try:
+            summary = asyncio.run(self.run(issue_number))
+        except Exception as e:  # pylint: disable=broad-except
+            # Report the failure so callers (e.g. detached tasks) can retry
+            logger.error("Captain run failed for issue #%s: %s", issue_number, e)
+            return {"success": False, "error": str(e)}
         return {
             "success": True,
             "output": summary,
@@ -371,34 +379,36 @@ Always provide clear, structured coordination plans.
     ) -> List[List[str]]:
         """
         Identify groups of work items that can run in parallel.
+        
+        Dependencies on items outside ``work_items`` are ignored.
+        """
+        return self._dependency_levels({item.id: list(item.depends_on) for item in work_items})
+    
+    @staticmethod
+    def _dependency_levels(depends_on: Dict[str, List[str]]) -> List[List[str]]:
+        """
+        Group ids into levels whose members only depend on earlier levels.
+        
+        ``depends_on`` maps each id to its dependencies, in the order ids
+        should appear within a level. Dependencies outside the map are ignored.
         """
-        # Build dependency graph
-        dependents: Dict[str, set] = {item.id: set() for item in work_items}
-        for item in work_items:
-            for dep_id in item.depends_on:
-                if dep_id in dependents:
-                    dependents[dep_id].add(item.id)
-        
-        # Group by dependency level
         levels: List[List[str]] = []
         processed: set = set()
         
-        while len(processed) < len(work_items):
+        while len(processed) < len(depends_on):
             # Find items whose dependencies are all processed
-            current_level = []
-            for item in work_items:
-                if item.id in processed:
-                    continue
-                if all(dep in processed for dep in item.depends_on):
-                    current_level.append(item.id)
+            current_level = [
+                item_id for item_id, deps in depends_on.items()
+                if item_id not in processed
+                and all(dep in processed or dep not in depends_on for dep in deps)
+            ]
             
             if current_level:
                 levels.append(current_level)
                 processed.update(current_level)
             else:
                 # Circular dependency or isolated items
-                remaining = [i.id for i in work_items if i.id not in processed]
-                levels.append(remaining)
+                levels.append([item_id for item_id in depends_on if item_id not in processed])
                 break
         
         return levels
@@ -739,13 +749,13 @@ Always provide clear, structured coordination plans.
         summary += "\n### Executing Mission\n"
         if sequence:
             try:
-                from ai_squad.core.collaboration import run_collaboration
+                from ai_squad.core.collaboration import arun_collaboration
                 
                 logger.info(f"Captain deploying agents for issue #{issue_number}: {sequence}")
                 summary += f"- Deploying agents: {' -> '.join(sequence)}\n"
                 
                 # Execute agents in Battle Plan sequence
-                collab_result = run_collaboration(issue_number, sequence)
+                collab_result = await arun_collaboration(issue_number, sequence)
                 
                 if collab_result.get("success"):
                     summary += "- [OK] Mission completed successfully!\n"
@@ -939,6 +949,7 @@ Always provide clear, structured coordination plans.
         }
         
         # Execute parallel batches (convoys)
+        semaphore = asyncio.Semaphore(self.max_parallel)
         for batch in plan.get("parallel_batches", []):
             convoy_id = batch["convoy_id"]
             agent = batch["agent"]
@@ -950,7 +961,8 @@ Always provide clear, structured coordination plans.
                 if self.convoy_manager:
                     convoy_result = await self.convoy_manager.execute_convoy(
                         convoy_id,
-                        [(agent, item_id) for item_id in items]
+                        [(agent, item_id) for item_id in items],
+                        max_parallel=self.max_parallel
                     )
                     results["parallel_results"].append({
                         "convoy_id": convoy_id,
@@ -962,25 +974,19 @@ Always provide clear, structured coordination plans.
                     results["completed"] += convoy_result.get("completed", 0)
                     results["failed"] += convoy_result.get("failed", 0)
                 else:
-                    # Fall back to sequential execution
-                    for item_id in items:
-                        try:
-                            result = await agent_executor.execute(agent, item_id)
-                            if result.get("success"):
-                                results["completed"] += 1
-                            else:
-                                results["failed"] += 1
-                                results["errors"].append({
-                                    "item_id": item_id,
-                                    "error": result.get("error")
-                                })
-                        except (RuntimeError, ValueError, TypeError) as e:
-                            results["failed"] += 1
-                            results["errors"].append({
-                                "item_id": item_id,
-                                "error": str(e)
-                            })
-                            logger.exception("Failed to execute %s for %s", agent, item_id)
+                    # Fall back to a bounded fan-out on the agent executor
+                    outcomes = await self._execute_steps(
+                        agent_executor, [(agent, item_id) for item_id in items], semaphore
+                    )
+                    for item_id, outcome in zip(items, outcomes):
+                        if not isinstance(outcome, Exception) and outcome.get("success"):
+                            results["completed"] += 1
+                            continue
+                        results["failed"] += 1
+                        results["errors"].append({
+                            "item_id": item_id,
+                            "error": str(outcome) if isinstance(outcome, Exception) else outcome.get("error")
+                        })
             except (RuntimeError, ValueError, TypeError) as e:
                 results["failed"] += len(items)
                 results["errors"].append({
@@ -989,43 +995,40 @@ Always provide clear, structured coordination plans.
                 })
                 logger.exception("Convoy %s failed", convoy_id)
         
-        # Execute sequential steps
-        for phase in plan.get("sequential_steps", []):
-            agent = phase["agent"]
-            item_id = phase["item_id"]
-            
-            logger.info("Executing %s for %s", agent, item_id)
+        # Execute sequential steps level by level; steps within a level have
+        # no dependencies on each other and run concurrently
+        steps = {phase["item_id"]: phase["agent"] for phase in plan.get("sequential_steps", [])}
+        levels = self._dependency_levels(self._step_dependencies(list(steps)))
+        
+        for level in levels:
+            for item_id in level:
+                logger.info("Executing %s for %s", steps[item_id], item_id)
+            outcomes = await self._execute_steps(
+                agent_executor, [(steps[item_id], item_id) for item_id in level], semaphore
+            )
             
-            try:
-                result = await agent_executor.execute(agent, item_id)
+            for item_id, outcome in zip(level, outcomes):
+                agent = steps[item_id]
+                if isinstance(outcome, Exception):
+                    status, error = "failed", str(outcome)
+                else:
+                    status = "success" if outcome.get("success") else "failed"
+                    error = outcome.get("error")
                 results["sequential_results"].append({
                     "agent": agent,
                     "item_id": item_id,
-                    "status": "success" if result.get("success") else "failed",
-                    "error": result.get("error")
+                    "status": status,
+                    "error": error
                 })
                 
-                if result.get("success"):
+                if status == "success":
                     results["completed"] += 1
                 else:
                     results["failed"] += 1
                     results["errors"].append({
                         "item_id": item_id,
-                        "error": result.get("error")
+                        "error": error
                     })
-            except (RuntimeError, ValueError, TypeError) as e:
-                results["failed"] += 1
-                results["sequential_results"].append({
-                    "agent": agent,
-                    "item_id": item_id,
-                    "status": "failed",
-                    "error": str(e)
-                })
-                results["errors"].append({
-                    "item_id": item_id,
-                    "error": str(e)
-                })
-                logger.exception("Failed to execute %s for %s", agent, item_id)
         
         # Final status
         total = results["completed"] + results["failed"]
@@ -1040,6 +1043,55 @@ Always provide clear, structured coordination plans.
         
         return results
     
+    def _step_dependencies(self, step_ids: List[str]) -> Dict[str, List[str]]:
+        """
+        Dependencies used to schedule sequential plan steps.
+        
+        Steps linked to other steps via ``depends_on`` keep those links.
+        Steps without any declared links (e.g. from the SDK breakdown) carry
+        no ordering information, so they wait for the step before them in
+        plan order, as they did before steps were fanned out.
+        """
+        in_plan = set(step_ids)
+        declared: Dict[str, List[str]] = {}
+        for item_id in step_ids:
+            item = self.work_state_manager.get_work_item(item_id)
+            declared[item_id] = [dep for dep in (item.depends_on if item else []) if dep in in_plan]
+        linked = {item_id for item_id, deps in declared.items() if deps}
+        linked.update(dep for deps in declared.values() for dep in deps)
+        
+        depends_on: Dict[str, List[str]] = {}
+        previous: Optional[str] = None
+        for item_id in step_ids:
+            if item_id in linked:
+                depends_on[item_id] = declared[item_id]
+            else:
+                depends_on[item_id] = [previous] if previous else []
+            previous = item_id
+        return depends_on
+    
+    async def _execute_steps(
+        self,
+        agent_executor: Any,
+        steps: List[Tuple[str, str]],
+        semaphore: asyncio.Semaphore
+    ) -> List[Any]:
+        """
+        Run (agent, item_id) steps concurrently, bounded by ``semaphore``.
+        
+        Returns results in step order; agent errors are returned in place
+        of the result instead of being raised.
+        """
+        async def run_step(agent: str, item_id: str) -> Any:
+            async with semaphore:
+                try:
+                    return await agent_executor.execute(agent, item_id)
+                except (RuntimeError, ValueError, TypeError) as e:
+                    logger.exception("Failed to execute %s for %s", agent, item_id)
+                    return e
+        
+        return await asyncio.gather(*(run_step(agent, item_id) for agent, item_id in steps))
+    
     def _detect_agent(self, item: WorkItem) -> str:
         """Detect which agent should handle this work item"""
         # Check labels first
@@ -1071,7 +1123,6 @@ Always provide clear, structured coordination plans.
         """
         try:
             # Run async coordination
-            import asyncio
             result = asyncio.run(self.run(issue_number))
             
             return {
@@ -8,7 +8,9 @@ Supports two modes:
 Ensures agents execute in correct order respecting dependencies.
 """
 from typing import Dict, Any, List, Optional, Tuple
+from contextlib import closing
 from enum import Enum
+import asyncio
 import logging
 import uuid
 from datetime import datetime
@@ -78,11 +80,46 @@ def run_collaboration(
         return _run_sequential_collaboration(issue_number, agents)
 
 
-def _run_sequential_collaboration(issue_number: int, agents: List[str]) -> Dict[str, Any]:
+async def arun_collaboration(
+    issue_number: int,
+    agents: List[str],
+    mode: CollaborationMode = CollaborationMode.ITERATIVE,
+    max_iterations: Optional[int] = None,
+    parallel: bool = True,
+    max_parallel: Optional[int] = None
+) -> Dict[str, Any]:
     """
-    Run agents in sequential order (legacy mode).
+    Async variant of run_collaboration.
     
-    Each agent runs once in dependency order.
+    In sequential mode with ``parallel`` enabled, agents that do not depend
+    on each other (e.g. Architect and UX, which both only need the PRD) run
+    concurrently; dependent agents still wait for the previous stage.
+    Iterative mode is a dialogue and always runs turn by turn.
+    
+    Args:
+        issue_number: GitHub issue number
+        agents: List of agent types
+        mode: Collaboration mode (default: iterative)
+        max_iterations: Maximum iteration rounds (default: from config or 3)
+        parallel: Run independent agents concurrently in sequential mode
+        max_parallel: Cap on agents running at once (default: unbounded)
+        
+    Returns:
+        Dict with collaboration result (same shape as run_collaboration)
+    """
+    if mode == CollaborationMode.SEQUENTIAL and parallel:
+        return await _arun_staged_collaboration(issue_number, agents, max_parallel)
+    return await asyncio.to_thread(
+        run_collaboration, issue_number, agents, mode=mode, max_iterations=max_iterations
+    )
+
+
+def _validate_agent_order(agents: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    Check that user-provided agents respect the dependency order.
+    
+    Returns:
+        Error result dict if the order is invalid, otherwise None
     """
     # PREREQUISITE VALIDATION - Ensure correct agent execution order
     # Validates that prerequisite agents have completed before dependent agents
@@ -120,28 +157,131 @@ def _run_sequential_collaboration(issue_number: int, agents: List[str]) -> Dict[
     except (RuntimeError, OSError, ValueError) as e:
         logger.warning("Agent order validation encountered error (non-blocking): %s", e)
     
-    executor = AgentExecutor()
+    return None
+
+
+def _run_sequential_collaboration(issue_number: int, agents: List[str]) -> Dict[str, Any]:
+    """
+    Run agents in sequential order (legacy mode).
+    
+    Each agent runs once in dependency order.
+    """
+    order_error = _validate_agent_order(agents)
+    if order_error:
+        return order_error
+    
+    with closing(AgentExecutor()) as executor:
+        results = []
+        files = []
+    
+        for agent_type in agents:
+            result = executor.execute(agent_type, issue_number)
+            results.append({
+                "agent": agent_type,
+                "result": result
+            })
+        
+            if result.get("success"):
+                if "file_path" in result:
+                    files.append(result["file_path"])
+                if "files" in result:
+                    files.extend(result["files"])
+            else:
+                return {
+                    "success": False,
+                    "error": f"Agent {agent_type} failed: {result.get('error')}",
+                    "partial_results": results
+                }
+    
+        return {
+            "success": True,
+            "mode": "sequential",
+            "results": results,
+            "files": files
+        }
+
+
+def _execution_stages(agents: List[str]) -> List[List[str]]:
+    """
+    Group consecutive agents that share a dependency level.
+    
+    Agents inside one stage have no dependencies on each other; agents not
+    known to the dependency graph (like "captain") always run alone.
+    """
+    try:
+        levels = {
+            agent.value: level
+            for agent, level in PrerequisiteValidator(Path.cwd()).dependency_levels().items()
+        }
+    except ValueError as e:
+        logger.warning("Could not compute agent dependency levels: %s", e)
+        levels = {}
+    
+    stages: List[List[str]] = []
+    prev_level = None
+    for agent_type in agents:
+        level = levels.get(agent_type)
+        if stages and level is not None and level == prev_level:
+            stages[-1].append(agent_type)
+        else:
+            stages.append([agent_type])
+        prev_level = level
+    return stages
+
+
+async def _arun_staged_collaboration(
+    issue_number: int,
+    agents: List[str],
+    max_parallel: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Run agents in dependency order, executing each stage concurrently.
+    
+    All stages share one AgentExecutor; BaseAgent creates its lazy helpers
+    under a lock, so agent instances are safe to use from worker threads.
+    """
+    order_error = _validate_agent_order(agents)
+    if order_error:
+        return order_error
+    
     results = []
     files = []
+    semaphore = asyncio.Semaphore(max_parallel or len(agents) or 1)
     
-    for agent_type in agents:
-        result = executor.execute(agent_type, issue_number)
-        results.append({
-            "agent": agent_type,
-            "result": result
-        })
+    with closing(AgentExecutor()) as executor:
+        async def run_agent(agent_type: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await asyncio.to_thread(executor.execute, agent_type, issue_number)
+    
+        for stage in _execution_stages(agents):
+            stage_results = await asyncio.gather(
+                *(run_agent(agent_type) for agent_type in stage),
+                return_exceptions=True
+            )
         
-        if result.get("success"):
-            if "file_path" in result:
-                files.append(result["file_path"])
-            if "files" in result:
-                files.extend(result["files"])
-        else:
-            return {
-                "success": False,
-                "error": f"Agent {agent_type} failed: {result.get('error')}",
-                "partial_results": results
-            }
+            failures = []
+            for agent_type, result in zip(stage, stage_results):
+                if isinstance(result, BaseException):
+                    result = {"success": False, "error": str(result)}
+                results.append({
+                    "agent": agent_type,
+                    "result": result
+                })
+            
+                if result.get("success"):
+                    if "file_path" in result:
+                        files.append(result["file_path"])
+                    if "files" in result:
+                        files.extend(result["files"])
+                else:
+                    failures.append(f"Agent {agent_type} failed: {result.get('error')}")
+        
+            if failures:
+                return {
+                    "success": False,
+                    "error": "; ".join(failures),
+                    "partial_results": results
+                }
     
     return {
         "success": True,
@@ -200,175 +340,175 @@ def _run_iterative_collaboration(
         primary_agent, reviewer_agent, thread_id, max_iterations
     )
     
-    executor = AgentExecutor()
-    files = []
-    iteration = 0
-    approved = False
-    
-    # Initial execution by primary agent
-    logger.info("[Iteration %d] %s: Initial execution", iteration, primary_agent)
-    primary_result = executor.execute(primary_agent, issue_number)
+    with closing(AgentExecutor()) as executor:
+        files = []
+        iteration = 0
+        approved = False
     
-    if not primary_result.get("success"):
-        return {
-            "success": False,
-            "mode": "iterative",
-            "error": f"{primary_agent} failed: {primary_result.get('error')}",
-            "iterations": iteration,
-            "thread_id": thread_id
-        }
+        # Initial execution by primary agent
+        logger.info("[Iteration %d] %s: Initial execution", iteration, primary_agent)
+        primary_result = executor.execute(primary_agent, issue_number)
     
-    conversation_history.append({
-        "iteration": iteration,
-        "agent": primary_agent,
-        "action": "initial_output",
-        "result": primary_result,
-        "timestamp": datetime.now().isoformat()
-    })
-    
-    if primary_result.get("file_path"):
-        files.append(primary_result["file_path"])
-    if primary_result.get("files"):
-        files.extend(primary_result["files"])
-    
-    # Iterative feedback loop
-    for iteration in range(1, max_iterations + 1):
-        logger.info("[Iteration %d] %s: Reviewing output", iteration, reviewer_agent)
-        
-        # Reviewer agent provides feedback
-        feedback_prompt = (
-            f"Review the {primary_agent}'s output for issue #{issue_number}. "
-            f"Provide constructive feedback or approve if satisfactory. "
-            f"Output files: {', '.join(files)}"
-        )
-        
-        # Execute reviewer with context about primary agent's output
-        reviewer_result = executor.execute(
-            reviewer_agent, 
-            issue_number,
-            # TODO: Pass primary_result as context when executor supports it
-        )
-        
-        if not reviewer_result.get("success"):
-            logger.warning("%s review failed: %s", reviewer_agent, reviewer_result.get("error"))
-            # Continue with partial feedback
-            feedback = {
-                "approved": False,
-                "comments": f"Review incomplete: {reviewer_result.get('error')}",
-                "severity": "warning"
+        if not primary_result.get("success"):
+            return {
+                "success": False,
+                "mode": "iterative",
+                "error": f"{primary_agent} failed: {primary_result.get('error')}",
+                "iterations": iteration,
+                "thread_id": thread_id
             }
-        else:
-            # Parse reviewer output for feedback
-            feedback = _parse_feedback(reviewer_result)
-        
+    
         conversation_history.append({
             "iteration": iteration,
-            "agent": reviewer_agent,
-            "action": "review",
-            "feedback": feedback,
-            "result": reviewer_result,
+            "agent": primary_agent,
+            "action": "initial_output",
+            "result": primary_result,
             "timestamp": datetime.now().isoformat()
         })
+    
+        if primary_result.get("file_path"):
+            files.append(primary_result["file_path"])
+        if primary_result.get("files"):
+            files.extend(primary_result["files"])
+    
+        # Iterative feedback loop
+        for iteration in range(1, max_iterations + 1):
+            logger.info("[Iteration %d] %s: Reviewing output", iteration, reviewer_agent)
         
-        # Send feedback via Signal
-        signal_manager.send_message(
-            sender=reviewer_agent,
-            recipient=primary_agent,
-            subject=f"Feedback on Issue #{issue_number} - Iteration {iteration}",
-            body=feedback.get("comments", ""),
-            priority=MessagePriority.HIGH if not feedback.get("approved") else MessagePriority.NORMAL,
-            work_item_id=f"issue-{issue_number}",
-            thread_id=thread_id,
-            metadata={
-                "iteration": iteration,
-                "approved": feedback.get("approved", False),
-                "severity": feedback.get("severity", "info")
-            }
-        )
-        
-        # Check if approved
-        if feedback.get("approved"):
-            logger.info("[Iteration %d] %s approved! Collaboration complete.", iteration, reviewer_agent)
-            approved = True
-            break
+            # Reviewer agent provides feedback
+            feedback_prompt = (
+                f"Review the {primary_agent}'s output for issue #{issue_number}. "
+                f"Provide constructive feedback or approve if satisfactory. "
+                f"Output files: {', '.join(files)}"
+            )
         
-        # Check if max iterations reached
-        if iteration >= max_iterations:
-            logger.warning(
-                "[Iteration %d] Max iterations reached without approval. Ending collaboration.",
-                iteration
+            # Execute reviewer with context about primary agent's output
+            reviewer_result = executor.execute(
+                reviewer_agent, 
+                issue_number,
+                # TODO: Pass primary_result as context when executor supports it
             )
-            # Post summary to GitHub issue
-            _post_incomplete_collaboration_summary(
-                issue_number=issue_number,
-                primary_agent=primary_agent,
-                reviewer_agent=reviewer_agent,
-                iteration=iteration,
-                last_feedback=feedback,
+        
+            if not reviewer_result.get("success"):
+                logger.warning("%s review failed: %s", reviewer_agent, reviewer_result.get("error"))
+                # Continue with partial feedback
+                feedback = {
+                    "approved": False,
+                    "comments": f"Review incomplete: {reviewer_result.get('error')}",
+                    "severity": "warning"
+                }
+            else:
+                # Parse reviewer output for feedback
+                feedback = _parse_feedback(reviewer_result)
+        
+            conversation_history.append({
+                "iteration": iteration,
+                "agent": reviewer_agent,
+                "action": "review",
+                "feedback": feedback,
+                "result": reviewer_result,
+                "timestamp": datetime.now().isoformat()
+            })
+        
+            # Send feedback via Signal
+            signal_manager.send_message(
+                sender=reviewer_agent,
+                recipient=primary_agent,
+                subject=f"Feedback on Issue #{issue_number} - Iteration {iteration}",
+                body=feedback.get("comments", ""),
+                priority=MessagePriority.HIGH if not feedback.get("approved") else MessagePriority.NORMAL,
+                work_item_id=f"issue-{issue_number}",
                 thread_id=thread_id,
-                files=files
+                metadata={
+                    "iteration": iteration,
+                    "approved": feedback.get("approved", False),
+                    "severity": feedback.get("severity", "info")
+                }
             )
-            break
         
-        # Primary agent iterates based on feedback
-        logger.info("[Iteration %d] %s: Iterating based on feedback", iteration, primary_agent)
+            # Check if approved
+            if feedback.get("approved"):
+                logger.info("[Iteration %d] %s approved! Collaboration complete.", iteration, reviewer_agent)
+                approved = True
+                break
         
-        # Execute primary agent again with feedback context
-        primary_result = executor.execute(
-            primary_agent,
-            issue_number,
-            # TODO: Pass feedback as context when executor supports it
-        )
+            # Check if max iterations reached
+            if iteration >= max_iterations:
+                logger.warning(
+                    "[Iteration %d] Max iterations reached without approval. Ending collaboration.",
+                    iteration
+                )
+                # Post summary to GitHub issue
+                _post_incomplete_collaboration_summary(
+                    issue_number=issue_number,
+                    primary_agent=primary_agent,
+                    reviewer_agent=reviewer_agent,
+                    iteration=iteration,
+                    last_feedback=feedback,
+                    thread_id=thread_id,
+                    files=files
+                )
+                break
+        
+            # Primary agent iterates based on feedback
+            logger.info("[Iteration %d] %s: Iterating based on feedback", iteration, primary_agent)
+        
+            # Execute primary agent again with feedback context
+            primary_result = executor.execute(
+                primary_agent,
+                issue_number,
+                # TODO: Pass feedback as context when executor supports it
+            )
+        
+            if not primary_result.get("success"):
+                logger.error("%s iteration failed: %s", primary_agent, primary_result.get("error"))
+                # Add failed iteration to conversation history
+                conversation_history.append({
+                    "iteration": iteration,
+                    "agent": primary_agent,
+                    "action": "iteration_failed",
+                    "result": primary_result,
+                    "timestamp": datetime.now().isoformat()
+                })
+                return {
+                    "success": False,
+                    "mode": "iterative",
+                    "error": f"{primary_agent} iteration {iteration} failed: {primary_result.get('error')}",
+                    "iterations": iteration,
+                    "thread_id": thread_id,
+                    "conversation": conversation_history
+                }
         
-        if not primary_result.get("success"):
-            logger.error("%s iteration failed: %s", primary_agent, primary_result.get("error"))
-            # Add failed iteration to conversation history
             conversation_history.append({
                 "iteration": iteration,
                 "agent": primary_agent,
-                "action": "iteration_failed",
+                "action": "iteration",
                 "result": primary_result,
                 "timestamp": datetime.now().isoformat()
             })
-            return {
-                "success": False,
-                "mode": "iterative",
-                "error": f"{primary_agent} iteration {iteration} failed: {primary_result.get('error')}",
-                "iterations": iteration,
-                "thread_id": thread_id,
-                "conversation": conversation_history
-            }
         
-        conversation_history.append({
-            "iteration": iteration,
-            "agent": primary_agent,
-            "action": "iteration",
-            "result": primary_result,
-            "timestamp": datetime.now().isoformat()
-        })
-        
-        # Update files
-        if primary_result.get("file_path") and primary_result["file_path"] not in files:
-            files.append(primary_result["file_path"])
-        if primary_result.get("files"):
-            for f in primary_result["files"]:
-                if f not in files:
-                    files.append(f)
+            # Update files
+            if primary_result.get("file_path") and primary_result["file_path"] not in files:
+                files.append(primary_result["file_path"])
+            if primary_result.get("files"):
+                for f in primary_result["files"]:
+                    if f not in files:
+                        files.append(f)
     
-    # Final result
-    return {
-        "success": True,
-        "mode": "iterative",
-        "approved": approved,
-        "iterations": iteration,
-        "thread_id": thread_id,
-        "conversation": conversation_history,
-        "files": files,
-        "participants": {
-            "primary": primary_agent,
-            "reviewer": reviewer_agent
+        # Final result
+        return {
+            "success": True,
+            "mode": "iterative",
+            "approved": approved,
+            "iterations": iteration,
+            "thread_id": thread_id,
+            "conversation": conversation_history,
+            "files": files,
+            "participants": {
+                "primary": primary_agent,
+                "reviewer": reviewer_agent
+            }
         }
-    }
 
 
 def _parse_feedback(reviewer_result: Dict[str, Any]) -> Dict[str, Any]:
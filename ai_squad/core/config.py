@@ -1,10 +1,86 @@
 """
 Configuration management for AI-Squad
 """
+import functools
 from pathlib import Path
 from typing import Dict, Any, Optional
 import yaml
 
+# libyaml-backed loader when available; same safety guarantees as SafeLoader
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(stream: Any) -> Any:
+    """
+    Safely parse YAML, using the C loader when libyaml is installed
+    
+    Args:
+        stream: YAML string or open file
+        
+    Returns:
+        Parsed YAML data
+    """
+    return yaml.load(stream, Loader=YAML_LOADER)
+
+
+_PROJECT_HEADER_KEYS = ("github_repo", "github_owner")
+_YAML_NULLS = ("", "~", "null", "Null", "NULL")
+
+
+def read_project_header(path: Path, max_events: int = 200) -> Dict[str, Any]:
+    """
+    Read ``project.github_repo`` and ``project.github_owner`` from squad.yaml
+    
+    Walks the YAML event stream and stops as soon as both keys are seen or
+    the ``project`` mapping ends, so the rest of the file is never parsed.
+    Falls back to a full parse on anything the event walk cannot resolve
+    (parse errors, aliases, or no answer within ``max_events`` events).
+    
+    Args:
+        path: Path to squad.yaml
+        max_events: Event budget before falling back to a full parse
+        
+    Returns:
+        Dict with whichever of the two keys are present
+    """
+    header: Dict[str, Any] = {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            # Each entry: [is_mapping, expecting_key, current_key]
+            stack: list = []
+            project_depth = None
+            for count, event in enumerate(yaml.parse(f, Loader=YAML_LOADER)):
+                if count >= max_events or isinstance(event, yaml.AliasEvent):
+                    raise ValueError("project header not resolved from event stream")
+                if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                    if stack and stack[-1][0]:
+                        parent = stack[-1]
+                        if (len(stack) == 1 and parent[2] == "project"
+                                and isinstance(event, yaml.MappingStartEvent)):
+                            project_depth = 2
+                        parent[1] = True
+                    stack.append([isinstance(event, yaml.MappingStartEvent), True, None])
+                elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                    if project_depth == len(stack):
+                        return header
+                    stack.pop()
+                elif isinstance(event, yaml.ScalarEvent) and stack and stack[-1][0]:
+                    top = stack[-1]
+                    if top[1]:
+                        top[1], top[2] = False, event.value
+                        continue
+                    if project_depth == len(stack) and top[2] in _PROJECT_HEADER_KEYS:
+                        plain_null = event.implicit[0] and event.value in _YAML_NULLS
+                        header[top[2]] = None if plain_null else event.value
+                        if len(header) == len(_PROJECT_HEADER_KEYS):
+                            return header
+                    top[1] = True
+            return header
+    except (yaml.YAMLError, ValueError):
+        with open(path, encoding="utf-8") as f:
+            project = (load_yaml(f) or {}).get("project") or {}
+        return {key: project[key] for key in _PROJECT_HEADER_KEYS if key in project}
+
 
 class Config:
     """AI-Squad configuration"""
@@ -44,6 +120,7 @@ class Config:
         "collaboration": {
             "max_iterations": 3,
             "default_mode": "iterative",
+            "max_parallel_agents": 5,
         },
         "quality": {
             "test_coverage_threshold": 80,
@@ -78,6 +155,7 @@ class Config:
             "min_events": 5,
             "window": 200,
             "enforce_cli_routing": False,
+            "max_concurrency": 8,
         },
         "design": {
             "breakpoints": {
@@ -103,6 +181,7 @@ class Config:
         "collaboration": {
             "max_iterations": 3,
             "default_mode": "iterative",
+            "max_parallel_agents": 5,
         },
         "theater": {
             "default": "default",
@@ -143,7 +222,7 @@ class Config:
             return cls(cls.DEFAULT_CONFIG.copy())
         
         with open(config_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = load_yaml(f)
         
         # Merge with defaults
         merged = cls.DEFAULT_CONFIG.copy()
@@ -287,3 +366,31 @@ class Config:
     def touch_target_min(self) -> str:
         """Get minimum touch target size"""
         return self.get("design.touch_target_min", "44px")
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_cached(config_path: str, mtime_ns: Optional[int]) -> Config:
+    """Load config once per (path, mtime); a new mtime misses and reloads"""
+    return Config.load(config_path)
+
+
+def get_config(config_path: Optional[str] = None) -> Config:
+    """
+    Load configuration, reusing the last result while squad.yaml is unchanged
+    
+    Stats the file and keys a one-entry cache on its mtime, so repeat calls
+    in one process skip the YAML parse until the file is edited. The returned
+    instance is shared; callers that mutate it should use ``Config.load()``.
+    
+    Args:
+        config_path: Path to squad.yaml (defaults to ./squad.yaml)
+        
+    Returns:
+        Config instance
+    """
+    path = Path.cwd() / "squad.yaml" if config_path is None else Path(config_path)
+    try:
+        mtime_ns: Optional[int] = path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return _load_config_cached(str(path), mtime_ns)
@@ -2,18 +2,26 @@
 
 Represents the system as nodes with typed edges (depends_on, delegates_to, mirrors, owns, emits, consumes).
 """
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from ai_squad.core.runtime_paths import resolve_runtime_dir
 
 logger = logging.getLogger(__name__)
 
+# impact_analysis results shared across instances in one process, keyed by
+# (graph_dir, graph version, node_id) so edits invalidate naturally
+_IMPACT_CACHE: "OrderedDict[Tuple[str, Tuple[int, int, int], str], Dict[str, Any]]" = OrderedDict()
+_IMPACT_CACHE_SIZE = 256
+# In-process save count per graph_dir; covers saves faster than mtime resolution
+_SAVE_COUNTS: Dict[str, int] = {}
+
 
 class NodeType(str, Enum):
     """Node types in the operational graph."""
@@ -107,6 +115,7 @@ class OperationalGraph:
         self._nodes: Dict[str, GraphNode] = {}
         self._edges: List[GraphEdge] = []
         self._load()
+        self._graph_version = self._stat_version()
 
     def add_node(self, node_id: str, node_type: NodeType, metadata: Optional[Dict[str, Any]] = None) -> GraphNode:
         """Add or update a node in the graph."""
@@ -228,10 +237,27 @@ class OperationalGraph:
         return None
 
     def impact_analysis(self, node_id: str) -> Dict[str, Any]:
-        """Analyze the impact of changes to a node."""
+        """Analyze the impact of changes to a node.
+
+        Results are memoized per graph version, so repeat queries on an
+        unchanged graph skip the dependents traversal.
+        """
         if node_id not in self._nodes:
             return {"error": "Node not found"}
 
+        key = (str(self.graph_dir), self._graph_version, node_id)
+        cached = _IMPACT_CACHE.get(key)
+        if cached is None:
+            cached = self._compute_impact(node_id)
+            _IMPACT_CACHE[key] = cached
+            if len(_IMPACT_CACHE) > _IMPACT_CACHE_SIZE:
+                _IMPACT_CACHE.popitem(last=False)
+        else:
+            _IMPACT_CACHE.move_to_end(key)
+        return {k: list(v) if isinstance(v, list) else v for k, v in cached.items()}
+
+    def _compute_impact(self, node_id: str) -> Dict[str, Any]:
+        """Compute impact_analysis for a node known to exist."""
         direct_dependents = self.get_dependents(node_id)
         all_dependents = self._collect_dependents(node_id)
 
@@ -299,6 +325,19 @@ class OperationalGraph:
         
         edges_data = [edge.to_dict() for edge in self._edges]
         self.edges_file.write_text(json.dumps(edges_data, ensure_ascii=True, indent=2), encoding="utf-8")
+        graph_key = str(self.graph_dir)
+        _SAVE_COUNTS[graph_key] = _SAVE_COUNTS.get(graph_key, 0) + 1
+        self._graph_version = self._stat_version()
+
+    def _stat_version(self) -> Tuple[int, int, int]:
+        """Graph version: in-process save count plus nodes/edges file mtimes."""
+        mtimes = []
+        for path in (self.nodes_file, self.edges_file):
+            try:
+                mtimes.append(path.stat().st_mtime_ns)
+            except OSError:
+                mtimes.append(0)
+        return (_SAVE_COUNTS.get(str(self.graph_dir), 0), mtimes[0], mtimes[1])
 
     def _load(self) -> None:
         """Load graph from disk."""
@@ -7,6 +7,7 @@ import os
 import re
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 
 from ai_squad.core.config import Config
@@ -55,6 +56,13 @@ def _run_gh(args: List[str]) -> subprocess.CompletedProcess:
     )
 
 
+def _gh_succeeds(args: List[str]) -> bool:
+    try:
+        return _run_gh(args).returncode == 0
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return False
+
+
 def run_preflight_checks(
     *,
     issue_number: Optional[int] = None,
@@ -62,6 +70,9 @@ def run_preflight_checks(
 ) -> Dict[str, Any]:
     """Run preflight checks for Captain mode.
 
+    Independent gh/git subprocess checks run concurrently; the returned
+    checks keep their fixed order.
+
     Returns:
         Dict with all_passed boolean and per-check results.
     """
@@ -76,13 +87,22 @@ def run_preflight_checks(
     })
 
     github_token = os.getenv("GITHUB_TOKEN")
-    gh_auth_ok = False
-    if gh_path:
-        try:
-            auth = _run_gh(["auth", "status"])
-            gh_auth_ok = auth.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-            gh_auth_ok = False
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        # gh auth and the git remote lookup do not depend on each other
+        auth_future = pool.submit(_gh_succeeds, ["auth", "status"]) if gh_path else None
+        repo = _resolve_repo(cfg)
+        gh_auth_ok = auth_future.result() if auth_future else False
+
+        # Repo and issue access both only need the resolved repo
+        repo_future = issue_future = None
+        if gh_path and repo:
+            repo_future = pool.submit(_gh_succeeds, ["repo", "view", repo])
+            if issue_number is not None:
+                issue_future = pool.submit(
+                    _gh_succeeds, ["issue", "view", str(issue_number), "--repo", repo]
+                )
+        repo_ok = repo_future.result() if repo_future else False
+        issue_ok = issue_future.result() if issue_future else False
 
     checks.append({
         "name": "GitHub Auth",
@@ -92,21 +112,12 @@ def run_preflight_checks(
         ),
     })
 
-    repo = _resolve_repo(cfg)
     checks.append({
         "name": "Repository",
         "passed": repo is not None,
         "message": repo if repo else "Repo not configured (set project.github_owner/repo or git remote)",
     })
 
-    repo_ok = False
-    if gh_path and repo:
-        try:
-            repo_view = _run_gh(["repo", "view", repo])
-            repo_ok = repo_view.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-            repo_ok = False
-
     checks.append({
         "name": "Repo Access",
         "passed": repo_ok,
@@ -114,14 +125,6 @@ def run_preflight_checks(
     })
 
     if issue_number is not None:
-        issue_ok = False
-        if gh_path and repo:
-            try:
-                issue_view = _run_gh(["issue", "view", str(issue_number), "--repo", repo])
-                issue_ok = issue_view.returncode == 0
-            except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-                issue_ok = False
-
         checks.append({
             "name": "Issue Access",
             "passed": issue_ok,
@@ -4,6 +4,7 @@ After-operation reporting utilities.
 from dataclasses import dataclass
 from datetime import datetime
 import logging
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -58,6 +59,8 @@ class ReportManager:
         else:
             runtime_dir = resolve_runtime_dir(self.workspace_root, config=config, base_dir=base_dir)
             self.reports_dir = runtime_dir / "reports"
+        # (directory mtime_ns, sorted report names) from the last listing
+        self._listing: Optional[tuple] = None
 
     def write_convoy_report(self, convoy: Convoy) -> Path:
         progress = convoy.get_progress()
@@ -88,5 +91,21 @@ class ReportManager:
         self.reports_dir.mkdir(parents=True, exist_ok=True)
         path = self.reports_dir / f"after-operation-{report.convoy_id}.md"
         path.write_text(report.to_markdown(), encoding="utf-8")
+        self._listing = None
         logger.info("After-operation report saved to %s", path)
         return path
+
+    def list_reports(self) -> List[str]:
+        """Sorted report file names, rescanned only when the directory mtime changes."""
+        try:
+            mtime = os.stat(self.reports_dir).st_mtime_ns
+        except FileNotFoundError:
+            return []
+        if self._listing is None or self._listing[0] != mtime:
+            with os.scandir(self.reports_dir) as it:
+                names = sorted(
+                    e.name for e in it
+                    if e.name.startswith("after-operation-") and e.name.endswith(".md")
+                )
+            self._listing = (mtime, names)
+        return list(self._listing[1])
@@ -5,6 +5,7 @@ Implements exponential backoff retry, rate limit handling, and circuit breaker p
 """
 import time
 import functools
+import random
 from typing import Callable, Any, Optional, Dict
 from datetime import datetime, timedelta
 from enum import Enum
@@ -37,7 +38,8 @@ class RetryConfig:
         max_delay: float = 60.0,
         backoff_factor: float = 2.0,
         strategy: RetryStrategy = RetryStrategy.EXPONENTIAL,
-        retryable_exceptions: tuple = (Exception,)
+        retryable_exceptions: tuple = (Exception,),
+        jitter: float = 0.0
     ):
         """
         Initialize retry configuration
@@ -49,6 +51,9 @@ class RetryConfig:
             backoff_factor: Multiplier for exponential backoff
             strategy: Retry strategy to use
             retryable_exceptions: Tuple of exception types to retry
+            jitter: Spread each delay uniformly over +/- this fraction
+                (e.g. 0.5 gives 0.5x-1.5x) so concurrent callers don't
+                retry in lockstep; 0 disables jitter
         """
         self.max_attempts = max_attempts
         self.initial_delay = initial_delay
@@ -56,6 +61,7 @@ class RetryConfig:
         self.backoff_factor = backoff_factor
         self.strategy = strategy
         self.retryable_exceptions = retryable_exceptions
+        self.jitter = jitter
     
     def get_delay(self, attempt: int) -> float:
         """Calculate delay for given attempt number"""
@@ -66,7 +72,10 @@ class RetryConfig:
         else:  # FIXED
             delay = self.initial_delay
         
-        return min(delay, self.max_delay)
+        delay = min(delay, self.max_delay)
+        if self.jitter:
+            delay = random.uniform(delay * (1 - self.jitter), delay * (1 + self.jitter))
+        return delay
 
 
 def retry_with_backoff(config: Optional[RetryConfig] = None):
@@ -311,6 +320,14 @@ class GitHubRateLimitError(Exception):
     """Raised when GitHub rate limit is exceeded"""
 
 
+class RecoverableHandlerError(Exception):
+    """Raised by an agent handler for a transient failure worth retrying"""
+
+
+class UnrecoverableHandlerError(Exception):
+    """Raised by an agent handler for a failure that retrying cannot fix"""
+
+
 def with_circuit_breaker(breaker: CircuitBreaker):
     """
     Decorator for circuit breaker pattern
@@ -375,3 +392,13 @@ AGENT_EXECUTION_RETRY = RetryConfig(
     backoff_factor=2.0,
     strategy=RetryStrategy.EXPONENTIAL
 )
+
+AGENT_ROUTING_RETRY = RetryConfig(
+    max_attempts=3,
+    initial_delay=1.0,
+    max_delay=30.0,
+    backoff_factor=2.0,
+    strategy=RetryStrategy.EXPONENTIAL,
+    retryable_exceptions=(TimeoutError, ConnectionError, RecoverableHandlerError),
+    jitter=0.5
+)
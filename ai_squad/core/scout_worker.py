@@ -1,10 +1,13 @@
 """Lightweight non-LLM scout workers with checkpoints."""
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+import tempfile
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from ai_squad.core.runtime_paths import resolve_runtime_dir
 import uuid
@@ -42,6 +45,14 @@ class ScoutRun:
             "metadata": self.metadata,
         }
 
+    def counts(self) -> Tuple[int, int]:
+        """Return ``(total, completed)`` task counts in a single pass."""
+        total = completed = 0
+        for task in self.tasks:
+            total += 1
+            completed += task.status == "completed"
+        return total, completed
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ScoutRun":
         tasks = [ScoutTask(**t) for t in data.get("tasks", [])]
@@ -67,25 +78,44 @@ class ScoutWorker:
         runtime_dir = resolve_runtime_dir(self.workspace_root, config=config, base_dir=base_dir)
         self.scout_dir = runtime_dir / "scout_workers"
         self.scout_dir.mkdir(parents=True, exist_ok=True)
+        # Per-run {"total", "completed"} counts so listing never parses results
+        self.summary_dir = self.scout_dir / "summaries"
 
     def run(
         self,
         tasks: Dict[str, Callable[[], Any]],
         *,
         metadata: Optional[Dict[str, Any]] = None,
+        jobs: int = 1,
     ) -> ScoutRun:
+        """Run tasks, checkpointing after each one.
+
+        With ``jobs > 1`` tasks run on a thread pool; results are still
+        recorded and checkpointed in task order from the calling thread.
+        """
         run = ScoutRun(
             run_id=f"scout-{uuid.uuid4().hex[:8]}",
             metadata=metadata or {},
         )
 
-        for name, func in tasks.items():
-            task = self._run_task(name, func)
-            run.tasks.append(task)
-            self._checkpoint(run)
+        workers = max(1, min(jobs, len(tasks)))
+        if workers == 1:
+            results: Iterable[ScoutTask] = (self._run_task(name, func) for name, func in tasks.items())
+            pool = None
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers)
+            results = pool.map(lambda item: self._run_task(*item), tasks.items())
+        try:
+            for task in results:
+                run.tasks.append(task)
+                self._checkpoint(run)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
 
         run.completed_at = datetime.now().isoformat()
         self._checkpoint(run)
+        self._write_summary(run)
         logger.info("scout_run_completed", extra={"run_id": run.run_id})
         return run
 
@@ -115,6 +145,19 @@ class ScoutWorker:
         checkpoint_file.write_text(json.dumps(run.to_dict(), ensure_ascii=True, indent=2), encoding="utf-8")
         logger.debug("scout_checkpoint_saved", extra={"run_id": run.run_id, "path": str(checkpoint_file)})
 
+    def _write_summary(self, run: ScoutRun) -> None:
+        """Atomically write the task counts for a finished run."""
+        total, completed = run.counts()
+        self.summary_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.summary_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"total": total, "completed": completed}, f)
+            os.replace(tmp_name, self.summary_dir / f"{run.run_id}.json")
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
     def list_runs(self) -> List[str]:
         """List scout run IDs available on disk."""
         runs = [p.stem for p in self.scout_dir.glob("scout-*.json")]
@@ -130,4 +173,24 @@ class ScoutWorker:
             return ScoutRun.from_dict(data)
         except (json.JSONDecodeError, OSError, ValueError) as e:
             logger.warning("Failed to load scout run %s: %s", run_id, e)
-            return None
\ No newline at end of file
+            return None
+
+    def list_run_summaries(self) -> List[Tuple[str, int, int]]:
+        """List ``(run_id, total, completed)`` for each run on disk.
+
+        Reads the small summary sidecar written when a run finishes and only
+        loads the full checkpoint for runs without one (older or interrupted).
+        """
+        summaries = []
+        for run_id in self.list_runs():
+            try:
+                with open(self.summary_dir / f"{run_id}.json", "r", encoding="utf-8") as f:
+                    counts = json.load(f)
+                summaries.append((run_id, int(counts["total"]), int(counts["completed"])))
+                continue
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+            run = self.load_run(run_id)
+            total, completed = run.counts() if run else (0, 0)
+            summaries.append((run_id, total, completed))
+        return summaries
@@ -275,7 +275,7 @@ class PersistentStorage:
                     message.message_type.value,
                     message.content,
                     json.dumps(message.context),
-                    message.timestamp.isoformat(),
+                    message.timestamp_iso(),
                     message.response_to,
                     message.issue_number
                 ))
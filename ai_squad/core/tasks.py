@@ -0,0 +1,205 @@
+"""Detached background tasks for long-running Captain deployments.
+
+A task is a JSON record under ``<runtime_dir>/tasks`` plus a detached
+``python -m ai_squad.core.tasks`` worker process that runs Captain and
+writes the outcome back, so the CLI can return immediately and poll later.
+"""
+from dataclasses import dataclass, asdict
+from datetime import datetime
+import json
+import logging
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+import uuid
+
+from ai_squad.core.retry import RetryConfig
+from ai_squad.core.runtime_paths import resolve_runtime_dir
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SquadTask:
+    task_id: str
+    issue_number: int
+    kind: str = "captain"
+    status: str = "queued"  # queued|running|completed|failed
+    attempts: int = 0
+    pid: Optional[int] = None
+    max_parallel: Optional[int] = None
+    created_at: str = ""
+    started_at: Optional[str] = None
+    completed_at: Optional[str] = None
+    output: Optional[str] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "SquadTask":
+        return SquadTask(**data)
+
+
+class TaskManager:
+    """Queue, run, and look up background tasks for a workspace."""
+
+    def __init__(self, workspace_root: Optional[Path] = None, config: Optional[Dict[str, Any]] = None):
+        self.workspace_root = Path(workspace_root or Path.cwd())
+        self.tasks_dir = resolve_runtime_dir(self.workspace_root, config=config) / "tasks"
+
+    def _path(self, task_id: str) -> Path:
+        return self.tasks_dir / f"{task_id}.json"
+
+    def save(self, task: SquadTask) -> None:
+        """Write a task record atomically so pollers never see a partial file."""
+        self.tasks_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.tasks_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(task.to_dict(), f, indent=2)
+            os.replace(tmp_name, self._path(task.task_id))
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    def get(self, task_id: str) -> Optional[SquadTask]:
+        try:
+            with open(self._path(task_id), "r", encoding="utf-8") as f:
+                return SquadTask.from_dict(json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def submit_captain(self, issue_number: int, max_parallel: Optional[int] = None) -> SquadTask:
+        """Record a Captain task and start a detached worker for it."""
+        task = SquadTask(
+            task_id=f"task-{uuid.uuid4().hex[:8]}",
+            issue_number=issue_number,
+            max_parallel=max_parallel,
+            created_at=datetime.now().isoformat(),
+        )
+        self.save(task)
+
+        if os.name == "nt":
+            detach: Dict[str, Any] = {
+                "creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+            }
+        else:
+            detach = {"start_new_session": True}
+
+        with open(self.tasks_dir / f"{task.task_id}.log", "ab") as log:
+            process = subprocess.Popen(
+                [sys.executable, "-m", "ai_squad.core.tasks", task.task_id],
+                cwd=self.workspace_root,
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                **detach,
+            )
+
+        # The worker records its own pid when it starts; saving here would race it
+        logger.info("Queued %s for Captain on issue #%s (pid %s)", task.task_id, issue_number, process.pid)
+        return task
+
+    def run(self, task_id: str, retry: Optional[RetryConfig] = None, executor: Any = None) -> SquadTask:
+        """Run a queued Captain task in this process, retrying failed attempts."""
+        task = self.get(task_id)
+        if task is None:
+            raise ValueError(f"Task not found: {task_id}")
+
+        retry = retry or RetryConfig(max_attempts=3, initial_delay=5.0)
+
+        task.status = "running"
+        task.pid = os.getpid()
+        task.started_at = datetime.now().isoformat()
+        self.save(task)
+
+        owned_executor = None
+        try:
+            if executor is None:
+                from ai_squad.core.agent_executor import AgentExecutor
+                executor = owned_executor = AgentExecutor()
+                if task.max_parallel:
+                    executor.agents[task.kind].max_parallel = task.max_parallel
+            self._run_attempts(task, retry, executor)
+        except Exception as exc:  # pylint: disable=broad-except
+            # Anything escaping here would leave the record stuck in "running"
+            logger.exception("%s crashed", task_id)
+            task.status = "failed"
+            task.error = f"{type(exc).__name__}: {exc}"
+        finally:
+            if owned_executor is not None:
+                owned_executor.close()
+
+        task.completed_at = datetime.now().isoformat()
+        self.save(task)
+        return task
+
+    def _run_attempts(self, task: SquadTask, retry: RetryConfig, executor: Any) -> None:
+        for attempt in range(retry.max_attempts):
+            task.attempts = attempt + 1
+            try:
+                result = executor.execute(task.kind, task.issue_number)
+            except (RuntimeError, OSError, ValueError) as exc:
+                result = {"success": False, "error": str(exc)}
+
+            if result.get("success"):
+                task.status = "completed"
+                task.output = result.get("output")
+                task.error = None
+                return
+
+            task.error = result.get("error")
+            if attempt < retry.max_attempts - 1:
+                delay = retry.get_delay(attempt)
+                logger.warning("%s attempt %s failed: %s. Retrying in %.1fs", task.task_id, attempt + 1, task.error, delay)
+                self.save(task)
+                time.sleep(delay)
+        task.status = "failed"
+
+    def is_orphaned(self, task: SquadTask) -> bool:
+        """True if the task claims to be running but its worker process is gone."""
+        return task.status == "running" and task.pid is not None and not _pid_alive(task.pid)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Best-effort check that a process with this pid still exists."""
+    if os.name == "nt":
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        try:
+            exit_code = ctypes.c_ulong()
+            kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+            return exit_code.value == 259  # STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Worker entry point: ``python -m ai_squad.core.tasks <task_id>``."""
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 1:
+        print("usage: python -m ai_squad.core.tasks <task_id>", file=sys.stderr)
+        return 2
+    logging.basicConfig(level=logging.INFO)
+    task = TaskManager().run(args[0])
+    return 0 if task.status == "completed" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
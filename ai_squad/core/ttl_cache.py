@@ -0,0 +1,67 @@
+"""
+Short-lived on-disk cache for results shared across CLI invocations.
+
+Each entry is a small JSON file whose mtime decides freshness, so repeated
+commands (e.g. ``squad captain 123`` while iterating) can skip slow
+subprocess or GitHub round-trips for a few seconds to minutes.
+"""
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+
+def cache_dir() -> Path:
+    """Directory holding cache entries (``~/.cache/ai-squad``)"""
+    return Path.home() / ".cache" / "ai-squad"
+
+
+def ttl_get(
+    key: str,
+    ttl: float,
+    loader: Callable[[], Any],
+    cache_if: Optional[Callable[[Any], bool]] = None,
+    directory: Optional[Path] = None,
+) -> Any:
+    """
+    Return a cached value younger than ``ttl`` seconds, else load and store it.
+
+    Args:
+        key: Cache entry name (used as the file name)
+        ttl: Seconds an entry stays fresh
+        loader: Produces the value on a miss; must return JSON-serializable data
+        cache_if: Only store values for which this returns True (default: all)
+        directory: Override the cache directory
+
+    Returns:
+        Cached or freshly loaded value
+    """
+    path = (directory or cache_dir()) / f"{key}.json"
+    try:
+        if path.stat().st_mtime > time.time() - ttl:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)["value"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    value = loader()
+    if cache_if is None or cache_if(value):
+        _write_atomic(path, {"value": value, "ts": time.time()})
+    return value
+
+
+def _write_atomic(path: Path, payload: Any) -> None:
+    """Write JSON via a temp file and os.replace; cache failures are ignored"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp_name, path)
+        except (OSError, TypeError, ValueError):
+            os.unlink(tmp_name)
+    except OSError:
+        pass
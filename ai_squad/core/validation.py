@@ -21,8 +21,9 @@ Architecture:
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +127,15 @@ class PrerequisiteValidator:
         ]
     }
 
+    # Agent that produces each prerequisite
+    PRODUCERS: Dict[PrerequisiteType, AgentType] = {
+        PrerequisiteType.PRD: AgentType.PM,
+        PrerequisiteType.ADR: AgentType.ARCHITECT,
+        PrerequisiteType.SPEC: AgentType.ARCHITECT,
+        PrerequisiteType.UX_DESIGN: AgentType.UX,
+        PrerequisiteType.IMPLEMENTATION: AgentType.ENGINEER,
+    }
+
     # Prerequisite definitions with file path patterns
     PREREQUISITE_REGISTRY: Dict[PrerequisiteType, Prerequisite] = {
         PrerequisiteType.PRD: Prerequisite(
@@ -237,6 +247,62 @@ class PrerequisiteValidator:
             missing_prerequisites=[]
         )
 
+    def validate_many(
+        self,
+        agent_type: AgentType,
+        issue_numbers: Iterable[int],
+    ) -> Dict[int, ValidationResult]:
+        """
+        Validate prerequisites for several issues in one pass (non-strict).
+
+        Each prerequisite directory is listed once and every issue is checked
+        against that listing, instead of stat-ing one file per issue.
+
+        Args:
+            agent_type: Type of agent to validate
+            issue_numbers: GitHub issue numbers to check
+
+        Returns:
+            Mapping of issue number to ValidationResult
+        """
+        required = [self.PREREQUISITE_REGISTRY[t] for t in self.DEPENDENCIES.get(agent_type, [])]
+
+        listings: Dict[PrerequisiteType, Set[str]] = {}
+        for prerequisite in required:
+            if not prerequisite.path_pattern:
+                continue
+            directory = self.workspace_root / Path(prerequisite.path_pattern).parent
+            try:
+                listings[prerequisite.type] = set(os.listdir(directory))
+            except OSError:
+                listings[prerequisite.type] = set()
+
+        results: Dict[int, ValidationResult] = {}
+        for issue_number in issue_numbers:
+            missing = []
+            for prerequisite in required:
+                if prerequisite.type == PrerequisiteType.IMPLEMENTATION:
+                    exists = False  # No PR number in bulk mode (see _check_prerequisite_exists)
+                elif not issue_number:
+                    exists = False
+                else:
+                    name = Path(prerequisite.path_pattern.format(issue=issue_number)).name
+                    exists = name in listings[prerequisite.type]
+                if not exists:
+                    missing.append(prerequisite)
+
+            if missing:
+                results[issue_number] = ValidationResult(
+                    valid=False,
+                    missing_prerequisites=missing,
+                    error_message=self._build_error_message(agent_type, missing),
+                    resolution_hint=self._build_resolution_hint(agent_type, missing)
+                )
+            else:
+                results[issue_number] = ValidationResult(valid=True, missing_prerequisites=[])
+
+        return results
+
     def _check_prerequisite_exists(
         self,
         prerequisite: Prerequisite,
@@ -375,15 +441,7 @@ This enforces the AI-Squad workflow: PM → Architect → Engineer → Reviewer
 
             # Find which agents provide these prerequisites
             for prereq_type in required_prereqs:
-                # Find agents that produce this prerequisite
-                if prereq_type == PrerequisiteType.PRD:
-                    dependents[AgentType.PM].append(agent_type)
-                elif prereq_type in [PrerequisiteType.ADR, PrerequisiteType.SPEC]:
-                    dependents[AgentType.ARCHITECT].append(agent_type)
-                elif prereq_type == PrerequisiteType.UX_DESIGN:
-                    dependents[AgentType.UX].append(agent_type)
-                elif prereq_type == PrerequisiteType.IMPLEMENTATION:
-                    dependents[AgentType.ENGINEER].append(agent_type)
+                dependents[self.PRODUCERS[prereq_type]].append(agent_type)
 
         # Kahn's algorithm for topological sort
         queue = [agent for agent, degree in in_degree.items() if degree == 0]
@@ -405,6 +463,24 @@ This enforces the AI-Squad workflow: PM → Architect → Engineer → Reviewer
 
         return result
 
+    def dependency_levels(self) -> Dict[AgentType, int]:
+        """
+        Return the depth of each agent in the dependency graph.
+
+        Agents on the same level do not depend on each other (e.g.
+        Architect and UX both only need the PRD) and may run concurrently.
+
+        Returns:
+            Mapping of agent type to level (0 = no prerequisites)
+        """
+        levels: Dict[AgentType, int] = {}
+        for agent_type in self.topological_sort_agents():
+            levels[agent_type] = max(
+                (levels[self.PRODUCERS[prereq]] + 1 for prereq in self.DEPENDENCIES[agent_type]),
+                default=0,
+            )
+        return levels
+
 
 def validate_agent_execution(
     agent_type: str,
@@ -448,3 +524,37 @@ def validate_agent_execution(
     # Create validator and validate
     validator = PrerequisiteValidator(workspace_root)
     return validator.validate(agent_enum, issue_number, pr_number, strict)
+
+
+def validate_agent_execution_bulk(
+    agent_type: str,
+    issue_numbers: Iterable[int],
+    workspace_root: Optional[Path] = None,
+) -> Dict[int, ValidationResult]:
+    """
+    Validate one agent type against many issues with a single workspace scan.
+
+    Non-strict counterpart of validate_agent_execution for batch runs.
+
+    Args:
+        agent_type: Agent type as string (pm, architect, engineer, ux, reviewer)
+        issue_numbers: GitHub issue numbers
+        workspace_root: Workspace root directory (defaults to current directory)
+
+    Returns:
+        Mapping of issue number to ValidationResult
+
+    Raises:
+        ValueError: If agent_type is not a known agent
+    """
+    if workspace_root is None:
+        workspace_root = Path.cwd()
+
+    try:
+        agent_enum = AgentType(agent_type.lower())
+    except ValueError as exc:
+        raise ValueError(
+            f"Invalid agent type: {agent_type}. Valid types: {[a.value for a in AgentType]}"
+        ) from exc
+
+    return PrerequisiteValidator(workspace_root).validate_many(agent_enum, issue_numbers)
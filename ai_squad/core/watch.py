@@ -6,6 +6,7 @@ Monitors GitHub for label changes and triggers agents automatically.
 # ruff: noqa: BLE001
 # pylint: disable=broad-except
 import time
+from dataclasses import dataclass
 from typing import Dict, List, Set, Optional
 from datetime import datetime
 from rich.live import Live
@@ -59,6 +60,19 @@ class WatchDaemon:
         # Initialize status manager
         from ai_squad.core.status import StatusManager
         self.status_manager = StatusManager(self.github)
+
+    @classmethod
+    def from_validated(cls, validated: "ValidatedWatchConfig") -> "WatchDaemon":
+        """
+        Build a daemon from an already-validated watch configuration
+        
+        Args:
+            validated: Result of ValidatedWatchConfig.from_config
+            
+        Returns:
+            WatchDaemon reusing the loaded config (no re-parse)
+        """
+        return cls(validated.config, interval=validated.interval, repo=validated.repo)
         
     def run(self):
         """Main watch loop"""
@@ -93,6 +107,8 @@ class WatchDaemon:
             except KeyboardInterrupt:
                 self.console.print("\n[yellow]Stopping watch mode...[/yellow]")
                 self._print_summary()
+            finally:
+                self.executor.close()
     
     def _check_for_triggers(self) -> List[Dict]:
         """Check for orchestration labels and status changes on issues"""
@@ -297,3 +313,52 @@ class WatchConfig:
         if interval > cls.MAX_INTERVAL:
             return cls.MAX_INTERVAL
         return interval
+
+
+class WatchConfigError(ValueError):
+    """Raised when watch mode prerequisites are not configured"""
+
+
+@dataclass
+class ValidatedWatchConfig:
+    """
+    Watch settings resolved once from the loaded config
+    
+    Authentication is not part of this config: the daemon talks to GitHub
+    through the ``gh`` CLI, which the watch command checks separately.
+    """
+    
+    config: Config
+    repo: str
+    interval: int = WatchConfig.DEFAULT_INTERVAL
+    
+    @classmethod
+    def from_config(
+        cls,
+        config: Config,
+        repo: Optional[str] = None,
+        interval: int = WatchConfig.DEFAULT_INTERVAL,
+    ) -> "ValidatedWatchConfig":
+        """
+        Resolve repo and interval from an already-loaded config
+        
+        Args:
+            config: Loaded AI-Squad configuration
+            repo: GitHub repo (owner/repo) - overrides config
+            interval: Requested polling interval in seconds
+            
+        Returns:
+            ValidatedWatchConfig instance
+            
+        Raises:
+            WatchConfigError: If no GitHub repo is configured
+        """
+        resolved_repo = repo or config.github_repo
+        if not resolved_repo:
+            raise WatchConfigError("GitHub repo not configured")
+        
+        return cls(
+            config=config,
+            repo=resolved_repo,
+            interval=WatchConfig.validate_interval(interval),
+        )
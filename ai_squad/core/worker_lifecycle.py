@@ -5,11 +5,13 @@ Tracks ephemeral worker runs for AI-Squad agents.
 """
 import json
 import logging
+import threading
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from ai_squad.core.runtime_paths import resolve_runtime_dir
 
@@ -28,6 +30,11 @@ class WorkerInstance:
     error: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def mark_failed(self, error: str) -> None:
+        """Record a failure; persisted when the enclosing session ends."""
+        self.status = "failed"
+        self.error = error
+
 
 class WorkerLifecycleManager:
     """Persist worker lifecycle state under .squad/workers.json."""
@@ -42,6 +49,8 @@ class WorkerLifecycleManager:
         runtime_dir = resolve_runtime_dir(self.workspace_root, config=config, base_dir=base_dir)
         self.squad_dir = runtime_dir
         self.workers_file = runtime_dir / "workers.json"
+        # Serializes load/modify/save when agents run in worker threads
+        self._lock = threading.Lock()
         self._ensure_dir()
 
     def spawn(self, agent_type: str, issue_number: Optional[int] = None, work_item_id: Optional[str] = None) -> WorkerInstance:
@@ -51,29 +60,60 @@ class WorkerLifecycleManager:
             issue_number=issue_number,
             work_item_id=work_item_id,
         )
-        workers = self._load()
-        workers[worker.id] = worker
-        self._save(workers)
+        self._put(worker)
         return worker
 
+    @contextmanager
+    def session(
+        self,
+        agent_type: str,
+        issue_number: Optional[int] = None,
+        work_item_id: Optional[str] = None,
+    ) -> Iterator[WorkerInstance]:
+        """
+        Track a worker run with a single state write when it finishes.
+
+        Unlike spawn()/complete(), the worker is not persisted while running.
+        It is stored as completed on normal exit, or failed if the body calls
+        mark_failed() or raises (the exception propagates).
+        """
+        worker = WorkerInstance(
+            id=f"worker-{uuid.uuid4().hex[:8]}",
+            agent_type=agent_type,
+            issue_number=issue_number,
+            work_item_id=work_item_id,
+        )
+        try:
+            yield worker
+        except BaseException as exc:
+            if worker.status == "running":
+                worker.mark_failed(str(exc))
+            raise
+        finally:
+            if worker.status == "running":
+                worker.status = "completed"
+            worker.completed_at = datetime.now().isoformat()
+            self._put(worker)
+
     def complete(self, worker_id: str) -> None:
-        workers = self._load()
-        worker = workers.get(worker_id)
-        if not worker:
-            return
-        worker.status = "completed"
-        worker.completed_at = datetime.now().isoformat()
-        self._save(workers)
+        with self._lock:
+            workers = self._load()
+            worker = workers.get(worker_id)
+            if not worker:
+                return
+            worker.status = "completed"
+            worker.completed_at = datetime.now().isoformat()
+            self._save(workers)
 
     def fail(self, worker_id: str, error: str) -> None:
-        workers = self._load()
-        worker = workers.get(worker_id)
-        if not worker:
-            return
-        worker.status = "failed"
-        worker.error = error
-        worker.completed_at = datetime.now().isoformat()
-        self._save(workers)
+        with self._lock:
+            workers = self._load()
+            worker = workers.get(worker_id)
+            if not worker:
+                return
+            worker.mark_failed(error)
+            worker.completed_at = datetime.now().isoformat()
+            self._save(workers)
 
     def list(self, status: Optional[str] = None) -> List[WorkerInstance]:
         workers = list(self._load().values())
@@ -81,6 +121,12 @@ class WorkerLifecycleManager:
             workers = [w for w in workers if w.status == status]
         return workers
 
+    def _put(self, worker: WorkerInstance) -> None:
+        with self._lock:
+            workers = self._load()
+            workers[worker.id] = worker
+            self._save(workers)
+
     def _ensure_dir(self) -> None:
         self.squad_dir.mkdir(parents=True, exist_ok=True)
 
@@ -11,7 +11,7 @@ from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Dict, Any, List, Optional, ContextManager
+from typing import Dict, Any, Iterator, List, Optional, ContextManager
 
 from ai_squad.core.runtime_paths import resolve_runtime_dir
 
@@ -554,18 +554,27 @@ class WorkStateManager:
         convoy_id: Optional[str] = None
     ) -> List[WorkItem]:
         """List work items with optional filters"""
-        items = list(self._work_items.values())
-        
-        if status:
-            items = [i for i in items if i.status == status]
-        if agent:
-            items = [i for i in items if i.agent_assignee == agent]
-        if convoy_id:
-            items = [i for i in items if i.convoy_id == convoy_id]
+        return list(self.iter_work_items(status=status, agent=agent, convoy_id=convoy_id))
+    
+    def iter_work_items(
+        self,
+        status: Optional[WorkStatus] = None,
+        agent: Optional[str] = None,
+        convoy_id: Optional[str] = None
+    ) -> Iterator[WorkItem]:
+        """
+        Yield work items matching the filters, highest priority first
         
+        Filters are applied in a single pass without intermediate lists.
+        """
+        matches = (
+            i for i in self._work_items.values()
+            if (not status or i.status == status)
+            and (not agent or i.agent_assignee == agent)
+            and (not convoy_id or i.convoy_id == convoy_id)
+        )
         # Sort by priority (descending) then created_at
-        items.sort(key=lambda x: (-x.priority, x.created_at))
-        return items
+        yield from sorted(matches, key=lambda x: (-x.priority, x.created_at))
     
     # Agent Operations
     
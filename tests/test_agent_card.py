@@ -11,6 +11,8 @@ from ai_squad.core.agent_card import (
     PM_CARD,
     ARCHITECT_CARD,
     ENGINEER_CARD,
+    find_agents_for,
+    find_agents_for_all,
 )
 
 
@@ -49,6 +51,42 @@ class TestInputSchema:
         errors = schema.validate({"issue_number": 123})
         assert len(errors) == 0
     
+    def test_compiled_validator_handles_arbitrary_names(self):
+        """Test generated code embeds field names as literals, not code"""
+        name = "x'); import os; ('"
+        schema = InputSchema(required_fields=[name], field_types={name: "int"})
+        validate = schema.compile()
+        
+        assert validate({}) == [f"Missing required field: {name}"]
+        assert validate({name: "1"}) == [f"Field '{name}' expected int, got str"]
+        assert validate({name: 1}) == []
+    
+    def test_validate_type_table(self):
+        """Test table types accept subclasses and unknown names compare by name"""
+        from collections import OrderedDict
+        
+        schema = InputSchema(field_types={"n": "int", "meta": "dict", "when": "datetime"})
+        assert schema.validate({"n": 1, "meta": OrderedDict()}) == []
+        assert schema.validate({"n": True}) == ["Field 'n' expected int, got bool"]
+        assert schema.validate({"when": "today"}) == [
+            "Field 'when' expected datetime, got str"
+        ]
+    
+    def test_validate_recompiles_after_invalidate(self):
+        """Test compiled checks are reused until the schema is invalidated"""
+        schema = InputSchema(required_fields=["a"])
+        assert schema.validate({"a": 1}) == []
+        
+        schema.required_fields.append("b")
+        schema.field_types["a"] = "str"
+        assert schema.validate({"a": 1}) == []
+        
+        schema.invalidate_cache()
+        assert schema.validate({"a": 1}) == [
+            "Missing required field: b",
+            "Field 'a' expected str, got int",
+        ]
+    
     def test_to_from_dict(self):
         """Test serialization/deserialization"""
         schema = InputSchema(
@@ -105,6 +143,47 @@ class TestAgentCard:
             AgentCapability.CODE_GENERATION,
             AgentCapability.PRD_GENERATION,  # PM capability
         ])
+        assert card.can_handle([])
+    
+    def test_sequence_fields_stored_as_tuples(self):
+        """Test list inputs become tuples while to_dict still emits lists"""
+        card = AgentCard(name="x", display_name="X", description="d",
+                         capabilities=[AgentCapability.BUG_FIX], depends_on=["pm"], tags=["t"],
+                         output_schema=OutputSchema(artifacts=["a.md"]))
+        assert card.capabilities == (AgentCapability.BUG_FIX,)
+        assert card.depends_on == ("pm",) and card.tags == ("t",)
+        assert card.output_schema.artifacts == ("a.md",)
+        
+        data = card.to_dict()
+        assert data["dependsOn"] == ["pm"] and data["tags"] == ["t"]
+        assert data["outputSchema"]["artifacts"] == ["a.md"]
+        assert AgentCard.from_dict(data) == card
+    
+    def test_cards_dedupe_by_content(self):
+        """Test equal-content cards hash alike and collapse in a set"""
+        copies = [PM_CARD, AgentCard.from_json_copy(PM_CARD.to_json()), AgentCard.from_dict(PM_CARD.to_dict())]
+        assert len({*copies, ENGINEER_CARD}) == 2
+        
+        changed = AgentCard.from_json_copy(PM_CARD.to_json())
+        changed.version = "2.0.0"
+        changed.invalidate_cache()
+        assert changed != PM_CARD
+        assert len({PM_CARD, changed}) == 2
+    
+    def test_cards_use_slots(self):
+        """Test cards and schemas carry no per-instance __dict__"""
+        for obj in (PM_CARD, PM_CARD.input_schema, PM_CARD.output_schema):
+            assert not hasattr(obj, "__dict__")
+    
+    def test_capability_set_follows_changes(self):
+        """Test capability checks accept raw values and see invalidated changes"""
+        card = AgentCard(name="x", display_name="X", description="d",
+                         capabilities=[AgentCapability.BUG_FIX])
+        assert card.has_capability("bug-fix")
+        
+        card.capabilities += (AgentCapability.REFACTORING,)
+        card.invalidate_cache()
+        assert card.can_handle([AgentCapability.BUG_FIX, AgentCapability.REFACTORING])
     
     def test_validate_input(self):
         """Test input validation"""
@@ -143,6 +222,19 @@ class TestAgentCard:
         assert restored.version == original.version
         assert len(restored.capabilities) == len(original.capabilities)
     
+    def test_from_dict_skips_unknown_capabilities(self):
+        """Test unknown capability values are dropped and members are kept"""
+        card = AgentCard.from_dict({
+            "name": "x",
+            "capabilities": ["bug-fix", "time-travel", AgentCapability.CODE_REVIEW],
+        })
+        assert card.capabilities == (AgentCapability.BUG_FIX, AgentCapability.CODE_REVIEW)
+        assert all(isinstance(cap, AgentCapability) for cap in card.capabilities)
+        
+        from ai_squad.core.agent_card import _CAPABILITY_BY_VALUE
+        import sys
+        assert all(sys.intern(key) is key for key in _CAPABILITY_BY_VALUE)
+    
     def test_to_from_json(self):
         """Test JSON serialization roundtrip"""
         original = ENGINEER_CARD
@@ -152,6 +244,75 @@ class TestAgentCard:
         assert restored.name == original.name
         assert restored.description == original.description
         assert restored.capabilities == original.capabilities
+    
+    def test_json_bytes_and_indent(self):
+        """Test from_json accepts UTF-8 bytes and to_json matches json.dumps"""
+        import json
+        original = PM_CARD
+        assert original.to_json() == json.dumps(original.to_dict(), indent=2)
+        assert original.to_json(indent=None) == json.dumps(original.to_dict())
+        
+        restored = AgentCard.from_json(original.to_json().encode("utf-8"))
+        assert restored == original
+    
+    def test_schema_dicts_shared_across_cards(self):
+        """Test cards sharing a schema alias the same cached sub-dicts"""
+        schema = InputSchema(required_fields=["issue_number"])
+        output = OutputSchema(artifacts=["a.md"])
+        first = AgentCard(name="one", display_name="One", description="",
+                          input_schema=schema, output_schema=output)
+        second = AgentCard(name="two", display_name="Two", description="",
+                           input_schema=schema, output_schema=output)
+        assert first.to_dict()["inputSchema"] is second.to_dict()["inputSchema"]
+        assert first.to_dict()["outputSchema"] is second.to_dict()["outputSchema"]
+        
+        output.artifacts += ("b.md",)
+        first.invalidate_cache()
+        assert first.to_dict()["outputSchema"]["artifacts"] == ["a.md", "b.md"]
+    
+    def test_write_json_matches_compact(self):
+        """Test streamed JSON equals the compact encoding of to_dict()"""
+        import io
+        import json
+        card = AgentCard(
+            name="streamer",
+            display_name="Stream \u00e9",
+            description='quote " and newline\n',
+            capabilities=[AgentCapability.CODE_REVIEW],
+            input_schema=InputSchema(required_fields=["a"], field_types={"a": "int"}),
+            output_schema=OutputSchema(artifacts=["x.md"]),
+            metadata={"nested": [1, None]},
+        )
+        compact = card.to_json(indent=None)
+        assert card._dict_cache is None
+        assert compact == json.dumps(card.to_dict())
+        
+        buf = io.StringIO()
+        PM_CARD.write_json(buf)
+        assert buf.getvalue() == json.dumps(PM_CARD.to_dict())
+    
+    def test_from_json_cached_by_input(self):
+        """Test from_json shares instances per input and from_json_copy does not"""
+        blob = ARCHITECT_CARD.to_json()
+        shared = AgentCard.from_json(blob)
+        assert AgentCard.from_json(blob) is shared
+        
+        private = AgentCard.from_json_copy(blob)
+        assert private == shared and private is not shared
+        private.tags += ("local",)
+        assert "local" not in AgentCard.from_json(blob).tags
+    
+    def test_serialization_cached_until_invalidated(self):
+        """Test to_dict/to_json are memoized and invalidate_cache rebuilds them"""
+        card = AgentCard(name="x", display_name="X", description="d")
+        assert card.to_dict() is card.to_dict()
+        assert card.to_json() is card.to_json()
+        
+        card.tags += ("new",)
+        assert "new" not in card.to_json()
+        card.invalidate_cache()
+        assert card.to_dict()["tags"] == ["new"]
+        assert '"new"' in card.to_json()
 
 
 class TestDefaultCards:
@@ -211,6 +372,49 @@ class TestDefaultCards:
         assert AgentCapability.CODE_GENERATION in all_caps
         assert AgentCapability.CODE_REVIEW in all_caps
         assert AgentCapability.ADR_GENERATION in all_caps
+    
+    def test_default_cards_built_lazily(self):
+        """Test default cards are built on first access and shared with PM_CARD etc."""
+        import subprocess
+        import sys
+        
+        code = (
+            "import ai_squad.core.agent_card as m\n"
+            "print(len(m.DEFAULT_AGENT_CARDS._cards), 'pm' in m.DEFAULT_AGENT_CARDS)\n"
+            "print(m.PM_CARD is m.DEFAULT_AGENT_CARDS['pm'], len(m.DEFAULT_AGENT_CARDS._cards))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.split() == ["0", "True", "True", "1"]
+        assert ENGINEER_CARD is DEFAULT_AGENT_CARDS["engineer"]
+    
+    def test_default_cards_manifest(self):
+        """Test the manifest lists every default card and is built once"""
+        import json
+        from ai_squad.core import agent_card
+        
+        blob = agent_card.DEFAULT_CARDS_MANIFEST_JSON
+        assert agent_card.DEFAULT_CARDS_MANIFEST_JSON is blob
+        manifest = json.loads(blob)
+        assert manifest["@type"] == "CollectionPage"
+        assert [item["name"] for item in manifest["itemListElement"]] == list(DEFAULT_AGENT_CARDS)
+        assert manifest["itemListElement"][0] == PM_CARD.to_dict()
+    
+    def test_capability_index(self):
+        """Test capability lookups over the default cards"""
+        assert find_agents_for(AgentCapability.CODE_REVIEW) == (DEFAULT_AGENT_CARDS["reviewer"],)
+        assert find_agents_for_all([
+            AgentCapability.CODE_GENERATION,
+            AgentCapability.BUG_FIX,
+        ]) == (ENGINEER_CARD,)
+        assert find_agents_for_all([
+            AgentCapability.CODE_GENERATION,
+            AgentCapability.PRD_GENERATION,
+        ]) == ()
+        assert len(find_agents_for_all([])) == len(DEFAULT_AGENT_CARDS)
+        
+        for cap in AgentCapability:
+            expected = tuple(c for c in DEFAULT_AGENT_CARDS.values() if c.has_capability(cap))
+            assert find_agents_for(cap) == expected
 
 
 if __name__ == "__main__":
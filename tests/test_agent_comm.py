@@ -43,6 +43,21 @@ class TestAgentMessage:
         assert isinstance(msg.id, str)
         assert isinstance(msg.timestamp, datetime)
     
+    def test_message_is_slotted(self):
+        """Test messages use slots rather than a per-instance __dict__"""
+        message = AgentMessage(content="hi")
+        assert not hasattr(message, "__dict__")
+        with pytest.raises(AttributeError):
+            message.extra = "nope"
+    
+    def test_message_ids_unique_and_ordered(self):
+        """Test default ids are compact hex and sort by creation time"""
+        messages = [AgentMessage() for _ in range(50)]
+        ids = [m.id for m in messages]
+        assert len(set(ids)) == 50
+        assert all(len(i) == 32 and int(i, 16) >= 0 for i in ids)
+        assert [i[:16] for i in ids] == sorted(i[:16] for i in ids)
+    
     def test_message_to_dict(self):
         """Test message serialization"""
         msg = AgentMessage(
@@ -170,6 +185,31 @@ class TestAgentCommunicator:
         assert accepted["message_id"] == question_id
         assert accepted["source"] == "architect"
         assert accepted["destination"] == "pm"
+        assert accepted["metadata"] == {"context_keys": ["issue"]}
+    
+    def test_agent_names_interned(self):
+        """Test agent names built at runtime share the interned string"""
+        import sys
+        runtime_name = "".join(["arch", "itect"])
+        message = AgentMessage(from_agent=runtime_name, to_agent="".join(["p", "m"]))
+        assert message.from_agent is sys.intern("architect")
+        assert message.to_agent is sys.intern("pm")
+    
+    def test_timestamp_iso_formatted_once(self):
+        """Test the ISO timestamp is cached and used by to_dict()"""
+        message = AgentMessage(timestamp=datetime(2024, 5, 6, 7, 8, 9))
+        iso = message.timestamp_iso()
+        assert iso == "2024-05-06T07:08:09"
+        assert message.timestamp_iso() is iso
+        assert message.to_dict()["timestamp"] is iso
+    
+    def test_context_keys_sorted_once(self):
+        """Test context keys are sorted on first use and reused afterwards"""
+        message = AgentMessage(context={"b": 1, "a": 2})
+        keys = message.context_keys()
+        assert keys == ("a", "b")
+        assert message.context_keys() is keys
+        assert AgentMessage().context_keys() == ()
     
     def test_ask_question_manual(self, communicator_manual):
         """Test asking question in manual mode"""
@@ -258,6 +298,60 @@ class TestAgentCommunicator:
         assert len(conversation) == 4  # 2 questions + 2 responses for issue 123
         assert all(m.issue_number == 123 for m in conversation)
     
+    def test_indexes_track_responses(self, communicator_automated):
+        """Test pending and conversation lookups stay consistent after responses"""
+        comm = communicator_automated
+        q1 = comm.ask("architect", "pm", "Q1", {}, 123)
+        q2 = comm.ask("engineer", "pm", "Q2", {}, 123)
+        
+        assert [m.id for m in comm.get_pending_questions("pm")] == [q1, q2]
+        assert comm.get_pending_questions("nobody") == []
+        
+        assert comm.respond(q1, "A1", "pm") is True
+        assert comm.respond(q1, "A1 again", "pm") is True
+        assert [m.id for m in comm.get_pending_questions("pm")] == [q2]
+        
+        conversation = comm.get_conversation(123)
+        conversation.clear()
+        assert len(comm.get_conversation(123)) == 4
+        assert comm.get_conversation(456) == []
+    
+    def test_bounded_queue_evicts_oldest(self):
+        """Test the oldest messages and their index entries are evicted"""
+        comm = AgentCommunicator(execution_mode="manual", max_queued=3)
+        q1 = comm.ask("architect", "pm", "Q1", {}, 1)
+        comm.respond(q1, "A1", "pm")
+        q2 = comm.ask("architect", "pm", "Q2", {}, 1)
+        q3 = comm.ask("engineer", "pm", "Q3", {}, 2)
+        
+        assert len(comm.message_queue) == 3
+        assert q1 not in comm.responses
+        assert comm.respond(q1, "late", "pm") is False
+        assert [m.id for m in comm.get_pending_questions("pm")] == [q2, q3]
+        assert [m.content for m in comm.get_conversation(1)] == ["A1", "Q2"]
+        
+        comm.ask("ux", "architect", "Q4", {}, 3)
+        assert [m.content for m in comm.get_conversation(1)] == ["Q2"]
+    
+    def test_concurrent_ask_and_respond_keep_indexes_consistent(self):
+        """Test threads recording messages leave queue and indexes in sync"""
+        from concurrent.futures import ThreadPoolExecutor
+        comm = AgentCommunicator(execution_mode="manual", max_queued=50)
+        
+        def worker(n):
+            for i in range(40):
+                question_id = comm.ask(f"agent{n}", "pm", f"Q{i}", {}, n)
+                if i % 2:
+                    comm.respond(question_id, "A", "pm")
+                comm.get_pending_questions("pm")
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(worker, range(8)))
+        
+        assert len(comm.message_queue) == 50
+        assert set(comm._by_id) == {m.id for m in comm.message_queue}
+        assert sum(len(comm.get_conversation(n)) for n in range(8)) == 50
+    
     def test_message_threading(self, communicator_automated):
         """Test response_to field links messages"""
         question_id = communicator_automated.ask(
@@ -450,6 +544,67 @@ class TestGitHubIntegration:
         assert call_args[0][0] == 123  # Issue number
         assert "clarification" in call_args[0][1].lower()  # Comment contains "clarification"
 
+    
+    def test_response_comment_keeps_literal_braces(self):
+        """Test templated comments insert message text verbatim"""
+        github = Mock()
+        communicator = AgentCommunicator(execution_mode="manual", github_tool=github)
+        
+        question_id = communicator.ask("architect", "pm", "Use {config}?", {}, 7)
+        communicator.respond(question_id, "Yes, {config} is fine", "pm")
+        
+        comment = github.add_comment.call_args[0][1]
+        assert "**From**: Pm Agent  \n**In Response To**: Architect Agent" in comment
+        assert "**Answer**: Yes, {config} is fine" in comment
+        assert "*Original Question: Use {config}?*" in comment
+
+    
+    def test_no_comment_rendered_without_github(self):
+        """Test posting helpers return before rendering when GitHub is absent"""
+        communicator = AgentCommunicator(execution_mode="automated")
+        message = AgentMessage(from_agent="architect", to_agent="pm", content="Q", issue_number=9)
+        
+        with patch("ai_squad.core.agent_comm._render_comment") as render:
+            communicator._post_clarification_request(message)
+            communicator._post_response(message, message)
+            communicator._request_user_clarification(message)
+        
+        render.assert_not_called()
+    
+    def test_background_comments_coalesce_per_issue(self):
+        """Test queued comments are posted off-thread and merged per issue"""
+        github = Mock()
+        communicator = AgentCommunicator(
+            execution_mode="manual", github_tool=github, background_comments=True
+        )
+        
+        question_id = communicator.ask("architect", "pm", "Q1", {}, 5)
+        communicator.respond(question_id, "A1", "pm")
+        communicator.ask("engineer", "pm", "Q2", {}, 6)
+        
+        assert communicator.flush(timeout=5)
+        posted = [call.args for call in github.add_comment.call_args_list]
+        assert [issue for issue, _ in posted] == [5, 6]
+        assert posted[0][1].count("\n---\n") == 2  # Request, Copilot prompt, response
+        assert "**Answer**: A1" in posted[0][1]
+        assert posted[1][1].count("\n---\n") == 1
+    
+    def test_close_posts_queued_comments_and_stops_poster(self):
+        """Test close() drains the background queue and joins the poster thread"""
+        github = Mock()
+        communicator = AgentCommunicator(
+            execution_mode="manual", github_tool=github, background_comments=True
+        )
+        
+        communicator.ask("architect", "pm", "Q1", {}, 5)
+        poster = communicator._comment_thread
+        
+        assert communicator.close(timeout=5)
+        assert not poster.is_alive()
+        assert communicator._comment_thread is None
+        assert [call.args[0] for call in github.add_comment.call_args_list] == [5]
+        assert communicator.close()  # Nothing left to stop
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
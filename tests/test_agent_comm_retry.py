@@ -3,7 +3,14 @@ Tests for AgentCommunicator retry logic and circuit breaker
 """
 import pytest
 from unittest.mock import Mock, patch
-from ai_squad.core.agent_comm import AgentCommunicator, AgentMessage, MessageType
+from ai_squad.core.agent_comm import (
+    AgentCommunicator,
+    AgentMessage,
+    MessageType,
+    RecoverableHandlerError,
+    UnrecoverableHandlerError,
+)
+from ai_squad.core.retry import CircuitState
 
 
 class TestRetryLogic:
@@ -44,8 +51,8 @@ class TestRetryLogic:
             
             # Fail twice, succeed on third attempt
             mock_handler = Mock(side_effect=[
-                Exception("Temporary error"),
-                Exception("Temporary error"),
+                ConnectionError("Temporary error"),
+                TimeoutError("Temporary error"),
                 {"response": "success"},
             ])
             
@@ -61,7 +68,7 @@ class TestRetryLogic:
                 content="Test",
             )
             
-            with patch('time.sleep'):  # Speed up test
+            with patch('asyncio.sleep'):  # Speed up test
                 result = communicator._route_message(message)
             
             assert result == "success"
@@ -75,7 +82,7 @@ class TestRetryLogic:
             mock_reg = Mock()
             
             # Always fail
-            mock_handler = Mock(side_effect=Exception("Persistent error"))
+            mock_handler = Mock(side_effect=RecoverableHandlerError("Persistent error"))
             
             mock_reg.get_handler.return_value = mock_handler
             mock_reg.is_circuit_open.return_value = False
@@ -88,7 +95,7 @@ class TestRetryLogic:
                 content="Test",
             )
             
-            with patch('time.sleep'):  # Speed up test
+            with patch('asyncio.sleep'):  # Speed up test
                 result = communicator._route_message(message)
             
             assert result is None
@@ -102,7 +109,7 @@ class TestRetryLogic:
             mock_handler = Mock(return_value={"response": "success"})
             
             mock_reg.get_handler.return_value = mock_handler
-            mock_reg.is_circuit_open.return_value = True  # Circuit is open
+            mock_reg.circuit_state.return_value = CircuitState.OPEN
             mock_registry.return_value = mock_reg
             
             message = AgentMessage(
@@ -116,13 +123,63 @@ class TestRetryLogic:
             assert result is None
             assert mock_handler.call_count == 0  # Should not call handler
     
+    def test_half_open_sends_single_probe(self):
+        """Test a half-open circuit gets one probe attempt and no retries"""
+        from ai_squad.core.agent_registry import AgentRegistry
+        import time
+        
+        registry = AgentRegistry(auto_register_defaults=True)
+        communicator = AgentCommunicator(execution_mode="automated", registry=registry)
+        handler = Mock(side_effect=ConnectionError("still down"))
+        registry.register_handler("engineer", handler)
+        for _ in range(AgentRegistry.CIRCUIT_FAILURE_THRESHOLD):
+            registry.record_failure("engineer")
+        registry._circuit_open_until["engineer"] = time.time() - 1
+        
+        events = []
+        communicator._emit_routing_event = lambda message, **kw: events.append(kw["status"])
+        message = AgentMessage(from_agent="pm", to_agent="engineer", content="Test")
+        
+        with patch('ai_squad.core.agent_registry.get_registry') as global_registry, \
+                patch('asyncio.sleep') as mock_sleep:
+            assert communicator._route_message(message) is None
+        
+        assert handler.call_count == 1
+        global_registry.assert_not_called()  # Injected registry is used
+        mock_sleep.assert_not_called()
+        assert events == ["probe", "failed"]
+        assert registry.circuit_state("engineer") is CircuitState.OPEN
+        
+        # After the next cooldown a successful probe closes the circuit
+        handler.side_effect = None
+        handler.return_value = {"response": "back"}
+        registry._circuit_open_until["engineer"] = time.time() - 1
+        assert communicator._route_message(message) == "back"
+        assert registry.circuit_state("engineer") is CircuitState.CLOSED
+    
+    def test_global_registry_resolved_per_message(self, communicator):
+        """Test routing follows the current global registry after a reset"""
+        from ai_squad.core.agent_registry import get_registry, reset_registry
+        message = AgentMessage(from_agent="pm", to_agent="engineer", content="Test")
+        
+        try:
+            reset_registry()
+            get_registry().register_handler("engineer", lambda payload: {"response": "first"})
+            assert communicator._route_message(message) == "first"
+            
+            reset_registry()
+            get_registry().register_handler("engineer", lambda payload: {"response": "second"})
+            assert communicator._route_message(message) == "second"
+        finally:
+            reset_registry()
+    
     def test_exponential_backoff(self, communicator):
         """Test exponential backoff between retries"""
         with patch('ai_squad.core.agent_registry.get_registry') as mock_registry:
             mock_reg = Mock()
             mock_handler = Mock(side_effect=[
-                Exception("Error 1"),
-                Exception("Error 2"),
+                ConnectionError("Error 1"),
+                ConnectionError("Error 2"),
                 {"response": "success"},
             ])
             
@@ -138,14 +195,105 @@ class TestRetryLogic:
                 content="Test",
             )
             
-            with patch('time.sleep') as mock_sleep:
+            with patch('asyncio.sleep') as mock_sleep:
                 result = communicator._route_message(message)
             
-            # Check backoff delays: 1s, 2s
+            # Check jittered backoff delays: 1s, 2s +/- 50%
             assert mock_sleep.call_count == 2
             delays = [call[0][0] for call in mock_sleep.call_args_list]
-            assert delays[0] == 1.0  # First retry: 1 * 2^0
-            assert delays[1] == 2.0  # Second retry: 1 * 2^1
+            assert 0.5 <= delays[0] <= 1.5  # First retry: 1 * 2^0
+            assert 1.0 <= delays[1] <= 3.0  # Second retry: 1 * 2^1
+    
+    @pytest.mark.parametrize("error", [
+        UnrecoverableHandlerError("Bad request"),
+        TypeError("handler() takes 0 positional arguments"),
+        KeyError("missing"),
+    ])
+    def test_unrecoverable_error_fails_fast(self, communicator, error):
+        """Test non-transient errors are not retried or counted by the breaker"""
+        with patch('ai_squad.core.agent_registry.get_registry') as mock_registry:
+            mock_reg = Mock()
+            mock_handler = Mock(side_effect=error)
+            mock_reg.get_handler.return_value = mock_handler
+            mock_reg.is_circuit_open.return_value = False
+            mock_registry.return_value = mock_reg
+            
+            message = AgentMessage(from_agent="pm", to_agent="engineer", content="Test")
+            
+            with patch('asyncio.sleep') as mock_sleep:
+                result = communicator._route_message(message)
+            
+            assert result is None
+            assert mock_handler.call_count == 1
+            mock_sleep.assert_not_called()
+            mock_reg.record_failure.assert_not_called()
+    
+    def test_async_handler_is_awaited(self, communicator):
+        """Test coroutine handlers are awaited on the loop, not run in a thread"""
+        calls = []
+        
+        async def handler(payload):
+            calls.append(payload["content"])
+            return {"response": "async ok"}
+        
+        with patch('ai_squad.core.agent_registry.get_registry') as mock_registry:
+            mock_reg = Mock()
+            mock_reg.get_handler.return_value = handler
+            mock_reg.is_circuit_open.return_value = False
+            mock_registry.return_value = mock_reg
+            
+            message = AgentMessage(from_agent="pm", to_agent="engineer", content="Ping")
+            
+            assert communicator._route_message(message) == "async ok"
+            assert calls == ["Ping"]
+    
+    def test_ask_inside_event_loop_routes_in_background(self, communicator):
+        """Test ask() from a running loop schedules routing instead of blocking"""
+        import asyncio
+        
+        async def handler(payload):
+            return {"response": "done"}
+        
+        async def run():
+            message_id = communicator.ask("pm", "engineer", "Q", {})
+            tasks = list(communicator._routing_tasks)
+            assert len(tasks) == 1
+            assert await tasks[0] == "done"
+            return message_id
+        
+        with patch('ai_squad.core.agent_registry.get_registry') as mock_registry:
+            mock_reg = Mock()
+            mock_reg.get_handler.return_value = handler
+            mock_reg.is_circuit_open.return_value = False
+            mock_registry.return_value = mock_reg
+            
+            message_id = asyncio.run(run())
+        
+        assert message_id == communicator.message_queue[0].id
+        assert not communicator._routing_tasks
+    
+    def test_backoff_uses_retry_config(self):
+        """Test a custom retry config controls attempts and delays"""
+        from ai_squad.core.retry import RetryConfig
+        communicator = AgentCommunicator(
+            execution_mode="automated",
+            retry_config=RetryConfig(max_attempts=2, initial_delay=0.25),
+        )
+        with patch('ai_squad.core.agent_registry.get_registry') as mock_registry:
+            mock_reg = Mock()
+            mock_handler = Mock(side_effect=Exception("Error"))
+            mock_reg.get_handler.return_value = mock_handler
+            mock_reg.is_circuit_open.return_value = False
+            mock_registry.return_value = mock_reg
+            
+            message = AgentMessage(from_agent="pm", to_agent="engineer", content="Test")
+            
+            with patch('asyncio.sleep') as mock_sleep:
+                result = communicator._route_message(message)
+            
+            assert result is None
+            assert mock_handler.call_count == 2
+            mock_sleep.assert_called_once_with(0.25)  # No jitter configured
     
     def test_routing_without_handler(self, communicator):
         """Test routing when agent has no handler"""
@@ -0,0 +1,154 @@
+"""
+Tests for AgentExecutor strategy/convoy entry points
+"""
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ai_squad.core.agent_executor import AgentExecutor, _validate_cached
+from ai_squad.core.config import Config
+from ai_squad.core.validation import validate_agent_execution, validate_agent_execution_bulk
+
+
+class TestExecutorEventLoop:
+    """Sync wrappers and native async entry points"""
+
+    @pytest.fixture
+    def executor(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        convoy_mgr = MagicMock()
+        convoy_mgr.execute_convoy = AsyncMock(return_value=SimpleNamespace(
+            status=SimpleNamespace(value="completed"),
+            members=[SimpleNamespace(status="completed"), SimpleNamespace(status="failed")],
+        ))
+        with patch.dict('os.environ', {'GITHUB_TOKEN': 'test_token'}):
+            executor = AgentExecutor(convoy_manager=convoy_mgr)
+        yield executor
+        executor.close()
+
+    def test_sync_convoy_reuses_loop(self, executor):
+        first = executor.execute_convoy("convoy-1")
+        loop = executor._loop
+        second = executor.execute_convoy("convoy-2")
+
+        assert first["success"] and second["success"]
+        assert first["completed"] == 1 and first["failed"] == 1
+        assert executor._loop is loop
+        assert not loop.is_closed()
+
+    def test_async_convoy_runs_on_caller_loop(self, executor):
+        result = asyncio.run(executor.aexecute_convoy("convoy-1"))
+
+        assert result["status"] == "completed"
+        assert executor._loop is None
+        executor.convoy_mgr.execute_convoy.assert_awaited_once_with("convoy-1")
+
+    def test_close_shuts_down_loop(self, executor):
+        executor.execute_convoy("convoy-1")
+        loop = executor._loop
+
+        executor.close()
+
+        assert loop.is_closed()
+        assert executor._loop is None
+        assert executor.execute_convoy("convoy-2")["success"]
+
+    def test_convoy_members_run_concurrently_up_to_limit(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        with patch.dict('os.environ', {'GITHUB_TOKEN': 'test_token'}):
+            executor = AgentExecutor()
+        executor.max_concurrency = 2
+        executor.workstate_mgr = MagicMock()
+        executor.workstate_mgr.get_work_item.return_value = SimpleNamespace(issue_number=7)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def execute(agent_type, issue_number):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return {"success": True, "output": agent_type}
+
+        executor.execute = execute
+        run_member = executor.convoy_mgr.agent_executor
+
+        async def run_all():
+            return await asyncio.gather(*[run_member("engineer", f"wi-{i}") for i in range(4)])
+
+        try:
+            assert executor._run(run_all()) == ["engineer"] * 4
+        finally:
+            executor.close()
+        assert state["peak"] == 2
+
+    def test_batch_validates_once_and_keeps_order(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "docs" / "prd").mkdir(parents=True)
+        (tmp_path / "docs" / "prd" / "PRD-1.md").write_text("# PRD")
+        with patch.dict('os.environ', {'GITHUB_TOKEN': 'test_token'}):
+            executor = AgentExecutor()
+        executor._execute_validated = lambda agent_type, issue: {"success": True, "output": f"{agent_type}-{issue}"}
+        jobs = [("architect", 1), ("architect", 2), ("pm", 3), ("nobody", 4)]
+
+        try:
+            with patch(
+                "ai_squad.core.agent_executor.validate_agent_execution_bulk",
+                wraps=validate_agent_execution_bulk,
+            ) as bulk:
+                results = executor.execute_batch(jobs)
+        finally:
+            executor.close()
+
+        bulk.assert_called_once()
+        assert results[0]["output"] == "architect-1"
+        assert results[1]["error_type"] == "prerequisite_validation"
+        assert results[2]["output"] == "pm-3"
+        assert "Unknown agent type" in results[3]["error"]
+
+    def test_prerequisite_validation_memoized_until_docs_change(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        with patch.dict('os.environ', {'GITHUB_TOKEN': 'test_token'}):
+            executor = AgentExecutor()
+        executor._execute_validated = lambda agent_type, issue: {"success": True}
+        _validate_cached.cache_clear()
+
+        with patch(
+            "ai_squad.core.agent_executor.validate_agent_execution",
+            wraps=validate_agent_execution,
+        ) as validate:
+            assert executor.execute("architect", 5)["error_type"] == "prerequisite_validation"
+            assert executor.execute("architect", 5)["error_type"] == "prerequisite_validation"
+            assert validate.call_count == 1
+
+            (tmp_path / "docs" / "prd").mkdir(parents=True)
+            (tmp_path / "docs" / "prd" / "PRD-5.md").write_text("# PRD")
+            assert executor.execute("architect", 5)["success"]
+            assert validate.call_count == 2
+
+    def test_cli_routing_uses_configured_defaults(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        config = Config.load()
+        config.data["routing"].update({
+            "enforce_cli_routing": True,
+            "trust_level": "medium",
+            "priority": "high",
+        })
+        with patch.dict('os.environ', {'GITHUB_TOKEN': 'test_token'}):
+            executor = AgentExecutor(config=config)
+        executor.org_router = MagicMock()
+        executor.org_router.route.return_value = None
+
+        result = executor.execute("pm", 11)
+
+        assert result["error"] == "Routing policy blocked this agent"
+        kwargs = executor.org_router.route.call_args.kwargs
+        assert kwargs["trust_level"] == "medium"
+        assert kwargs["data_sensitivity"] == "internal"
+        assert kwargs["priority"] == "high"
@@ -17,6 +17,7 @@ from ai_squad.core.agent_card import (
     PM_CARD,
     ENGINEER_CARD,
 )
+from ai_squad.core.retry import CircuitState
 
 
 @pytest.fixture
@@ -239,6 +240,34 @@ class TestCircuitBreaker:
         assert not registry.is_circuit_open("pm")
         assert registry._failure_counts.get("pm", 0) == 0
 
+    
+    def test_half_open_probe(self, registry):
+        """Test cooldown leads to half-open with a single probe slot"""
+        for _ in range(5):
+            registry.record_failure("pm")
+        assert registry.circuit_state("pm") is CircuitState.OPEN
+        
+        registry._circuit_open_until["pm"] = time.time() - 1
+        assert registry.circuit_state("pm") is CircuitState.HALF_OPEN
+        assert registry.begin_probe("pm")
+        assert not registry.begin_probe("pm")  # Only one probe at a time
+        
+        registry.record_success("pm")
+        assert registry.circuit_state("pm") is CircuitState.CLOSED
+        assert not registry.begin_probe("pm")
+    
+    def test_failed_probe_doubles_cooldown(self, registry):
+        """Test a failed half-open probe reopens with a longer cooldown"""
+        for _ in range(5):
+            registry.record_failure("pm")
+        registry._circuit_open_until["pm"] = time.time() - 1
+        assert registry.begin_probe("pm")
+        
+        registry.record_failure("pm")
+        assert registry.circuit_state("pm") is CircuitState.OPEN
+        assert registry._circuit_cooldown["pm"] == 2 * AgentRegistry.CIRCUIT_COOLDOWN_SECONDS
+        assert registry._circuit_open_until["pm"] > time.time() + 60
+
 
 class TestHandlerInvocation:
     """Test handler registration and invocation"""
@@ -469,3 +469,34 @@ class TestBaseAgentOrchestration:
         
         assert hasattr(agent, 'ai_provider')
         assert agent.ai_provider is not None
+    
+    def test_lazy_helpers_created_once_across_threads(self, config):
+        """Test concurrent runs on a shared agent build one status manager"""
+        import threading
+        import time
+        
+        agent = ProductManagerAgent(config, sdk=None)
+        created = []
+        
+        def slow_manager(github):
+            time.sleep(0.01)
+            manager = Mock()
+            created.append(manager)
+            return manager
+        
+        barrier = threading.Barrier(4)
+        seen = []
+        
+        def read_manager():
+            barrier.wait()
+            seen.append(agent.status_manager)
+        
+        with patch('ai_squad.core.status.StatusManager', side_effect=slow_manager):
+            threads = [threading.Thread(target=read_manager) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        assert len(created) == 1
+        assert all(manager is created[0] for manager in seen)
@@ -0,0 +1,55 @@
+"""
+Tests for Squad Mission (autonomous) workflow
+"""
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+from ai_squad.core.autonomous import (
+    _acreate_mission_objectives,
+    _create_mission_objectives,
+)
+
+
+class TestMissionObjectives:
+    """Objective issue creation tests"""
+
+    def _github(self, fail_titles=()):
+        github = MagicMock()
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def create_issue(title, body, labels):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            if any(bad in title for bad in fail_titles):
+                return None
+            return {"number": int(title.split()[1].rstrip("]")) + 100}
+
+        github.create_issue.side_effect = create_issue
+        return github, state
+
+    def test_concurrent_creation_keeps_order(self):
+        github, state = self._github(fail_titles=("beta",))
+        analysis = {"objectives": ["alpha", "beta", "gamma", "delta"]}
+
+        issues = asyncio.run(_acreate_mission_objectives(
+            github, analysis, mission_issue=1, config={}, concurrency=2
+        ))
+
+        assert [issue["number"] for issue in issues] == [101, 103, 104]
+        assert github.add_comment.call_count == 3
+        assert state["peak"] == 2
+
+    def test_sync_creation_matches_async(self):
+        github, _ = self._github()
+        analysis = {"objectives": ["alpha", "beta"]}
+
+        issues = _create_mission_objectives(github, analysis, mission_issue=1, config={})
+
+        assert [issue["number"] for issue in issues] == [101, 102]
@@ -10,7 +10,7 @@ Tests cover:
 """
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 import tempfile
 import shutil
 
@@ -178,6 +178,15 @@ class TestCaptainExecution:
         
         assert result["success"] is True
         assert "456" in result["output"]
+    
+    def test_captain_execute_agent_reports_run_failure(self, captain_with_managers):
+        """Test _execute_agent surfaces a failed Captain run instead of succeeding"""
+        captain_with_managers.run = AsyncMock(side_effect=KeyError("pm"))
+        
+        result = captain_with_managers._execute_agent({"number": 123}, {})
+        
+        assert result["success"] is False
+        assert "pm" in result["error"]
 
 
 class TestTaskBreakdown:
@@ -305,6 +314,73 @@ class TestCaptainOrchestration:
         assert captain_with_managers.orchestration.get('workstate') is captain_with_managers.work_state_manager
         assert captain_with_managers.orchestration.get('strategy') is captain_with_managers.strategy_manager
 
+    @pytest.mark.asyncio
+    async def test_execute_plan_runs_independent_steps_concurrently(self, captain_with_managers):
+        """Test sequential steps fan out per dependency level, bounded by max_parallel"""
+        import asyncio
+
+        workstate = captain_with_managers.work_state_manager
+        prd = workstate.create_work_item(title="PRD", description="", labels=["pm"])
+        adr = workstate.create_work_item(title="ADR", description="", labels=["architect"])
+        ux = workstate.create_work_item(title="UX", description="", labels=["ux"])
+        workstate.add_dependency(adr.id, prd.id)
+        workstate.add_dependency(ux.id, prd.id)
+        plan = captain_with_managers.coordinate([prd.id, adr.id, ux.id])
+
+        order = []
+        state = {"active": 0, "peak": 0}
+
+        async def execute(agent, item_id):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            order.append(item_id)
+            return {"success": True}
+
+        executor = Mock()
+        executor.execute = execute
+        results = await captain_with_managers.execute_plan(plan, executor)
+
+        assert results["status"] == "completed"
+        assert order[0] == prd.id
+        assert state["peak"] == 2
+
+        captain_with_managers.max_parallel = 1
+        state["peak"] = 0
+        await captain_with_managers.execute_plan(plan, executor)
+        assert state["peak"] == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_plan_keeps_plan_order_without_dependencies(self, captain_with_managers):
+        """Test steps with no declared dependencies still run one at a time in plan order"""
+        import asyncio
+
+        workstate = captain_with_managers.work_state_manager
+        items = [
+            workstate.create_work_item(title=title, description="", labels=[label])
+            for title, label in [("PRD", "pm"), ("Build", "engineer"), ("Review", "reviewer")]
+        ]
+        plan = captain_with_managers.coordinate([item.id for item in items])
+
+        order = []
+        state = {"active": 0, "peak": 0}
+
+        async def execute(agent, item_id):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            order.append(item_id)
+            return {"success": True}
+
+        executor = Mock()
+        executor.execute = execute
+        await captain_with_managers.execute_plan(plan, executor)
+
+        assert order == [step["item_id"] for step in plan["sequential_steps"]]
+        assert state["peak"] == 1
+
 
 class TestCaptainWithMockedMethods:
     """Test Captain with mocked async methods"""
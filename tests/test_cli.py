@@ -64,6 +64,27 @@ class TestCLI:
             assert result.exit_code == 0
             assert "Routing Health Status" in result.output or "Status" in result.output
 
+    def test_status_command_renders_health_breakdown(self, runner, tmp_path):
+        """Test squad status renders destination rows and priority lines"""
+        from unittest.mock import patch
+
+        summary = {
+            "total": 5, "routed": 4, "blocked": 1, "block_rate": 0.2, "overall_status": "ok",
+            "by_destination": {
+                "engineer": {"total": 4, "routed": 3, "blocked": 1},
+                "ux": {"total": 0, "routed": 0, "blocked": 0},
+            },
+            "by_priority": {"high": {"total": 3, "routed": 3}, "low": {"total": 2, "routed": 1}},
+        }
+        with runner.isolated_filesystem(temp_dir=tmp_path), \
+             patch("ai_squad.core.router.HealthView.summarize", return_value=summary):
+            result = runner.invoke(main, ["status"])
+            assert result.exit_code == 0
+            assert "25.0%" in result.output
+            assert "0.0%" in result.output
+            assert "high: 3/3 routed" in result.output
+            assert "low: 1/2 routed" in result.output
+
     def test_capabilities_list_empty(self, runner, tmp_path):
         """Test empty capabilities list"""
         with runner.isolated_filesystem(temp_dir=tmp_path):
@@ -74,9 +95,12 @@ class TestCLI:
     def test_capabilities_key_set_and_show(self, runner, tmp_path):
         """Test capability signature key management"""
         with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(main, ["capabilities", "key", "--set", "test-key"])
+            result = runner.invoke(main, ["capabilities", "key", "--set", "  test-key\n"])
             assert result.exit_code == 0
             assert "Signature key saved" in result.output
+            key_dir = Path(".squad") / "capabilities"
+            assert (key_dir / "signature.key").read_text(encoding="utf-8") == "test-key"
+            assert [p.name for p in key_dir.iterdir()] == ["signature.key"]
 
             result = runner.invoke(main, ["capabilities", "key", "--show"])
             assert result.exit_code == 0
@@ -110,6 +134,28 @@ class TestCLI:
             assert result.exit_code == 0
             assert "No scout runs found" in result.output
 
+    def test_scout_list_table_and_plain_output(self, runner, tmp_path):
+        """Test scout list uses a table for small listings and plain rows for large ones"""
+        from unittest.mock import patch
+        from ai_squad.cli import PLAIN_TABLE_THRESHOLD
+
+        target = "ai_squad.core.scout_worker.ScoutWorker.list_run_summaries"
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            with patch(target, return_value=[("scout-a", 3, 2)]):
+                result = runner.invoke(main, ["scout", "list"])
+            assert result.exit_code == 0
+            assert "Scout Runs" in result.output
+            assert "scout-a" in result.output
+
+            many = [(f"scout-{i}", 1, 1) for i in range(PLAIN_TABLE_THRESHOLD + 1)]
+            with patch(target, return_value=many):
+                result = runner.invoke(main, ["scout", "list"])
+            assert result.exit_code == 0
+            lines = result.output.splitlines()
+            assert lines[0] == "Run ID\tTasks\tCompleted"
+            assert lines[1] == "scout-0\t1\t1"
+            assert len(lines) == PLAIN_TABLE_THRESHOLD + 2
+
     def test_scout_show_missing(self, runner, tmp_path):
         """Test scout show missing run"""
         with runner.isolated_filesystem(temp_dir=tmp_path):
@@ -117,6 +163,272 @@ class TestCLI:
             assert result.exit_code == 0
             assert "Scout run not found" in result.output
 
+    def test_report_list_limit(self, runner, tmp_path):
+        """Test report list shows only the most recent reports"""
+        import os
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            reports_dir = Path(".squad") / "reports"
+            reports_dir.mkdir(parents=True)
+            for i, name in enumerate(["c", "a", "b"]):
+                path = reports_dir / f"after-operation-{name}.md"
+                path.write_text("# Report", encoding="utf-8")
+                os.utime(path, (1000 + i, 1000 + i))
+
+            result = runner.invoke(main, ["report", "list", "--limit", "2"])
+            assert result.exit_code == 0
+            assert "after-operation-a.md" in result.output
+            assert "after-operation-b.md" in result.output
+            assert "after-operation-c.md" not in result.output
+            assert "Showing 2 most recent of 3" in result.output
+
+            result = runner.invoke(main, ["report", "list", "--limit", "0"])
+            assert "after-operation-c.md" in result.output
+
+    def test_report_list_empty(self, runner, tmp_path):
+        """Test report list with no reports directory or no reports"""
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            result = runner.invoke(main, ["report", "list"])
+            assert result.exit_code == 0
+            assert "No reports found" in result.output
+
+            (Path(".squad") / "reports").mkdir(parents=True)
+            result = runner.invoke(main, ["report", "list"])
+            assert "No reports found" in result.output
+
+    def test_report_show_streams_raw_markdown(self, runner, tmp_path):
+        """Test report show prints the report verbatim"""
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            reports_dir = Path(".squad") / "reports"
+            reports_dir.mkdir(parents=True)
+            body = "# Report\n\n- [red]literal[/red] brackets\n" + "x" * 70000
+            (reports_dir / "after-operation-1.md").write_text(body, encoding="utf-8")
+
+            result = runner.invoke(main, ["report", "show", "after-operation-1.md"])
+            assert result.exit_code == 0
+            assert result.output == body + "\n"
+
+    def test_report_show_missing(self, runner, tmp_path):
+        """Test report show with a missing report"""
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            result = runner.invoke(main, ["report", "show", "after-operation-missing.md"])
+            assert result.exit_code == 0
+            assert "Report not found" in result.output
+
+    def test_clarify_renders_conversation(self, runner, tmp_path):
+        """Test clarify renders questions and responses"""
+        from unittest.mock import patch
+        from ai_squad.core.agent_comm import AgentMessage, MessageType
+
+        messages = [
+            AgentMessage(from_agent="architect", to_agent="pm", content="Which DB?",
+                         message_type=MessageType.QUESTION, issue_number=7),
+            AgentMessage(from_agent="pm", to_agent="architect", content="Postgres",
+                         message_type=MessageType.RESPONSE, issue_number=7),
+        ]
+        with runner.isolated_filesystem(temp_dir=tmp_path), \
+             patch("ai_squad.core.agent_comm.AgentCommunicator.get_conversation",
+                   return_value=messages):
+            result = runner.invoke(main, ["clarify", "7"])
+            assert result.exit_code == 0
+            assert "Which DB?" in result.output
+            assert "Postgres" in result.output
+            assert result.output.index("Which DB?") < result.output.index("Postgres")
+
+    def test_agent_commands_report_results(self, runner):
+        """Test agent commands print the artifact and fail with exit 1"""
+        from unittest.mock import patch
+        from ai_squad import cli
+
+        cli._executor_for.cache_clear()
+        with patch("ai_squad.core.agent_executor.AgentExecutor") as executor:
+            executor.return_value.execute.return_value = {
+                "success": True, "file_path": "docs/prd/PRD-7.md", "files": ["a.py", "b.py"]
+            }
+            result = runner.invoke(main, ["pm", "7"])
+            assert result.exit_code == 0
+            assert "PRD created: docs/prd/PRD-7.md" in result.output
+            executor.return_value.execute.assert_called_with("pm", 7)
+
+            result = runner.invoke(main, ["engineer", "7"])
+            assert "  - a.py" in result.output and "  - b.py" in result.output
+
+            executor.return_value.execute.return_value = {"success": False, "error": "boom"}
+            result = runner.invoke(main, ["review", "9"])
+            assert result.exit_code == 1
+            assert "PR #9" in result.output and "FAIL: boom" in result.output
+            # One executor serves every command run from the same directory
+            assert executor.call_count == 1
+        cli._executor_for.cache_clear()
+
+    def test_fast_dispatch_matches_group(self, runner, tmp_path):
+        """Test hot subcommands dispatched directly still parse their options"""
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            result = runner.invoke(main, ["plans", "--help"])
+            assert result.exit_code == 0
+            assert "plans [OPTIONS]" in result.output
+
+            result = runner.invoke(main, ["ops", "--status", "bogus"])
+            assert result.exit_code == 2
+            assert "Invalid value" in result.output
+
+    def test_fast_dispatch_reaches_intended_command(self, runner):
+        """Test each fast-path name is handed to its own command object"""
+        from unittest.mock import patch
+        from ai_squad import cli
+
+        expected = {
+            "orchestration": cli.orchestration_status,
+            "status": cli.status,
+            "ops": cli.ops,
+        }
+        for name, command in expected.items():
+            assert name in cli.SquadGroup.FAST_COMMANDS
+            with patch.object(command, "main", return_value=None) as dispatched:
+                runner.invoke(main, [name])
+            dispatched.assert_called_once()
+            assert dispatched.call_args.args[0] == []
+
+    def test_managers_shared_per_workspace(self, tmp_path, monkeypatch):
+        """Test state managers are built lazily and reused per directory"""
+        from ai_squad import cli
+
+        monkeypatch.chdir(tmp_path)
+        managers = cli._managers()
+        assert "work" not in vars(managers)
+        assert managers.handoff.work_state_manager is managers.work
+        assert cli._managers() is managers
+
+        other = tmp_path / "other"
+        other.mkdir()
+        monkeypatch.chdir(other)
+        assert cli._managers() is not managers
+
+    def test_mission_reads_piped_brief(self, runner):
+        """Test interactive mission reads a piped brief in one pass"""
+        from unittest.mock import patch
+
+        brief = "Build a REST API\nwith auth\n"
+        with patch("ai_squad.core.autonomous.arun_autonomous_workflow",
+                   return_value={"success": False, "error": "stop"}) as run:
+            runner.invoke(main, ["mission", "-i", "--plan-only"], input=brief)
+        assert run.call_args.kwargs["requirements"] == brief
+
+    def test_read_brief_large_file_matches_read_text(self, tmp_path, monkeypatch):
+        """Test memory-mapped briefs decode like read_text, newlines included"""
+        from ai_squad import cli
+
+        brief = tmp_path / "brief.txt"
+        brief.write_bytes("Mission \u00e9\r\n- objective\rend\n".encode("utf-8") * 10)
+        expected = brief.read_text(encoding="utf-8")
+        assert cli._read_brief(str(brief)) == expected
+
+        monkeypatch.setattr(cli, "MMAP_BRIEF_THRESHOLD", 16)
+        assert cli._read_brief(str(brief)) == expected
+
+    def test_mission_requires_exactly_one_input(self, runner):
+        """Test mission rejects zero or several brief sources"""
+        result = runner.invoke(main, ["mission"])
+        assert result.exit_code == 1
+        assert "Must provide mission brief" in result.output
+
+        result = runner.invoke(main, ["mission", "-p", "Build it", "-i"])
+        assert result.exit_code == 1
+        assert "only ONE input method" in result.output
+
+    def test_help_does_not_import_rich(self):
+        """Test squad --help (and shell completion) never loads Rich"""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from ai_squad.cli import main\n"
+            "try:\n"
+            "    main(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(any(name.split('.')[0] == 'rich' for name in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip().splitlines()[-1] == "False"
+
+    def test_cli_error_handler(self, runner):
+        """Test runtime errors render as FAIL and Click errors keep their exit code"""
+        import click
+        from ai_squad.cli import cli_error_handler
+
+        @click.command()
+        @cli_error_handler
+        @click.argument("kind")
+        def boom(kind):
+            if kind == "value":
+                raise ValueError("bad value")
+            if kind == "markup":
+                raise OSError("missing [red]key[/red]")
+            raise click.UsageError("bad usage")
+
+        result = runner.invoke(boom, ["value"])
+        assert result.exit_code == 1
+        assert "FAIL Error: bad value" in result.output
+
+        result = runner.invoke(boom, ["markup"])
+        assert result.exit_code == 1
+        assert "FAIL Error: missing [red]key[/red]" in result.output
+
+        result = runner.invoke(boom, ["usage"])
+        assert result.exit_code == 2
+        assert "bad usage" in result.output
+
+    def test_update_uses_current_interpreter(self, runner):
+        """Test update runs pip through the interpreter running the CLI"""
+        import sys
+        from unittest.mock import patch
+
+        with patch("subprocess.run") as run:
+            result = runner.invoke(main, ["update"])
+        assert result.exit_code == 0
+        cmd = run.call_args[0][0]
+        assert cmd[:3] == [sys.executable, "-m", "pip"]
+        assert "--disable-pip-version-check" in cmd
+
+    def test_gh_auth_check_cached(self, tmp_path, monkeypatch):
+        """Test a successful gh auth check is reused within the TTL"""
+        from unittest.mock import patch, MagicMock
+        from ai_squad import cli
+
+        monkeypatch.setattr("ai_squad.core.ttl_cache.cache_dir", lambda: tmp_path)
+        with patch("shutil.which", return_value="/usr/bin/gh"), \
+             patch("subprocess.run", return_value=MagicMock(returncode=0)) as run:
+            assert cli._check_gh_auth_cached() == 0
+            assert cli._check_gh_auth_cached() == 0
+            assert run.call_count == 1
+            assert cli._check_gh_auth_cached(ttl=0) == 0
+            assert run.call_count == 2
+
+    def test_gh_auth_failure_not_cached(self, tmp_path, monkeypatch):
+        """Test a failed gh auth check is re-run on the next call"""
+        from unittest.mock import patch, MagicMock
+        from ai_squad import cli
+
+        monkeypatch.setattr("ai_squad.core.ttl_cache.cache_dir", lambda: tmp_path)
+        with patch("shutil.which", return_value="/usr/bin/gh"), \
+             patch("subprocess.run", return_value=MagicMock(returncode=1)) as run:
+            assert cli._check_gh_auth_cached() == 1
+            assert cli._check_gh_auth_cached() == 1
+            assert run.call_count == 2
+            assert not (tmp_path / "gh_auth.json").exists()
+
+    def test_gh_missing_skips_subprocess(self, tmp_path, monkeypatch):
+        """Test a missing gh binary is detected without spawning a process"""
+        from unittest.mock import patch
+        from ai_squad import cli
+
+        monkeypatch.setattr("ai_squad.core.ttl_cache.cache_dir", lambda: tmp_path)
+        with patch("shutil.which", return_value=None), patch("subprocess.run") as run:
+            with pytest.raises(FileNotFoundError):
+                cli._check_gh_auth_cached()
+            run.assert_not_called()
+
     def test_scout_run_noop(self, runner, tmp_path):
         """Test scout run noop task"""
         with runner.isolated_filesystem(temp_dir=tmp_path):
@@ -124,6 +436,20 @@ class TestCLI:
             assert result.exit_code == 0
             assert "Scout run completed" in result.output
 
+    def test_scout_run_list_squad_files(self, runner, tmp_path):
+        """Test scout run records the .squad directory listing"""
+        from ai_squad.core.scout_worker import ScoutWorker
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            Path(".squad").mkdir()
+            Path(".squad", "notes.md").write_text("x", encoding="utf-8")
+            result = runner.invoke(main, ["scout", "run", "--task", "list_squad_files"])
+            assert result.exit_code == 0
+
+            run_id = result.output.split()[-1]
+            run = ScoutWorker().load_run(run_id)
+            assert "notes.md" in run.tasks[0].result
+            assert "scout_workers" in run.tasks[0].result
+
 
 class TestAgentCommands:
     """Test agent execution commands"""
@@ -192,6 +518,22 @@ class TestAgentCommands:
         # Should fail with usage error
         assert result.exit_code != 0
 
+    def test_captain_skip_preflight(self, runner, setup_project):
+        """Test squad captain --skip-preflight never runs the checks"""
+        from unittest.mock import patch
+        from ai_squad import cli
+
+        _ = setup_project
+        cli._executor_for.cache_clear()
+        with patch("ai_squad.cli._cached_preflight") as preflight, \
+             patch("ai_squad.core.agent_executor.AgentExecutor.execute",
+                   return_value={"success": True, "output": "coordinated"}):
+            result = runner.invoke(main, ["captain", "123", "--skip-preflight"])
+        cli._executor_for.cache_clear()
+        assert result.exit_code == 0
+        assert "coordinated" in result.output
+        preflight.assert_not_called()
+
 
 class TestOrchestrationCommands:
     """Test orchestration-related CLI commands"""
@@ -223,7 +565,34 @@ class TestOrchestrationCommands:
             runner.invoke(main, ["deploy"])
             result = runner.invoke(main, ["ops", "--agent", "pm"])
             assert result.exit_code == 0
-    
+
+    def test_ops_command_status_filter_applies(self, runner, tmp_path):
+        """Test squad ops --status only lists items in that status"""
+        from ai_squad.core.workstate import WorkStateManager, WorkStatus
+
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            runner.invoke(main, ["deploy"])
+            manager = WorkStateManager()
+            manager.create_work_item(title="Ready item")
+            blocked = manager.create_work_item(title="Blocked item")
+            manager.transition_status(blocked.id, WorkStatus.BLOCKED)
+            result = runner.invoke(main, ["ops", "--status", "blocked"])
+            assert result.exit_code == 0
+            assert "Blocked item" in result.output
+            assert "Ready item" not in result.output
+
+    def test_ops_command_truncates_long_title(self, runner, tmp_path):
+        """Test squad ops ellipsizes titles that overflow the Title column"""
+        from ai_squad.core.workstate import WorkStateManager
+
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            runner.invoke(main, ["deploy"])
+            WorkStateManager().create_work_item(title="T" * 80)
+            result = runner.invoke(main, ["ops"])
+            assert result.exit_code == 0
+            assert "T" * 42 + "…" in result.output
+            assert "T" * 43 not in result.output
+
     def test_convoys_command_empty(self, runner, tmp_path):
         """Test squad convoys command with no convoys"""
         with runner.isolated_filesystem(temp_dir=tmp_path):
@@ -240,6 +609,69 @@ class TestOrchestrationCommands:
             assert result.exit_code == 0
             assert "Health" in result.output or "health" in result.output.lower() or "Status" in result.output
     
+    def test_watch_and_patrol_are_distinct(self, runner, tmp_path):
+        """Test squad watch runs the label daemon and squad patrol the stale-work scan"""
+        from unittest.mock import patch
+
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            runner.invoke(main, ["deploy"])
+            with patch("ai_squad.cli._check_gh_auth_cached", return_value=0), \
+                 patch("ai_squad.core.watch.WatchDaemon.from_validated") as from_validated:
+                result = runner.invoke(main, ["watch", "--repo", "owner/repo", "--interval", "60"])
+            assert result.exit_code == 0, result.output
+            validated = from_validated.call_args.args[0]
+            assert validated.repo == "owner/repo" and validated.interval == 60
+            from_validated.return_value.run.assert_called_once()
+
+            result = runner.invoke(main, ["patrol"])
+            assert result.exit_code == 0
+            assert "Patrol complete" in result.output
+
+    def test_watch_requires_gh_auth(self, runner, tmp_path):
+        """Test squad watch stops before starting the daemon when gh is not logged in"""
+        from unittest.mock import patch
+
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            runner.invoke(main, ["deploy"])
+            with patch("ai_squad.cli._check_gh_auth_cached", return_value=1), \
+                 patch("ai_squad.core.watch.WatchDaemon.from_validated") as from_validated:
+                result = runner.invoke(main, ["watch", "--repo", "owner/repo"])
+            assert result.exit_code == 1
+            assert "GitHub authentication required" in result.output
+            from_validated.assert_not_called()
+
+    def test_orchestration_status_renders_panels(self, runner, tmp_path, monkeypatch):
+        """Test squad orchestration renders the concurrently fetched stats"""
+        from ai_squad import cli
+
+        monkeypatch.chdir(tmp_path)
+        runner.invoke(main, ["deploy"])
+        managers = cli._managers()
+        managers.work.create_work_item(title="Build API", description="")
+        managers.signal.send_message("pm", "architect", "PRD ready", "See PRD-1")
+        managers.signal.send_message("pm", "engineer", "Heads up", "Soon")
+
+        result = runner.invoke(main, ["orchestration"])
+
+        assert result.exit_code == 0, result.output
+        for title in ("Work Items", "Convoys", "Handoffs", "Signals"):
+            assert title in result.output
+        assert "Total: 1" in result.output
+        assert "Total Messages: 2" in result.output
+        assert "Unread: 2" in result.output
+
+    def test_orchestration_and_status_are_distinct(self, runner, tmp_path):
+        """Test squad orchestration and squad status reach different commands"""
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            runner.invoke(main, ["deploy"])
+            result = runner.invoke(main, ["orchestration"])
+            assert result.exit_code == 0
+            assert "AI-Squad Orchestration Status" in result.output
+
+            result = runner.invoke(main, ["status"])
+            assert result.exit_code == 0
+            assert "Operational Status Report" in result.output
+
     def test_patrol_command(self, runner, tmp_path):
         """Test squad patrol command"""
         with runner.isolated_filesystem(temp_dir=tmp_path):
@@ -298,6 +730,23 @@ class TestSignalCommands:
             assert result.exit_code == 0
             assert "signal" in result.output.lower()
 
+    def test_signal_command_renders_inbox(self, runner, tmp_path):
+        """Test signal renders every message and the inbox stats"""
+        from ai_squad import cli
+        from ai_squad.core.signal import SignalManager
+
+        cli._managers_for.cache_clear()
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            manager = SignalManager()
+            manager.send_message(sender="pm", recipient="engineer", subject="PRD ready", body="See docs")
+            manager.send_message(sender="architect", recipient="engineer", subject="ADR ready", body="x" * 300)
+            result = runner.invoke(main, ["signal", "engineer"])
+            assert result.exit_code == 0
+            assert "PRD ready" in result.output
+            assert "ADR ready" in result.output
+            assert "x" * 300 not in result.output
+            assert "Inbox: 2" in result.output
+
 
 class TestIdentityCommand:
     """Test identity/status commands"""
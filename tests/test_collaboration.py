@@ -9,9 +9,11 @@ from pathlib import Path
 
 from ai_squad.core.collaboration import (
     run_collaboration,
+    arun_collaboration,
     CollaborationMode,
     _run_sequential_collaboration,
     _run_iterative_collaboration,
+    _execution_stages,
     _parse_feedback
 )
 
@@ -85,6 +87,57 @@ class TestSequentialCollaboration:
         assert "Architect failed" in result["error"]
         assert len(result["partial_results"]) == 2
 
+    def test_sequential_collaboration_closes_executor(self, mock_executor):
+        """Test the executor is closed even when an agent fails"""
+        mock_executor.execute.return_value = {"success": False, "error": "PM failed"}
+        
+        _run_sequential_collaboration(123, ["pm", "architect"])
+        
+        mock_executor.close.assert_called_once()
+
+
+class TestParallelCollaboration:
+    """Test concurrent execution of independent agents"""
+    
+    def test_execution_stages_group_independent_agents(self):
+        """Test architect and ux share a stage between pm and engineer"""
+        stages = _execution_stages(["pm", "architect", "ux", "engineer", "captain"])
+        assert stages == [["pm"], ["architect", "ux"], ["engineer"], ["captain"]]
+    
+    async def test_arun_collaboration_runs_all_agents(self):
+        """Test staged run returns results in the requested agent order"""
+        with patch('ai_squad.core.collaboration.AgentExecutor') as mock:
+            mock.return_value.execute.side_effect = lambda agent, issue: {
+                "success": True, "file_path": f"docs/{agent}-{issue}.md"
+            }
+            result = await arun_collaboration(
+                123, ["pm", "architect", "ux"], mode=CollaborationMode.SEQUENTIAL
+            )
+        
+        assert result["success"]
+        assert [r["agent"] for r in result["results"]] == ["pm", "architect", "ux"]
+        assert result["files"] == ["docs/pm-123.md", "docs/architect-123.md", "docs/ux-123.md"]
+        # Stages share one executor, closed once the run finishes
+        assert mock.call_count == 1
+        mock.return_value.close.assert_called_once()
+    
+    async def test_arun_collaboration_stops_after_failed_stage(self):
+        """Test a failing stage prevents dependent agents from running"""
+        def execute(agent, issue):
+            if agent == "ux":
+                raise RuntimeError("UX crashed")
+            return {"success": True}
+        
+        with patch('ai_squad.core.collaboration.AgentExecutor') as mock:
+            mock.return_value.execute.side_effect = execute
+            result = await arun_collaboration(
+                123, ["architect", "ux", "engineer"], mode=CollaborationMode.SEQUENTIAL
+            )
+        
+        assert not result["success"]
+        assert "UX crashed" in result["error"]
+        assert [r["agent"] for r in result["partial_results"]] == ["architect", "ux"]
+
 
 class TestIterativeCollaboration:
     """Test iterative collaboration with dialogue"""
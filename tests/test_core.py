@@ -4,7 +4,7 @@ Tests for core modules
 from pathlib import Path
 import yaml
 
-from ai_squad.core.config import Config
+from ai_squad.core.config import Config, get_config, read_project_header
 from ai_squad.core.init_project import initialize_project
 
 
@@ -73,6 +73,45 @@ class TestConfig:
         assert config.github_owner == "test-owner"
         assert config.prd_dir == Path("custom/prd")
 
+    def test_read_project_header(self, tmp_path):
+        """Test project header is read without parsing the rest of the file"""
+        config_path = tmp_path / "squad.yaml"
+        config_path.write_text(
+            "agents:\n  pm: {enabled: true}\n"
+            "project:\n  name: Demo\n  github_repo: demo\n  labels: [a, b]\n  github_owner: ~\n"
+            "broken: [unclosed\n",
+            encoding="utf-8"
+        )
+        assert read_project_header(config_path) == {"github_repo": "demo", "github_owner": None}
+    
+    def test_read_project_header_falls_back_to_full_parse(self, tmp_path):
+        """Test aliases and missing keys are resolved by a full parse"""
+        config_path = tmp_path / "squad.yaml"
+        config_path.write_text(
+            "defaults: &owner octo\nproject:\n  github_owner: *owner\n  github_repo: demo\n",
+            encoding="utf-8"
+        )
+        assert read_project_header(config_path) == {"github_owner": "octo", "github_repo": "demo"}
+        
+        config_path.write_text("project:\n  name: Demo\nother: 1\n", encoding="utf-8")
+        assert read_project_header(config_path) == {}
+    
+    def test_get_config_reuses_until_file_changes(self, tmp_path):
+        """Test get_config caches by mtime and reloads after an edit"""
+        import os
+        
+        config_path = tmp_path / "squad.yaml"
+        config_path.write_text("project:\n  name: First\n", encoding="utf-8")
+        first = get_config(str(config_path))
+        assert get_config(str(config_path)) is first
+        
+        config_path.write_text("project:\n  name: Second\n", encoding="utf-8")
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = get_config(str(config_path))
+        assert second is not first
+        assert second.get("project.name") == "Second"
+
 
 class TestInitProject:
     """Test project initialization"""
@@ -121,3 +160,32 @@ class TestInitProject:
         with open(config_path, encoding="utf-8") as f:
             content = f.read()
             assert "# Modified" not in content
+
+
+class TestCorePackage:
+    """Test ai_squad.core package exports"""
+
+    def test_exports_resolve_lazily(self):
+        """Test importing the package loads no submodules until a name is used"""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "import ai_squad.core as core\n"
+            "print(sorted(m for m in sys.modules if m.startswith('ai_squad.core.')))\n"
+            "core.TheaterRegistry\n"
+            "print('ai_squad.core.theater' in sys.modules, 'ai_squad.core.captain' in sys.modules)\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        lines = result.stdout.strip().splitlines()
+        assert lines[-2] == "[]"
+        assert lines[-1] == "True False"
+
+    def test_all_exports_importable(self):
+        """Test every name in __all__ resolves"""
+        import ai_squad.core as core
+
+        for name in core.__all__:
+            assert getattr(core, name) is not None
+        assert "Captain" in dir(core)
@@ -62,6 +62,33 @@ def test_impact_analysis(tmp_path):
     assert impact["total_affected"] >= 2
 
 
+
+def test_impact_analysis_memoized_until_graph_changes(tmp_path, monkeypatch):
+    graph = OperationalGraph(workspace_root=tmp_path)
+    graph.add_node("api", NodeType.CAPABILITY)
+    graph.add_node("service-a", NodeType.AGENT)
+    graph.add_edge("service-a", "api", EdgeType.DEPENDS_ON)
+
+    calls = []
+    original = OperationalGraph._collect_dependents
+
+    def counting(self, node_id):
+        calls.append(node_id)
+        return original(self, node_id)
+
+    monkeypatch.setattr(OperationalGraph, "_collect_dependents", counting)
+
+    first = graph.impact_analysis("api")
+    first["affected_nodes"].append("mutated")
+    # A second instance over the same unchanged graph reuses the result
+    assert OperationalGraph(workspace_root=tmp_path).impact_analysis("api")["affected_nodes"] == ["service-a"]
+    assert calls == ["api"]
+
+    graph.add_node("service-b", NodeType.AGENT)
+    graph.add_edge("service-b", "api", EdgeType.DEPENDS_ON)
+    assert graph.impact_analysis("api")["total_affected"] == 2
+    assert calls == ["api", "api"]
+
 def test_traverse_graph(tmp_path):
     graph = OperationalGraph(workspace_root=tmp_path)
     
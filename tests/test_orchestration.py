@@ -168,6 +168,19 @@ class TestWorkState:
         ready_items = manager.list_work_items(status=WorkStatus.READY)
         assert len(ready_items) == 3
     
+    def test_work_state_manager_iter_items(self):
+        """Test iterating work items yields priority order with filters"""
+        from ai_squad.core.workstate import WorkStateManager, WorkStatus
+        
+        manager = WorkStateManager(self.workspace)
+        manager.create_work_item(title="Low", priority=1)
+        high = manager.create_work_item(title="High", priority=5)
+        manager.assign_to_agent(high.id, "engineer")
+        
+        assert [i.title for i in manager.iter_work_items()] == ["High", "Low"]
+        assert [i.title for i in manager.iter_work_items(agent="engineer")] == ["High"]
+        assert list(manager.iter_work_items(status=WorkStatus.DONE)) == []
+    
     def test_work_state_manager_dependencies(self):
         """Test work item dependencies"""
         from ai_squad.core.workstate import WorkStateManager, WorkStatus
@@ -278,6 +291,22 @@ labels:
         # Built-in strategies should exist if templates exist
         assert isinstance(strategies, list)
 
+    def test_BattlePlan_builtin_parse_is_cached(self):
+        """Test built-in BattlePlans are parsed once and reused from the cache"""
+        from unittest.mock import patch
+        from ai_squad.core import battle_plan as battle_plan_module
+
+        battle_plan_module._parse_builtin_plans.cache_clear()
+        with patch.object(battle_plan_module, "load_yaml", wraps=battle_plan_module.load_yaml) as load:
+            first = battle_plan_module.BattlePlanManager(self.workspace)
+            parsed = load.call_count
+            second = battle_plan_module.BattlePlanManager(self.workspace)
+
+        assert parsed > 0
+        assert load.call_count == parsed
+        assert sorted(s.name for s in second.list_strategies()) == \
+            sorted(s.name for s in first.list_strategies())
+
 
 class TestSignal:
     """Tests for Agent Signal system"""
@@ -76,3 +76,27 @@ def test_after_operation_report_written(tmp_path: Path):
     content = report_path.read_text(encoding="utf-8")
     assert "After-Operation Report" in content
     assert "Completed" in content
+
+
+def test_list_reports_cached_until_directory_changes(tmp_path: Path, monkeypatch):
+    import os
+    from ai_squad.core import reporting
+
+    report_mgr = ReportManager(workspace_root=tmp_path)
+    assert report_mgr.list_reports() == []
+
+    report_mgr.write_direct_report("b", {"completed": 1})
+    report_mgr.write_direct_report("a", {"completed": 1})
+    (report_mgr.reports_dir / "notes.txt").write_text("x", encoding="utf-8")
+
+    scans = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(reporting.os, "scandir", lambda p: scans.append(p) or real_scandir(p))
+
+    assert report_mgr.list_reports() == ["after-operation-a.md", "after-operation-b.md"]
+    assert report_mgr.list_reports() == ["after-operation-a.md", "after-operation-b.md"]
+    assert len(scans) == 1
+
+    report_mgr.write_direct_report("c", {"completed": 1})
+    assert report_mgr.list_reports()[-1] == "after-operation-c.md"
+    assert len(scans) == 2
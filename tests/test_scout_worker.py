@@ -21,3 +21,40 @@ def test_scout_worker_runs_tasks(tmp_path):
 
     checkpoint = (tmp_path / ".squad" / "scout_workers").glob("scout-*.json")
     assert any(checkpoint)
+
+
+def test_list_run_summaries_uses_sidecar_and_falls_back(tmp_path):
+    worker = ScoutWorker(workspace_root=tmp_path)
+
+    def fail():
+        raise RuntimeError("boom")
+
+    finished = worker.run({"ok": lambda: 1, "bad": fail})
+    interrupted = worker.run({"ok": lambda: 1})
+    (worker.summary_dir / f"{interrupted.run_id}.json").unlink()
+
+    summaries = dict((run_id, (total, done)) for run_id, total, done in worker.list_run_summaries())
+
+    assert summaries[finished.run_id] == (2, 1)
+    assert finished.counts() == (2, 1)
+    assert summaries[interrupted.run_id] == (1, 1)
+    assert worker.list_runs() == sorted(summaries)
+
+
+def test_scout_worker_runs_tasks_concurrently_in_order(tmp_path):
+    import threading
+
+    worker = ScoutWorker(workspace_root=tmp_path)
+    barrier = threading.Barrier(3, timeout=5)
+
+    def make(value):
+        def task():
+            barrier.wait()  # only passes if all three run at once
+            return value
+        return task
+
+    run = worker.run({"a": make(1), "b": make(2), "c": make(3)}, jobs=3)
+
+    assert [t.name for t in run.tasks] == ["a", "b", "c"]
+    assert [t.result for t in run.tasks] == [1, 2, 3]
+    assert worker.load_run(run.run_id).completed_at is not None
@@ -0,0 +1,126 @@
+"""
+Tests for detached background tasks
+"""
+import os
+import subprocess
+import sys
+from unittest.mock import AsyncMock, Mock, patch
+
+from click.testing import CliRunner
+
+from ai_squad.cli import main
+from ai_squad.core.captain import Captain
+from ai_squad.core.retry import RetryConfig
+from ai_squad.core.tasks import TaskManager
+
+
+class TestTaskManager:
+    """Background task tests"""
+
+    def test_submit_records_task_and_detaches(self, tmp_path):
+        manager = TaskManager(tmp_path)
+        with patch("ai_squad.core.tasks.subprocess.Popen", return_value=Mock(pid=4321)) as popen:
+            task = manager.submit_captain(42, max_parallel=3)
+
+        args, kwargs = popen.call_args
+        assert args[0][-2:] == ["ai_squad.core.tasks", task.task_id]
+        assert kwargs["cwd"] == tmp_path
+        stored = manager.get(task.task_id)
+        assert stored.status == "queued"
+        assert stored.issue_number == 42
+        assert stored.max_parallel == 3
+        assert stored.pid is None  # recorded by the worker itself
+
+    def test_run_retries_until_success(self, tmp_path):
+        manager = TaskManager(tmp_path)
+        with patch("ai_squad.core.tasks.subprocess.Popen", return_value=Mock(pid=1)):
+            task = manager.submit_captain(7)
+
+        executor = Mock()
+        executor.execute.side_effect = [
+            RuntimeError("boom"),
+            {"success": True, "output": "coordinated"},
+        ]
+        result = manager.run(task.task_id, retry=RetryConfig(initial_delay=0), executor=executor)
+
+        assert result.status == "completed"
+        assert result.attempts == 2
+        assert result.pid == os.getpid()
+        assert manager.get(task.task_id).output == "coordinated"
+        executor.execute.assert_called_with("captain", 7)
+
+    def test_run_marks_failed_after_retries(self, tmp_path):
+        manager = TaskManager(tmp_path)
+        with patch("ai_squad.core.tasks.subprocess.Popen", return_value=Mock(pid=1)):
+            task = manager.submit_captain(7)
+
+        executor = Mock()
+        executor.execute.return_value = {"success": False, "error": "nope"}
+        result = manager.run(task.task_id, retry=RetryConfig(max_attempts=2, initial_delay=0),
+                             executor=executor)
+
+        assert result.status == "failed"
+        assert result.attempts == 2
+        assert manager.get(task.task_id).error == "nope"
+
+    def test_run_retries_when_captain_run_fails(self, tmp_path):
+        manager = TaskManager(tmp_path)
+        with patch("ai_squad.core.tasks.subprocess.Popen", return_value=Mock(pid=1)):
+            task = manager.submit_captain(7)
+
+        captain = Captain.__new__(Captain)
+        captain.run = AsyncMock(side_effect=RuntimeError("no battle plan"))
+        executor = Mock()
+        executor.execute.side_effect = lambda kind, issue: captain._execute_agent({"number": issue}, {})
+        result = manager.run(task.task_id, retry=RetryConfig(max_attempts=2, initial_delay=0),
+                             executor=executor)
+
+        assert result.status == "failed"
+        assert result.attempts == 2
+        assert captain.run.await_count == 2
+        assert manager.get(task.task_id).error == "no battle plan"
+
+    def test_run_records_unexpected_errors(self, tmp_path):
+        manager = TaskManager(tmp_path)
+        with patch("ai_squad.core.tasks.subprocess.Popen", return_value=Mock(pid=1)):
+            task = manager.submit_captain(7)
+
+        executor = Mock()
+        executor.execute.side_effect = KeyError("captain")
+        result = manager.run(task.task_id, retry=RetryConfig(initial_delay=0), executor=executor)
+
+        stored = manager.get(task.task_id)
+        assert result.status == stored.status == "failed"
+        assert stored.error == "KeyError: 'captain'"
+        assert stored.completed_at
+
+    def test_captain_status_flags_dead_worker(self, tmp_path):
+        runner = CliRunner()
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            manager = TaskManager()
+            with patch("ai_squad.core.tasks.subprocess.Popen", return_value=Mock(pid=1)):
+                task = manager.submit_captain(9)
+            dead = subprocess.Popen([sys.executable, "-c", "pass"])
+            dead.wait()
+            task.status = "running"
+            task.pid = dead.pid
+            manager.save(task)
+
+            result = runner.invoke(main, ["captain-status", task.task_id])
+            assert result.exit_code == 1
+            assert "no longer running" in result.output
+
+    def test_captain_status_command(self, tmp_path):
+        runner = CliRunner()
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            result = runner.invoke(main, ["captain-status", "task-missing"])
+            assert result.exit_code == 1
+            assert "Task not found" in result.output
+
+            manager = TaskManager()
+            with patch("ai_squad.core.tasks.subprocess.Popen", return_value=Mock(pid=1)):
+                task = manager.submit_captain(9)
+            result = runner.invoke(main, ["captain-status", task.task_id])
+            assert result.exit_code == 0
+            assert "queued" in result.output
+            assert "#9" in result.output
@@ -0,0 +1,34 @@
+"""
+Tests for the on-disk TTL cache.
+"""
+from ai_squad.core.ttl_cache import ttl_get
+
+
+class TestTtlCache:
+    """TTL cache tests"""
+
+    def test_fresh_entry_is_reused(self, tmp_path):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return {"all_passed": True}
+
+        assert ttl_get("k", 60, loader, directory=tmp_path) == {"all_passed": True}
+        assert ttl_get("k", 60, loader, directory=tmp_path) == {"all_passed": True}
+        assert len(calls) == 1
+
+    def test_expired_entry_is_reloaded(self, tmp_path):
+        values = iter([1, 2])
+        assert ttl_get("k", 60, lambda: next(values), directory=tmp_path) == 1
+        assert ttl_get("k", 0, lambda: next(values), directory=tmp_path) == 2
+
+    def test_cache_if_skips_store(self, tmp_path):
+        ttl_get("k", 60, lambda: 1, cache_if=lambda v: v == 0, directory=tmp_path)
+        assert not (tmp_path / "k.json").exists()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_corrupt_entry_is_ignored(self, tmp_path):
+        (tmp_path / "k.json").write_text("not json", encoding="utf-8")
+        assert ttl_get("k", 60, lambda: "fresh", directory=tmp_path) == "fresh"
+        assert ttl_get("k", 60, lambda: "other", directory=tmp_path) == "fresh"
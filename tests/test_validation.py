@@ -10,6 +10,7 @@ import shutil
 from ai_squad.core.validation import (
     PrerequisiteValidator,
     validate_agent_execution,
+    validate_agent_execution_bulk,
     AgentType,
     PrerequisiteType,
     PrerequisiteError,
@@ -134,6 +135,14 @@ class TestPrerequisiteValidator:
         rev_idx = order.index(AgentType.REVIEWER)
         assert rev_idx > eng_idx
 
+    def test_dependency_levels(self, temp_workspace):
+        """Architect and UX share a level; engineer and reviewer follow"""
+        levels = PrerequisiteValidator(temp_workspace).dependency_levels()
+        assert levels[AgentType.PM] == 0
+        assert levels[AgentType.ARCHITECT] == levels[AgentType.UX] == 1
+        assert levels[AgentType.ENGINEER] == 2
+        assert levels[AgentType.REVIEWER] == 3
+
     def test_get_ready_agents_pm_first(self, temp_workspace):
         """Only PM should be ready initially"""
         validator = PrerequisiteValidator(temp_workspace)
@@ -178,6 +187,26 @@ class TestPrerequisiteValidator:
                 issue_number=123
             )
 
+    def test_bulk_validation_matches_single(self, workspace_with_adr):
+        """Bulk validation should agree with per-issue validation"""
+        results = validate_agent_execution_bulk(
+            "engineer", [123, 456], workspace_root=workspace_with_adr
+        )
+        assert results[123].valid
+        assert not results[456].valid
+        assert [p.type for p in results[456].missing_prerequisites] == [
+            PrerequisiteType.PRD, PrerequisiteType.ADR
+        ]
+        single = validate_agent_execution(
+            "engineer", issue_number=456, workspace_root=workspace_with_adr, strict=False
+        )
+        assert results[456].error_message == single.error_message
+
+    def test_bulk_validation_invalid_agent(self):
+        """Bulk validation should reject unknown agent types"""
+        with pytest.raises(ValueError, match="Invalid agent type"):
+            validate_agent_execution_bulk("invalid_agent", [123])
+
     def test_error_message_contains_resolution_hint(self, temp_workspace):
         """PrerequisiteError should include resolution hint"""
         validator = PrerequisiteValidator(temp_workspace)
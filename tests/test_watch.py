@@ -5,7 +5,12 @@ Tests for watch mode functionality
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
-from ai_squad.core.watch import WatchDaemon, WatchConfig
+from ai_squad.core.watch import (
+    WatchDaemon,
+    WatchConfig,
+    ValidatedWatchConfig,
+    WatchConfigError,
+)
 from ai_squad.core.config import Config
 
 
@@ -28,6 +33,40 @@ class TestWatchConfig:
         assert WatchConfig.validate_interval(1000) == WatchConfig.MAX_INTERVAL
 
 
+class TestValidatedWatchConfig:
+    """Test validated watch configuration"""
+    
+    def test_repo_from_config(self):
+        config = Config({"project": {"github_repo": "owner/repo"}})
+        validated = ValidatedWatchConfig.from_config(config, interval=5)
+        
+        assert validated.config is config
+        assert validated.repo == "owner/repo"
+        assert validated.interval == WatchConfig.MIN_INTERVAL
+    
+    def test_repo_override(self):
+        config = Config({"project": {"github_repo": "owner/repo"}})
+        validated = ValidatedWatchConfig.from_config(config, repo="other/repo")
+        assert validated.repo == "other/repo"
+    
+    def test_missing_repo_raises(self):
+        config = Config({"project": {}})
+        with pytest.raises(WatchConfigError):
+            ValidatedWatchConfig.from_config(config)
+    
+    def test_daemon_reuses_loaded_config(self):
+        config = Mock(spec=Config)
+        config.github_repo = "owner/repo"
+        validated = ValidatedWatchConfig.from_config(config, interval=60)
+        with patch('ai_squad.core.watch.GitHubTool'), \
+             patch('ai_squad.core.watch.AgentExecutor'):
+            daemon = WatchDaemon.from_validated(validated)
+        
+        assert daemon.config is config
+        assert daemon.interval == 60
+        assert daemon.repo == "owner/repo"
+
+
 class TestWatchDaemon:
     """Test watch daemon"""
     
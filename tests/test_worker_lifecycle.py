@@ -0,0 +1,43 @@
+"""
+Tests for worker lifecycle tracking
+"""
+from unittest.mock import patch
+
+import pytest
+
+from ai_squad.core.worker_lifecycle import WorkerLifecycleManager
+
+
+class TestWorkerSession:
+    """session() context manager tests"""
+
+    def test_session_writes_once_on_success(self, tmp_path):
+        manager = WorkerLifecycleManager(workspace_root=tmp_path)
+        with patch.object(manager, "_save", wraps=manager._save) as save:
+            with manager.session("engineer", issue_number=3) as worker:
+                assert manager.list() == []
+
+        save.assert_called_once()
+        stored = manager.list()
+        assert [w.id for w in stored] == [worker.id]
+        assert stored[0].status == "completed"
+        assert stored[0].completed_at
+
+    def test_session_records_mark_failed(self, tmp_path):
+        manager = WorkerLifecycleManager(workspace_root=tmp_path)
+        with manager.session("engineer", issue_number=3) as worker:
+            worker.mark_failed("boom")
+
+        stored = manager.list(status="failed")
+        assert len(stored) == 1
+        assert stored[0].error == "boom"
+
+    def test_session_marks_failed_on_exception(self, tmp_path):
+        manager = WorkerLifecycleManager(workspace_root=tmp_path)
+        with pytest.raises(RuntimeError):
+            with manager.session("engineer", issue_number=3):
+                raise RuntimeError("crashed")
+
+        stored = manager.list()
+        assert stored[0].status == "failed"
+        assert stored[0].error == "crashed"